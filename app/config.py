@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -8,6 +8,94 @@ class Settings(BaseSettings):
     debug: bool = False
     port: int = 8000
     host: str = "0.0.0.0"
+
+    # Multi-process serving: >1 starts workers behind a sticky-session proxy
+    workers: int = 1
+    worker_port_base: int = 8101
+
+    # In-memory cache used by DataService
+    cache_max_entries: int = 1024
+    cache_max_bytes: Optional[int] = None
+    cache_default_ttl: float = 300.0
+    cache_sweep_interval: float = 60.0
+
+    # Shared outbound HTTP connection pool
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_per_host_limit: Optional[int] = 10
+    http2: bool = False
+    http_timeout: float = 10.0
+    external_api_url: str = "https://httpbin.org/json"
+
+    # External API resilience: jittered retries within a deadline, per-host circuit breakers
+    api_retry_attempts: int = 3
+    api_retry_base_delay: float = 0.2
+    api_retry_max_delay: float = 2.0
+    api_retry_deadline: float = 4.0
+    api_breaker_failure_threshold: int = 5
+    api_breaker_recovery_timeout: float = 30.0
+
+    # Shared cache of external JSON responses (honors Cache-Control/ETag)
+    api_cache_max_entries: int = 256
+    api_cache_max_bytes: int = 5_000_000
+    api_cache_default_ttl: float = 0.0
+    api_cache_revalidate_window: float = 300.0
+
+    # Background dependency checks served by /ready
+    health_check_interval: float = 30.0
+    health_check_timeout: float = 5.0
+    health_check_initial_delay: float = 5.0
+    health_resource_interval: float = 10.0
+    health_max_rss_mb: int = 450
+    health_min_disk_free_mb: int = 100
+
+    # Cold start (fly.toml scales to zero): seconds from process start to the first page, checked by tests
+    cold_start_budget: float = 3.0
+
+    # Live chart: generated points and the cap on points sent to the browser
+    chart_sample_points: int = 10
+    chart_max_points: int = 500
+    chart_downsample_method: str = "lttb"
+    # Largest series /api/chart/sample will generate (streamed, never buffered whole)
+    chart_api_max_points: int = 100_000
+
+    # Index stat cards: one shared ticker whose interval stretches with the viewer count
+    dashboard_min_interval: float = 1.0
+    dashboard_max_interval: float = 10.0
+    dashboard_fanout_per_second: float = 200.0
+    
+    # Browser-side event batching: name input debounce and counter click window (seconds)
+    name_input_debounce: float = 0.4
+    counter_batch_window: float = 0.3
+    
+    # Toasts: per-client token bucket, duplicate coalescing window and shared history size
+    notify_rate: float = 1.0
+    notify_burst: int = 3
+    notify_coalesce_window: float = 2.0
+    notify_history_size: int = 200
+    
+    # Per-session UI state ("memory" or "sqlite" for multi-process deployments)
+    state_backend: str = "memory"
+    state_db_path: str = "state.db"
+    state_idle_timeout: float = 3600.0
+    storage_secret: Optional[str] = None
+
+    # User profiles ("memory" or "sqlite"); sqlite writes are batched behind a queue
+    user_backend: str = "memory"
+    user_db_path: str = "users.db"
+    user_flush_interval: float = 1.0
+    user_flush_batch_size: int = 500
+
+    # Uploads are streamed; the widget and server share one size limit (capped by FileUpload)
+    upload_max_bytes: int = 10_000_000
+    upload_allowed_extensions: List[str] = [".txt", ".json", ".csv"]
+    upload_preview_rows: int = 5
+    ingest_batch_rows: int = 20000
+    
+    # Static assets: minified, fingerprinted and precompressed (python -m core.assets)
+    asset_source_dir: str = "static"
+    asset_build_dir: str = "static/dist"
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,73 @@
+"""Live Plotly chart that ships its layout once and streams data updates"""
+import copy
+from typing import Any, Dict, Optional, Sequence
+
+from nicegui import ui
+
+from core.serialization import dumps
+from core.series import as_list
+
+
+_LAYOUT: Dict[str, Any] = {
+    'title': {'text': 'Live Data Chart'},
+    'xaxis': {'title': {'text': 'Time'}},
+    'yaxis': {'title': {'text': 'Value'}},
+    'height': 250,
+    'margin': {'l': 40, 'r': 40, 't': 40, 'b': 40},
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+}
+_CONFIG: Dict[str, Any] = {'responsive': True, 'displaylogo': False}
+
+
+def chart_layout() -> Dict[str, Any]:
+    """Static chart layout; every figure gets its own copy, so changes to one never reach another client's"""
+    return copy.deepcopy(_LAYOUT)
+
+
+def chart_config() -> Dict[str, Any]:
+    """Static Plotly config, copied per figure like the layout"""
+    return copy.deepcopy(_CONFIG)
+
+
+def _trace(x: Sequence[float], y: Sequence[float]) -> Dict[str, Any]:
+    return {
+        'type': 'scatter',
+        'x': as_list(x),
+        'y': as_list(y),
+        'mode': 'lines+markers',
+        'name': 'Sample Data',
+        'line': {'color': '#667eea', 'width': 3},
+        'marker': {'size': 8},
+    }
+
+
+class LiveChart:
+    """Native `ui.plotly` chart updated with data-only deltas.
+
+    The full figure (layout, config and first data set) is sent when the
+    element is created. Later updates call `Plotly.restyle` in the browser
+    with just the new `x`/`y` arrays instead of re-sending the figure.
+    """
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], title: Optional[str] = None):
+        layout = chart_layout()
+        if title is not None:
+            layout['title'] = {'text': title}
+        self.plot = ui.plotly({
+            'data': [_trace(x, y)],
+            'layout': layout,
+            'config': chart_config(),
+        })
+
+    def set_data(self, x: Sequence[float], y: Sequence[float]) -> None:
+        """Replace the plotted series, sending only the new arrays"""
+        x, y = as_list(x), as_list(y)
+
+        # Keep the server-side figure current so a full re-render stays correct
+        trace = self.plot.figure['data'][0]
+        trace['x'] = x
+        trace['y'] = y
+
+        payload = dumps({'x': [x], 'y': [y]}).decode()
+        self.plot.client.run_javascript(f'Plotly.restyle("c{self.plot.id}", {payload}, [0])')
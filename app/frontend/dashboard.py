@@ -0,0 +1,34 @@
+"""Index-page stat cards fed by the shared dashboard broadcaster"""
+from typing import Any, Dict, Sequence, Tuple
+
+from nicegui import ui
+
+from core.broadcast import Broadcaster
+
+
+class StatCards:
+    """Row of stat cards whose values come from a `Broadcaster`.
+
+    The cards hold no timer of their own: the broadcaster computes the values
+    once per tick for every viewer and each card only receives values that
+    changed. The subscription ends once the page's elements are deleted.
+    """
+
+    def __init__(self, broadcaster: Broadcaster, cards: Sequence[Tuple[str, str]]):
+        self.values: Dict[str, ui.label] = {}
+        with ui.row().classes('w-full gap-4 mb-6') as self.row:
+            for key, title in cards:
+                with ui.card().classes('stat-card flex-1'):
+                    self.values[key] = ui.label(broadcaster.snapshot.get(key, '–')).classes('metric-value')
+                    ui.label(title).classes('metric-label')
+        self._unsubscribe = broadcaster.subscribe(self.apply)
+
+    def apply(self, changed: Dict[str, Any]) -> None:
+        """Set the labels whose values changed"""
+        if self.row.is_deleted:
+            self._unsubscribe()
+            return
+        for key, value in changed.items():
+            label = self.values.get(key)
+            if label is not None:
+                label.text = str(value)
@@ -0,0 +1,88 @@
+"""Browser-side batching of high-frequency UI events"""
+import json
+import logging
+from typing import Any, Callable
+
+from nicegui import ui
+
+from core.metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+ui_event_batches = REGISTRY.counter(
+    'ui_event_batches_total', 'Batched UI events delivered to server handlers', ['event']
+)
+ui_events_coalesced = REGISTRY.counter(
+    'ui_events_coalesced_total', 'Browser events folded into those batches', ['event']
+)
+
+# Sums deltas per event name and emits one `{delta, count}` message per window.
+# The window starts at the first click, so a steady stream still flushes on time.
+_ACCUMULATE_JS = '''() => {{
+    const batches = window.__deltaBatches || (window.__deltaBatches = {{}});
+    const batch = batches[{event}] || (batches[{event}] = {{delta: 0, count: 0, timer: null}});
+    batch.delta += {delta};
+    batch.count += 1;
+    if (batch.timer === null) {{
+        batch.timer = setTimeout(() => {{
+            emitEvent({event}, {{delta: batch.delta, count: batch.count}});
+            batch.delta = 0;
+            batch.count = 0;
+            batch.timer = null;
+        }}, {window_ms});
+    }}
+}}'''
+
+_DISCARD_JS = '''() => {{
+    const batch = (window.__deltaBatches || {{}})[{event}];
+    if (batch) {{
+        clearTimeout(batch.timer);
+        batch.delta = 0;
+        batch.count = 0;
+        batch.timer = null;
+    }}
+}}'''
+
+
+class DeltaBatcher:
+    """Coalesces clicks on bound buttons into one numeric delta per window.
+
+    Clicks are summed in the browser, so a burst of N clicks costs one
+    websocket message and one `handler(delta)` call instead of N. Must be
+    created inside a page, since the batch event is scoped to that client.
+
+    Batches come from the browser, so they are not trusted: the count is at
+    least 1 and the delta is clamped to what that many clicks on the bound
+    buttons could add up to.
+    """
+
+    def __init__(self, event: str, handler: Callable[[int], Any], window: float = 0.3):
+        self.event = event
+        self.window = window
+        self._handler = handler
+        self._max_step = 0
+        ui.on(event, self._deliver)
+
+    def _deliver(self, e) -> Any:
+        try:
+            count = max(1, int(e.args.get('count', 1)))
+            delta = int(e.args['delta'])
+        except (AttributeError, KeyError, TypeError, ValueError, OverflowError):
+            logger.warning(f"Dropped malformed {self.event} batch: {e.args!r:.200}")
+            return None
+        limit = count * self._max_step
+        ui_event_batches.inc(event=self.event)
+        ui_events_coalesced.inc(count, event=self.event)
+        return self._handler(max(-limit, min(delta, limit)))
+
+    def bind(self, button: ui.button, delta: int) -> ui.button:
+        """Add `delta` to the pending batch on every click of `button`"""
+        self._max_step = max(self._max_step, abs(int(delta)))
+        return button.on('click', js_handler=_ACCUMULATE_JS.format(
+            event=json.dumps(self.event), delta=int(delta), window_ms=int(self.window * 1000),
+        ))
+
+    def discard_on(self, button: ui.button) -> ui.button:
+        """Drop the pending batch when `button` is clicked (e.g. a reset)"""
+        return button.on('click', js_handler=_DISCARD_JS.format(event=json.dumps(self.event)))
@@ -0,0 +1,47 @@
+"""Static page fragments rendered to markup once and shared by every client"""
+import functools
+import html
+from typing import Callable, Iterable, Optional
+
+from nicegui import ui
+
+
+def tag(name: str, *children: str, classes: str = '', style: Optional[str] = None) -> str:
+    """Markup for an element; children must already be markup"""
+    attributes = f' class="{html.escape(classes)}"' if classes else ''
+    if style:
+        attributes += f' style="{html.escape(style)}"'
+    return f'<{name}{attributes}>{"".join(children)}</{name}>'
+
+
+def text(content: str, classes: str = '') -> str:
+    """Escaped text in a div, like `ui.label`"""
+    return tag('div', html.escape(content), classes=classes)
+
+
+def card(*children: str, classes: str = '') -> str:
+    """Markup matching `ui.card()` (Quasar's q-card with NiceGUI's padding)"""
+    return tag('div', *children, classes=f'q-card nicegui-card {classes}'.strip())
+
+
+def grid(columns: int, children: Iterable[str], classes: str = '') -> str:
+    """Markup matching `ui.grid(columns=...)`"""
+    return tag('div', *children, classes=f'nicegui-grid {classes}'.strip(),
+               style=f'grid-template-columns: repeat({columns}, minmax(0, 1fr))')
+
+
+def static_fragment(build: Callable[[], str]) -> Callable[[], ui.html]:
+    """Turn a markup builder into a placer that adds it as one `ui.html` element.
+
+    `build` runs on first use only; afterwards every client gets the same
+    cached string instead of constructing the subtree element by element.
+    Use it for content without event handlers or per-client values.
+    """
+    markup = functools.lru_cache(maxsize=1)(build)
+
+    @functools.wraps(build)
+    def place() -> ui.html:
+        return ui.html(markup())
+
+    place.markup = markup
+    return place
@@ -1,121 +1,200 @@
-from nicegui import ui, app
+from nicegui import Client, ui, app, run
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
+from collections import deque
 from typing import Dict, Any
 import asyncio
-import httpx
-import plotly.graph_objects as go
-from datetime import datetime
-import random
-
-# Add custom CSS for modern styling
-ui.add_head_html('''
-<style>
-    .hero-section {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 2rem;
-        border-radius: 12px;
-        margin-bottom: 2rem;
-    }
-    
-    .feature-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-        border: 1px solid #e2e8f0;
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.15);
-    }
-    
-    .stat-card {
-        background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        text-align: center;
-    }
-    
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        opacity: 0.9;
-    }
-    
-    .demo-container {
-        background: #f8fafc;
-        padding: 2rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-    }
-    
-    .success-message {
-        background: #10b981;
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    
-    .error-message {
-        background: #ef4444;
-        color: white;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-</style>
-''')
+import html
+
+from app.config import settings
+from app.frontend.charts import LiveChart
+from app.frontend.dashboard import StatCards
+from app.frontend.events import DeltaBatcher
+from app.frontend.shell import card, grid, static_fragment, text
+from core.assets import BUNDLES, IMMUTABLE, AssetStore, build_assets
+from core.broadcast import Broadcaster
+from core.metrics import CONTENT_TYPE, REGISTRY
+from core.serialization import FastJSONResponse, iter_chart_json, preview
+from services.business import (
+    ApiService, api_response_cache, data_service, health_service, http_pool, state_store, user_service,
+)
+from services.ingest import DatasetIngestor
+from services.notifications import NotificationService
+from services.uploads import UploadRejected, inspect_upload
 
-# Global state for demo data
+# Page CSS and JS under static/ are served as fingerprinted, precompressed bundles (core.assets.BUNDLES)
+assets = AssetStore(settings.asset_build_dir)
+
+
+def link_assets():
+    """Link the bundles built into the image (python -m core.assets); build them only if that step was skipped"""
+    if not set(BUNDLES) <= assets.load().manifest.keys():
+        assets.load(build_assets(settings.asset_source_dir, settings.asset_build_dir))
+    ui.add_head_html(assets.head_html(BUNDLES), shared=True)
+
+
+# App-wide demo data; per-visitor state lives in state_store
 demo_state = {
-    'counter': 0,
-    'user_name': '',
-    'selected_theme': 'blue',
     'chart_data': [],
     'api_status': 'Ready',
-    'notifications': []
+    'notifications': deque(maxlen=settings.notify_history_size),
 }
 
+# Dataset parsing runs on NiceGUI's thread and process pools
+dataset_ingestor = DatasetIngestor(
+    io_bound=run.io_bound,
+    cpu_bound=run.cpu_bound,
+    batch_rows=settings.ingest_batch_rows,
+    max_points=settings.chart_max_points,
+    method=settings.chart_downsample_method,
+)
+
+# Hot-path instrumentation, scraped from /metrics
+page_render_seconds = REGISTRY.histogram('page_render_seconds', 'Server-side page build time in seconds', ['page'])
+chart_update_seconds = REGISTRY.histogram('chart_update_seconds', 'Live chart regeneration time in seconds')
+
+
+def connected_clients() -> int:
+    """NiceGUI clients with an open socket connection"""
+    return sum(client.has_socket_connection for client in Client.instances.values())
+
+
+REGISTRY.gauge('nicegui_connected_clients', 'NiceGUI clients with an open socket', function=connected_clients)
+
+
+def format_uptime(seconds: float) -> str:
+    """Compact uptime such as '3d 4h', '2h 15m' or '42s'"""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f'{days}d {hours}h'
+    if hours:
+        return f'{hours}h {minutes}m'
+    return f'{minutes}m {secs}s' if minutes else f'{secs}s'
+
+
+def format_milliseconds(seconds) -> str:
+    return '–' if seconds is None else f'{seconds * 1000:.0f}ms'
+
+
+def dashboard_stats() -> Dict[str, str]:
+    """Stat card values, formatted once per tick for every viewer"""
+    return {
+        'users': f'{connected_clients():,}',
+        'uptime': format_uptime(health_service.get_health_status().uptime),
+        'response_time': format_milliseconds(page_render_seconds.quantile(0.5, page='index')),
+        'cache_hit_rate': f'{api_response_cache.hit_ratio():.0%}',
+    }
+
+
+dashboard = Broadcaster(
+    dashboard_stats,
+    min_interval=settings.dashboard_min_interval,
+    max_interval=settings.dashboard_max_interval,
+    fanout_per_second=settings.dashboard_fanout_per_second,
+)
+REGISTRY.gauge('dashboard_subscribers', 'Clients subscribed to the stat card ticker', function=dashboard.__len__)
+
+def show_toast(client_id: str, message: str, type: str):
+    client = Client.instances.get(client_id)
+    if client is not None and client.has_socket_connection:
+        with client:
+            ui.notify(message, type=type)
+
+
+# Every toast goes through here; the history ring buffer is demo_state['notifications']
+notifications = NotificationService(
+    show_toast,
+    history=demo_state['notifications'],
+    rate=settings.notify_rate,
+    burst=settings.notify_burst,
+    coalesce_window=settings.notify_coalesce_window,
+)
+app.on_disconnect(lambda client: notifications.forget(client.id))
+
+
+def notify(message: str, type: str = 'info'):
+    """Rate-limited, coalesced toast for the current client; silent while its first page renders"""
+    client = ui.context.client
+    notifications.notify(client.id, message, type, ready=client.has_socket_connection)
+
+
+# Service lifecycle
+app.on_startup(link_assets)
+app.on_startup(data_service.start)
+app.on_startup(http_pool.start)
+app.on_startup(state_store.start)
+app.on_startup(user_service.start)
+app.on_startup(health_service.start)
+app.on_startup(dashboard.start)
+app.on_shutdown(dashboard.stop)
+app.on_shutdown(health_service.stop)
+app.on_shutdown(data_service.stop)
+app.on_shutdown(http_pool.close)
+app.on_shutdown(state_store.stop)
+app.on_shutdown(user_service.stop)
+
+
+def current_session_id() -> str:
+    """Key for the current visitor's state (browser session, else client)"""
+    if settings.storage_secret:
+        return app.storage.browser['id']
+    return ui.context.client.id
+
+
+FEATURES = [
+    ('⚡', 'Real-time Updates', 'Live data synchronization and instant UI updates without page refreshes.'),
+    ('🎨', 'Modern UI Components', 'Beautiful, responsive components with smooth animations and interactions.'),
+    ('🐍', 'Python Native', 'Build full-stack applications using only Python - no JavaScript required.'),
+    ('🚀', 'Easy Deployment', 'Deploy to cloud platforms with minimal configuration and setup.'),
+    ('📊', 'Data Integration', 'Seamless integration with databases, APIs, and data processing libraries.'),
+    ('📱', 'Responsive Design', 'Mobile-first design that works perfectly on all devices and screen sizes.'),
+]
+
+
+# Static page shell: built to markup once, then shared by every visitor
+@static_fragment
+def hero_text() -> str:
+    return (text('🚀 NiceGUI Interactive Showcase', 'text-4xl font-bold mb-4')
+            + text('Explore modern Python web applications with real-time interactivity', 'text-xl opacity-90'))
+
+
+@static_fragment
+def feature_grid() -> str:
+    return text('✨ Key Features', 'text-2xl font-bold mt-8 mb-4') + grid(3, [
+        card(
+            text(icon, 'text-4xl mb-2'),
+            text(title, 'text-lg font-semibold mb-2'),
+            text(description, 'text-gray-600'),
+            classes='feature-card',
+        )
+        for icon, title, description in FEATURES
+    ], classes='w-full gap-4')
+
 
 @ui.page('/')
+@page_render_seconds.time(page='index')
 async def index():
     """Main showcase page with interactive components"""
+    session_id = current_session_id()
+    state = await state_store.get(session_id)
     
     # Hero Section
     with ui.card().classes('hero-section w-full'):
-        ui.label('🚀 NiceGUI Interactive Showcase').classes('text-4xl font-bold mb-4')
-        ui.label('Explore modern Python web applications with real-time interactivity').classes('text-xl opacity-90')
+        hero_text()
         
         with ui.row().classes('mt-6 gap-4'):
-            ui.button('Get Started', on_click=lambda: ui.notify('Welcome to the showcase!', type='positive')).props('color=white text-color=primary size=lg')
+            ui.button('Get Started', on_click=lambda: notify('Welcome to the showcase!', type='positive')).props('color=white text-color=primary size=lg')
             ui.button('View Features', on_click=lambda: ui.navigate.to('/features')).props('color=white text-color=primary outline size=lg')
 
-    # Quick Stats Dashboard
-    with ui.row().classes('w-full gap-4 mb-6'):
-        with ui.card().classes('stat-card flex-1'):
-            ui.label('1,234').classes('metric-value')
-            ui.label('Active Users').classes('metric-label')
-        
-        with ui.card().classes('stat-card flex-1'):
-            ui.label('98.5%').classes('metric-value')
-            ui.label('Uptime').classes('metric-label')
-        
-        with ui.card().classes('stat-card flex-1'):
-            ui.label('42ms').classes('metric-value')
-            ui.label('Response Time').classes('metric-label')
-        
-        with ui.card().classes('stat-card flex-1'):
-            ui.label('5.0★').classes('metric-value')
-            ui.label('User Rating').classes('metric-label')
+    # Quick Stats Dashboard, pushed by the shared ticker
+    StatCards(dashboard, [
+        ('users', 'Active Users'),
+        ('uptime', 'Uptime'),
+        ('response_time', 'Response Time'),
+        ('cache_hit_rate', 'API Cache Hit Rate'),
+    ])
 
     # Interactive Demo Section
     with ui.card().classes('demo-container w-full'):
@@ -126,77 +205,49 @@ async def index():
             with ui.column().classes('flex-1'):
                 ui.label('User Controls').classes('text-lg font-semibold mb-3')
                 
-                name_input = ui.input('Your Name', value=demo_state['user_name']).classes('w-full')
-                name_input.on('input', lambda e: update_user_name(e.value))
+                # Quasar debounces the model update, so a typed name is one event, not one per key
+                ui.input(
+                    'Your Name', value=state.user_name,
+                    on_change=lambda e: update_user_name(session_id, e.value),
+                ).classes('w-full').props(f'debounce={int(settings.name_input_debounce * 1000)}')
                 
                 ui.separator()
                 
                 ui.label('Counter Demo').classes('text-md font-semibold mt-4 mb-2')
-                counter_display = ui.label(f'Count: {demo_state["counter"]}').classes('text-xl font-bold text-blue-600')
+                counter_display = ui.label(f'Count: {state.counter}').classes('text-xl font-bold text-blue-600')
                 
+                # Clicks are summed in the browser and applied as one delta per window
+                counter_clicks = DeltaBatcher(
+                    'counterDelta', lambda delta: apply_counter_delta(session_id, counter_display, delta),
+                    window=settings.counter_batch_window,
+                )
                 with ui.row().classes('gap-2'):
-                    ui.button('➕', on_click=lambda: increment_counter(counter_display)).props('color=positive')
-                    ui.button('➖', on_click=lambda: decrement_counter(counter_display)).props('color=negative')
-                    ui.button('🔄', on_click=lambda: reset_counter(counter_display)).props('color=warning')
+                    counter_clicks.bind(ui.button('➕').props('color=positive'), 1)
+                    counter_clicks.bind(ui.button('➖').props('color=negative'), -1)
+                    counter_clicks.discard_on(
+                        ui.button('🔄', on_click=lambda: reset_counter(session_id, counter_display)).props('color=warning')
+                    )
                 
                 ui.separator()
                 
                 ui.label('Theme Selector').classes('text-md font-semibold mt-4 mb-2')
-                theme_select = ui.select(['blue', 'green', 'purple', 'orange'], value=demo_state['selected_theme'])
-                theme_select.on('update:model-value', lambda e: update_theme(e.value))
+                theme_select = ui.select(['blue', 'green', 'purple', 'orange'], value=state.selected_theme)
+                theme_select.on('update:model-value', lambda e: update_theme(session_id, e.value))
             
             # Right Column - Live Chart
             with ui.column().classes('flex-1'):
                 ui.label('📊 Live Data Visualization').classes('text-lg font-semibold mb-3')
-                chart_container = ui.html().classes('w-full h-64')
-                
-                ui.button('📈 Generate New Data', on_click=lambda: update_chart(chart_container)).props('color=primary')
+                chart = LiveChart(*await generate_chart_series())
+                chart.plot.classes('w-full h-64')
                 
-                # Initialize chart
-                await update_chart(chart_container)
+                ui.button('📈 Generate New Data', on_click=lambda: update_chart(chart)).props('color=primary')
 
     # Feature Grid
-    ui.label('✨ Key Features').classes('text-2xl font-bold mt-8 mb-4')
-    
-    with ui.grid(columns=3).classes('w-full gap-4'):
-        # Real-time Updates
-        with ui.card().classes('feature-card'):
-            ui.label('⚡').classes('text-4xl mb-2')
-            ui.label('Real-time Updates').classes('text-lg font-semibold mb-2')
-            ui.label('Live data synchronization and instant UI updates without page refreshes.').classes('text-gray-600')
-        
-        # Modern UI Components
-        with ui.card().classes('feature-card'):
-            ui.label('🎨').classes('text-4xl mb-2')
-            ui.label('Modern UI Components').classes('text-lg font-semibold mb-2')
-            ui.label('Beautiful, responsive components with smooth animations and interactions.').classes('text-gray-600')
-        
-        # Python Native
-        with ui.card().classes('feature-card'):
-            ui.label('🐍').classes('text-4xl mb-2')
-            ui.label('Python Native').classes('text-lg font-semibold mb-2')
-            ui.label('Build full-stack applications using only Python - no JavaScript required.').classes('text-gray-600')
-        
-        # Easy Deployment
-        with ui.card().classes('feature-card'):
-            ui.label('🚀').classes('text-4xl mb-2')
-            ui.label('Easy Deployment').classes('text-lg font-semibold mb-2')
-            ui.label('Deploy to cloud platforms with minimal configuration and setup.').classes('text-gray-600')
-        
-        # Data Integration
-        with ui.card().classes('feature-card'):
-            ui.label('📊').classes('text-4xl mb-2')
-            ui.label('Data Integration').classes('text-lg font-semibold mb-2')
-            ui.label('Seamless integration with databases, APIs, and data processing libraries.').classes('text-gray-600')
-        
-        # Responsive Design
-        with ui.card().classes('feature-card'):
-            ui.label('📱').classes('text-4xl mb-2')
-            ui.label('Responsive Design').classes('text-lg font-semibold mb-2')
-            ui.label('Mobile-first design that works perfectly on all devices and screen sizes.').classes('text-gray-600')
+    feature_grid().classes('w-full')
 
 
 @ui.page('/features')
+@page_render_seconds.time(page='features')
 async def features_page():
     """Detailed features demonstration page"""
     
@@ -214,22 +265,22 @@ async def features_page():
             
             async def test_api():
                 api_status.text = 'Status: Loading...'
-                try:
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get('https://httpbin.org/json', timeout=5.0)
-                        data = response.json()
-                        api_status.text = 'Status: ✅ Success'
-                        api_result.content = f'''
-                        <div class="success-message">
-                            <strong>API Response:</strong><br>
-                            <pre>{str(data)[:200]}...</pre>
-                        </div>
-                        '''
-                except Exception as e:
+                # Goes through ApiService for retries and the per-host circuit breaker
+                async with ApiService(http_pool) as api_service:
+                    result = await api_service.fetch_external_data(settings.external_api_url)
+                if result.success:
+                    api_status.text = 'Status: ✅ Success'
+                    api_result.content = f'''
+                    <div class="success-message">
+                        <strong>API Response:</strong><br>
+                        <pre>{html.escape(preview(result.data, 200))}</pre>
+                    </div>
+                    '''
+                else:
                     api_status.text = 'Status: ❌ Error'
                     api_result.content = f'''
                     <div class="error-message">
-                        <strong>Error:</strong> {str(e)}
+                        <strong>Error:</strong> {result.message}
                     </div>
                     '''
             
@@ -275,83 +326,156 @@ async def features_page():
             
             upload_result = ui.html()
             
-            def handle_upload(e):
+            async def handle_upload(e):
+                # Stream through the spooled upload instead of reading it into memory
+                try:
+                    summary = await run.io_bound(
+                        inspect_upload, e.content, e.name, e.type,
+                        max_bytes=settings.upload_max_bytes,
+                        allowed_extensions=settings.upload_allowed_extensions,
+                        preview_rows=settings.upload_preview_rows,
+                    )
+                except UploadRejected as error:
+                    upload_result.content = f'''
+                    <div class="error-message">
+                        <strong>Upload rejected:</strong> {html.escape(str(error))}
+                    </div>
+                    '''
+                    return
+                
+                preview = '<br>'.join(html.escape(str(row)[:120]) for row in summary.preview)
+                columns = html.escape(', '.join(summary.columns)) if summary.columns else '-'
                 upload_result.content = f'''
                 <div class="success-message">
-                    <strong>File uploaded:</strong> {e.name}<br>
-                    <strong>Size:</strong> {len(e.content)} bytes<br>
-                    <strong>Type:</strong> {e.type}
+                    <strong>File uploaded:</strong> {html.escape(summary.upload.filename)}<br>
+                    <strong>Size:</strong> {summary.upload.size} bytes<br>
+                    <strong>Type:</strong> {html.escape(summary.upload.content_type)}<br>
+                    <strong>Rows:</strong> {summary.rows}<br>
+                    <strong>Columns:</strong> {columns}<br>
+                    <strong>Preview:</strong><br><code>{preview}</code>
                 </div>
                 '''
+                
+                if summary.kind in ('csv', 'json'):
+                    await chart_dataset(e.content, summary)
+            
+            async def chart_dataset(content, summary):
+                # Parse on the worker pools, pushing progress to this client
+                ingest_status.text = 'Parsing dataset...'
+                ingest_progress.value = 0
+                ingest_progress.visible = True
+                
+                def on_progress(progress):
+                    ingest_progress.value = progress.fraction
+                    ingest_status.text = f'Parsed {progress.rows:,} rows'
+                
+                try:
+                    result = await dataset_ingestor.ingest(
+                        content, summary.kind, on_progress=on_progress, title=summary.upload.filename
+                    )
+                except UploadRejected as error:
+                    ingest_status.text = f'Could not chart this file: {error}'
+                    return
+                finally:
+                    ingest_progress.visible = False
+                
+                ingest_status.text = (f'Charted {len(result.chart.values):,} of {len(result.data.values):,} points'
+                                      f' ({result.skipped:,} rows skipped)')
+                chart_area.clear()
+                with chart_area:
+                    LiveChart(result.chart.labels, result.chart.values, title=result.chart.title)
             
-            ui.upload(on_upload=handle_upload, max_file_size=1_000_000).props('accept=".txt,.json,.csv"')
+            ingest_status = ui.label().classes('text-sm text-gray-600')
+            ingest_progress = ui.linear_progress(value=0, show_value=False)
+            ingest_progress.visible = False
+            chart_area = ui.column().classes('w-full')
+            
+            ui.upload(
+                on_upload=handle_upload,
+                on_rejected=lambda: notify('File too large or not allowed', type='warning'),
+                max_file_size=settings.upload_max_bytes,
+            ).props(f'accept="{",".join(settings.upload_allowed_extensions)}"')
 
 
-@ui.page('/health')
-async def health_check():
+# Probes are plain FastAPI routes so they never allocate a NiceGUI client
+@app.get('/health')
+def health_check():
     """Health check endpoint for monitoring"""
-    return {'status': 'healthy', 'timestamp': datetime.now().isoformat()}
+    return FastJSONResponse(health_service.get_health_status())
+
+
+@app.get('/assets/{path:path}')
+def static_asset(path: str, request: Request):
+    """Fingerprinted asset, precompressed variant when the client accepts one"""
+    resolved = assets.resolve(path, request.headers.get('accept-encoding', ''))
+    if resolved is None:
+        return Response(status_code=404)
+    file, encoding, media_type = resolved
+    headers = {'Cache-Control': IMMUTABLE, 'Vary': 'Accept-Encoding'}
+    if encoding:
+        headers['Content-Encoding'] = encoding
+    return FileResponse(file, media_type=media_type, headers=headers)
+
+
+@app.get('/metrics')
+def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@app.get('/ready')
+def readiness_check():
+    """Readiness endpoint serving the last background dependency check"""
+    readiness = health_service.get_readiness()
+    return FastJSONResponse(readiness, status_code=200 if readiness['ready'] else 503)
+
+
+@app.get('/api/chart/sample')
+async def sample_chart_data(points: int = settings.chart_sample_points):
+    """Sample chart data as JSON, encoded a chunk of values at a time"""
+    data = await data_service.get_sample_data(max(1, min(points, settings.chart_api_max_points)))
+    return StreamingResponse(iter_chart_json(data), media_type='application/json')
 
 
 # Helper functions for interactivity
-def update_user_name(name: str):
-    demo_state['user_name'] = name
+async def update_user_name(session_id: str, name: str):
+    await state_store.set(session_id, user_name=name)
     if name:
-        ui.notify(f'Hello, {name}! 👋', type='positive')
+        notify(f'Hello, {name}! 👋', type='positive')
 
 
-def increment_counter(display):
-    demo_state['counter'] += 1
-    display.text = f'Count: {demo_state["counter"]}'
+async def apply_counter_delta(session_id: str, display, delta: int):
+    count = await state_store.increment(session_id, 'counter', delta)
+    display.text = f'Count: {count}'
 
 
-def decrement_counter(display):
-    demo_state['counter'] -= 1
-    display.text = f'Count: {demo_state["counter"]}'
+async def reset_counter(session_id: str, display):
+    await state_store.set(session_id, counter=0)
+    display.text = 'Count: 0'
+    notify('Counter reset! 🔄', type='info')
 
 
-def reset_counter(display):
-    demo_state['counter'] = 0
-    display.text = f'Count: {demo_state["counter"]}'
-    ui.notify('Counter reset! 🔄', type='info')
+async def update_theme(session_id: str, theme: str):
+    await state_store.set(session_id, selected_theme=theme)
+    notify(f'Theme changed to {theme}! 🎨', type='positive')
 
 
-def update_theme(theme: str):
-    demo_state['selected_theme'] = theme
-    ui.notify(f'Theme changed to {theme}! 🎨', type='positive')
+async def generate_chart_series():
+    """Generate sample x/y data for the live chart, capped at the configured resolution"""
+    data = await data_service.get_sample_data(settings.chart_sample_points)
+    x_data, reduced = data_service.downsample(
+        data, settings.chart_max_points, settings.chart_downsample_method
+    )
+    return x_data, reduced.values
 
 
-async def update_chart(container):
+@chart_update_seconds.time()
+async def update_chart(chart: LiveChart):
     """Generate and update the live chart"""
-    # Generate sample data
-    x_data = list(range(10))
-    y_data = [random.randint(10, 100) for _ in range(10)]
-    
-    # Create Plotly chart
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=x_data,
-        y=y_data,
-        mode='lines+markers',
-        name='Sample Data',
-        line=dict(color='#667eea', width=3),
-        marker=dict(size=8)
-    ))
-    
-    fig.update_layout(
-        title='Live Data Chart',
-        xaxis_title='Time',
-        yaxis_title='Value',
-        height=250,
-        margin=dict(l=40, r=40, t=40, b=40),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)'
-    )
-    
-    # Update the chart container
-    container.content = fig.to_html(include_plotlyjs='cdn', div_id='chart')
+    # Only the new data arrays are sent; the layout is already on the client
+    chart.set_data(*await generate_chart_series())
     
-    ui.notify('Chart updated! 📊', type='positive')
+    notify('Chart updated! 📊', type='positive')
 
 
 # Error handling for the application
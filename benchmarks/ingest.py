@@ -0,0 +1,90 @@
+"""Benchmark: where dataset ingestion converts its rows
+
+- process_batches: rows parsed on a thread, each batch pickled to a worker
+  process for float conversion (the previous DatasetIngestor)
+- thread: rows parsed and converted in the same thread hop (DatasetIngestor)
+- process_parse: the whole upload sent to a worker process and parsed there
+
+Usage:
+    python -m benchmarks.ingest --rows 500000
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict
+
+from services.ingest import DatasetIngestor, RowReader, choose_columns, convert_rows
+
+
+def csv_upload(rows: int) -> bytes:
+    rng = random.Random(1)
+    lines = [f"p{i},{rng.uniform(0, 100):.3f}\n" for i in range(rows)]
+    return ("label,value\n" + "".join(lines)).encode()
+
+
+async def process_batches(data: bytes, batch_rows: int, cpu_bound) -> int:
+    reader = await asyncio.to_thread(RowReader, io.BytesIO(data), "csv")
+    columns, rows = None, 0
+    while True:
+        batch = await asyncio.to_thread(reader.next_batch, batch_rows)
+        if not batch:
+            return rows
+        if columns is None:
+            columns = choose_columns(batch[0])
+        await cpu_bound(convert_rows, batch, *columns)
+        rows += len(batch)
+
+
+def parse_upload(data: bytes, batch_rows: int) -> int:
+    reader, rows = RowReader(io.BytesIO(data), "csv"), 0
+    while True:
+        count, _, _, _ = reader.next_values(batch_rows)
+        if not count:
+            return rows
+        rows += count
+
+
+async def best_of(fn: Callable[[], Awaitable[Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best, 3)
+
+
+async def run(rows: int, batch_rows: int, repeat: int) -> Dict[str, Any]:
+    data = csv_upload(rows)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        async def cpu_bound(func, *args):
+            return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+        await cpu_bound(len, b"")  # start the worker outside the timings
+        ingestor = DatasetIngestor(batch_rows=batch_rows)
+        return {
+            "rows": rows,
+            "seconds": {
+                "process_batches": await best_of(lambda: process_batches(data, batch_rows, cpu_bound), repeat),
+                "thread": await best_of(lambda: asyncio.to_thread(parse_upload, data, batch_rows), repeat),
+                "process_parse": await best_of(lambda: cpu_bound(parse_upload, data, batch_rows), repeat),
+                "ingest": await best_of(lambda: ingestor.ingest(io.BytesIO(data), "csv"), repeat),
+            },
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rows, args.batch_rows, args.repeat)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
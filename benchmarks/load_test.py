@@ -0,0 +1,363 @@
+"""Load test: simulated NiceGUI websocket clients against a local app instance
+
+Starts the app (and an offline stub for the external API) in subprocesses,
+then drives N simulated browsers that render `/`, open the socket.io
+connection and click the counter and chart buttons. Results are appended to
+a JSON-lines history file so runs can be compared between commits.
+
+Usage:
+    python -m benchmarks.load_test --clients 20 --duration 15
+    python -m benchmarks.load_test --workers 4 --compare
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import socketio
+
+from benchmarks.stub_server import StubServer
+
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_HISTORY = ROOT / "benchmarks" / "results" / "load_test.jsonl"
+SOCKET_PATH = "/_nicegui_ws/socket.io"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+    }
+
+
+def process_tree_rss_kb(pid: int) -> int:
+    """Resident memory of a process and its descendants (Linux /proc only)"""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+            for task in os.listdir(f"/proc/{current}/task"):
+                with open(f"/proc/{current}/task/{task}/children") as children:
+                    pending.extend(int(child) for child in children.read().split())
+        except (FileNotFoundError, ProcessLookupError, PermissionError):
+            continue
+    return total
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_page(html: str) -> Tuple[str, Dict[str, Any]]:
+    """Extract the NiceGUI client id and element tree from a rendered page"""
+    client_id = re.search(r"'client_id': '([^']+)'", html).group(1)
+    raw = re.search(r"parseElements\(String\.raw`(.*?)`\)", html, re.S).group(1)
+    for entity, char in (("&#36;", "$"), ("&#96;", "`"), ("&gt;", ">"), ("&lt;", "<"), ("&amp;", "&")):
+        raw = raw.replace(entity, char)
+    return client_id, json.loads(raw)
+
+
+def find_element(elements: Dict[str, Any], text_prefix: str) -> str:
+    """Find the id of an element whose text starts with `text_prefix`"""
+    for element_id, element in elements.items():
+        if str(element.get("text", "")).startswith(text_prefix):
+            return element_id
+    raise LookupError(f"No element with text {text_prefix!r}")
+
+
+def find_event(elements: Dict[str, Any], event: str) -> Tuple[int, str]:
+    """Find the (element id, listener id) of a custom event such as one registered with `ui.on`"""
+    for element_id, element in elements.items():
+        for listener in element.get("events", []):
+            if listener["type"] == event:
+                return int(element_id), listener["listener_id"]
+    raise LookupError(f"No listener for event {event!r}")
+
+
+def find_listener(elements: Dict[str, Any], label: str, event: str = "click") -> Tuple[int, str]:
+    """Find the (element id, listener id) of a button by its label"""
+    for element_id, element in elements.items():
+        if element.get("props", {}).get("label") == label:
+            for listener in element.get("events", []):
+                if listener["type"] == event:
+                    return int(element_id), listener["listener_id"]
+    raise LookupError(f"No {event} listener for button {label!r}")
+
+
+class AppProcess:
+    """The app under test, running in a subprocess"""
+
+    def __init__(self, port: int, workers: int, env: Dict[str, str]):
+        self.port = port
+        self.workers = workers
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self, timeout: float = 60.0) -> None:
+        env = {**os.environ, **self.env, "HOST": "127.0.0.1", "PORT": str(self.port),
+               "WORKERS": str(self.workers), "WORKER_PORT_BASE": str(free_port() + 1000)}
+        self.process = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT, env=env,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + timeout
+        async with httpx.AsyncClient() as client:
+            while time.monotonic() < deadline:
+                try:
+                    if (await client.get(f"{self.base_url}/health")).status_code == 200:
+                        return
+                except httpx.HTTPError:
+                    pass
+                await asyncio.sleep(0.2)
+        raise RuntimeError("App did not become ready in time")
+
+    def rss_kb(self) -> int:
+        return process_tree_rss_kb(self.process.pid) if self.process else 0
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(15)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class SimulatedClient:
+    """One browser tab: renders the page, connects the websocket, clicks buttons"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.http = httpx.AsyncClient(base_url=base_url, timeout=30.0)
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.client_id = ""
+        self.elements: Dict[str, Any] = {}
+        self.messages = 0
+        self._responses: asyncio.Queue = asyncio.Queue()
+        for name in ("update", "run_javascript", "notify"):
+            self.sio.on(name, self._handler(name))
+
+    def _handler(self, name: str):
+        async def on_message(payload: Any = None) -> None:
+            self.messages += 1
+            self._responses.put_nowait((time.perf_counter(), name, payload))
+        return on_message
+
+    async def connect(self) -> float:
+        """Render `/` and open the socket; returns the page render time"""
+        start = time.perf_counter()
+        response = await self.http.get("/")
+        render_time = time.perf_counter() - start
+        response.raise_for_status()
+        self.client_id, self.elements = parse_page(response.text)
+
+        cookies = "; ".join(f"{name}={value}" for name, value in self.http.cookies.items())
+        await self.sio.connect(f"{self.base_url}?client_id={self.client_id}", socketio_path=SOCKET_PATH,
+                               transports=["websocket"], headers={"Cookie": cookies} if cookies else {})
+        await self.sio.call("handshake", {"client_id": self.client_id, "tab_id": str(uuid.uuid4())})
+        return render_time
+
+    async def click(self, target: Tuple[int, str], expect: Callable[[str, Any], bool],
+                    timeout: float = 10.0, args: Any = None) -> float:
+        """Fire a listener (a button click by default) and return the time until the expected server message"""
+        while not self._responses.empty():
+            self._responses.get_nowait()
+        element_id, listener_id = target
+        start = time.perf_counter()
+        await self.sio.emit("event", {"id": element_id, "client_id": self.client_id,
+                                      "listener_id": listener_id, "args": [json.dumps(args or {})]})
+
+        async def matching() -> float:
+            while True:
+                received, name, payload = await self._responses.get()
+                if received >= start and expect(name, payload):
+                    return received
+        return await asyncio.wait_for(matching(), timeout) - start
+
+    async def close(self) -> None:
+        await self.sio.disconnect()
+        await self.http.aclose()
+
+
+async def time_requests(base_url: str, path: str, count: int) -> List[float]:
+    samples = []
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get(path)
+            samples.append(time.perf_counter() - start)
+            response.raise_for_status()
+    return samples
+
+
+async def run(clients: int, duration: float, workers: int, probes: int) -> Dict[str, Any]:
+    stub = StubServer()
+    await stub.start()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = AppProcess(free_port(), workers, {
+            "EXTERNAL_API_URL": stub.url,
+            # Multiple workers switch both stores to sqlite; keep them out of the checkout
+            "STATE_DB_PATH": os.path.join(temp_dir, "state.db"),
+            "USER_DB_PATH": os.path.join(temp_dir, "users.db"),
+        })
+        await app.start()
+        try:
+            health = await time_requests(app.base_url, "/health", probes)
+            features = await time_requests(app.base_url, "/features", max(1, probes // 10))
+            rss_before = app.rss_kb()
+
+            sims = [SimulatedClient(app.base_url) for _ in range(clients)]
+            render = await asyncio.gather(*(sim.connect() for sim in sims))
+            rss_after = app.rss_kb()
+
+            counter_samples: List[float] = []
+            chart_samples: List[float] = []
+            errors = 0
+
+            async def drive(sim: SimulatedClient) -> None:
+                nonlocal errors
+                # ➕ clicks are summed in the browser and arrive as one counterDelta event per window;
+                # each simulated click here stands for one such batch of a single click
+                counter = find_event(sim.elements, "counterDelta")
+                chart = find_listener(sim.elements, "📈 Generate New Data")
+                count_label = find_element(sim.elements, "Count:")
+
+                def counter_updated(name: str, payload: Any) -> bool:
+                    return name == "update" and count_label in payload
+
+                def chart_updated(name: str, payload: Any) -> bool:
+                    return name == "run_javascript" and "Plotly.restyle" in payload.get("code", "")
+
+                deadline = time.monotonic() + duration
+                step = 0
+                while time.monotonic() < deadline:
+                    try:
+                        if step % 5 == 4:
+                            chart_samples.append(await sim.click(chart, chart_updated))
+                        else:
+                            counter_samples.append(await sim.click(counter, counter_updated,
+                                                                   args={"delta": 1, "count": 1}))
+                    except asyncio.TimeoutError:
+                        errors += 1
+                    step += 1
+
+            messages_before = sum(sim.messages for sim in sims)
+            started = time.perf_counter()
+            await asyncio.gather(*(drive(sim) for sim in sims))
+            elapsed = time.perf_counter() - started
+            messages = sum(sim.messages for sim in sims) - messages_before
+            await asyncio.gather(*(sim.close() for sim in sims), return_exceptions=True)
+        finally:
+            app.stop()
+            await stub.stop()
+
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "params": {"clients": clients, "duration_s": duration, "workers": workers, "cpus": os.cpu_count()},
+        "health": summarize(health),
+        "features_render": summarize(features),
+        "index_render": summarize(list(render)),
+        "counter_click": summarize(counter_samples),
+        "chart_click": summarize(chart_samples),
+        "clicks_per_s": round((len(counter_samples) + len(chart_samples)) / elapsed, 1),
+        "messages_per_s": round(messages / elapsed, 1),
+        "rss_per_client_kb": round((rss_after - rss_before) / clients, 1) if clients else 0.0,
+        "timeouts": errors,
+    }
+
+
+SCENARIOS = ("health", "index_render", "counter_click", "chart_click")
+
+
+def problems(result: Dict[str, Any]) -> List[str]:
+    """Reasons a run measured nothing useful: empty scenarios or timeouts"""
+    found = [f"{key} has no samples" for key in SCENARIOS if not result[key]["count"]]
+    if result["timeouts"]:
+        found.append(f"{result['timeouts']} interactions timed out")
+    return found
+
+
+def compare(result: Dict[str, Any], previous: Dict[str, Any], tolerance: float) -> List[str]:
+    """Invalid-run problems plus latency metrics that regressed by more than `tolerance` (fraction)"""
+    regressions = problems(result)
+    for key in SCENARIOS:
+        old, new = previous.get(key, {}).get("p50_ms"), result[key]["p50_ms"]
+        if old and new > old * (1 + tolerance):
+            regressions.append(f"{key} p50 {old}ms -> {new}ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--probes", type=int, default=200, help="sequential /health requests")
+    parser.add_argument("--output", type=Path, default=DEFAULT_HISTORY, help="JSON-lines history file")
+    parser.add_argument("--compare", action="store_true", help="fail if p50 regressed vs. the last run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.clients, args.duration, args.workers, args.probes))
+    print(json.dumps(result, indent=2))
+
+    previous = None
+    if args.output.exists():
+        lines = [line for line in args.output.read_text().splitlines() if line.strip()]
+        matching = [json.loads(line) for line in lines if json.loads(line)["params"] == result["params"]]
+        previous = matching[-1] if matching else None
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("a") as history:
+        history.write(json.dumps(result) + "\n")
+
+    if args.compare and previous is not None:
+        regressions = compare(result, previous, args.tolerance)
+    else:
+        regressions = problems(result)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Benchmark: bytes per record of in-memory users and chart series
+
+Compares what used to be held per record with the compact representations:
+validated `UserProfile` models vs. slotted `UserRecord`s, and lists of
+labels/floats vs. a `LabelColumn` and an `array('d')`. Only memory that is
+still allocated after construction is counted (tracemalloc).
+
+Usage:
+    python -m benchmarks.memory --records 100000
+"""
+import argparse
+import json
+import tracemalloc
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict
+
+from core.series import LabelColumn
+from models.schemas import UserProfile
+from services.users import UserRecord
+
+
+def retained_per_record(build: Callable[[], Any], count: int) -> float:
+    """Bytes still allocated by `build()`'s result, divided by `count`"""
+    tracemalloc.start()
+    try:
+        result = build()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return round(retained / count, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50000)
+    args = parser.parse_args()
+    count = args.records
+
+    base = datetime(2024, 1, 1)
+    rows = [{"name": f"User {i}", "email": f"user{i}@example.com", "created_at": base + timedelta(seconds=i)}
+            for i in range(count)]
+
+    def profiles() -> Dict[str, UserProfile]:
+        return {user.email: user for user in map(UserProfile.model_validate, rows)}
+
+    def records() -> Dict[str, UserRecord]:
+        return {user.email: UserRecord.from_profile(user) for user in map(UserProfile.model_validate, rows)}
+
+    results = {
+        "records": count,
+        "user_bytes": {
+            "profile": retained_per_record(profiles, count),
+            "record": retained_per_record(records, count),
+        },
+        "label_bytes": {
+            "list": retained_per_record(lambda: [f"Row {i + 1}" for i in range(count)], count),
+            "column": retained_per_record(lambda: LabelColumn(f"Row {i + 1}" for i in range(count)), count),
+        },
+        "value_bytes": {
+            "list": retained_per_record(lambda: [i * 0.5 for i in range(count)], count),
+            "array": retained_per_record(lambda: array("d", (i * 0.5 for i in range(count))), count),
+        },
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+"""Benchmark: JSON throughput of the previous serialization paths vs. core.serialization
+
+- health/api_response: FastAPI's jsonable_encoder + JSONResponse vs. FastJSONResponse
+- chart: ChartData.model_dump_json vs. the chunked iter_chart_json
+- preview: str(data)[:200] vs. preview(data, 200) on a large API payload
+
+Usage:
+    python -m benchmarks.serialization --points 100000
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from core.serialization import HAS_ORJSON, FastJSONResponse, iter_chart_json, preview
+from core.series import SeriesLabels, uniform_series
+from models.schemas import ApiResponse, ChartData, HealthCheck
+
+
+def throughput(fn: Callable[[], Any], seconds: float) -> float:
+    """Calls per second, run for about `seconds`"""
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return calls / elapsed
+
+
+def compare(before: Callable[[], Any], after: Callable[[], Any], seconds: float) -> Dict[str, float]:
+    old, new = throughput(before, seconds), throughput(after, seconds)
+    return {"before_per_s": round(old, 1), "after_per_s": round(new, 1), "speedup": round(new / old, 2)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=100_000, help="values in the chart payload")
+    parser.add_argument("--items", type=int, default=20_000, help="records in the previewed payload")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per measurement")
+    args = parser.parse_args()
+
+    health = HealthCheck(uptime=123.4)
+    response = ApiResponse(success=True, message="ok", data={"id": 1, "tags": ["a", "b"], "score": 0.5})
+    chart = ChartData(labels=SeriesLabels(args.points), values=uniform_series(args.points, 10, 100, seed=1))
+    payload = {"items": [{"id": i, "name": f"Item {i}", "price": i * 1.5} for i in range(args.items)]}
+
+    results = {
+        "encoder": "orjson" if HAS_ORJSON else "pydantic-core",
+        "health": compare(lambda: JSONResponse(jsonable_encoder(health)).body,
+                          lambda: FastJSONResponse(health).body, args.seconds),
+        "api_response": compare(lambda: JSONResponse(jsonable_encoder(response)).body,
+                                lambda: FastJSONResponse(response).body, args.seconds),
+        "chart": compare(chart.model_dump_json,
+                         lambda: b"".join(iter_chart_json(chart)), args.seconds),
+        "preview": compare(lambda: str(payload)[:200],
+                           lambda: preview(payload, 200), args.seconds),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
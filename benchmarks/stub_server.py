@@ -0,0 +1,97 @@
+"""Offline stand-in for the external JSON API used by benchmarks"""
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+
+DEFAULT_PAYLOAD = {
+    "slideshow": {
+        "author": "Yours Truly",
+        "date": "date of publication",
+        "slides": [
+            {"title": "Wake up to WonderWidgets!", "type": "all"},
+            {"items": ["Why <em>WonderWidgets</em> are great", "Who <em>buys</em> WonderWidgets"],
+             "title": "Overview", "type": "all"},
+        ],
+        "title": "Sample Slide Show",
+    }
+}
+
+
+class StubServer:
+    """Tiny HTTP/1.1 server answering every GET with a fixed JSON payload.
+
+    Supports `ETag`/`If-None-Match` and `Cache-Control` so HTTP caching
+    behaviour can be exercised without network access.
+    """
+
+    def __init__(self, payload: Optional[Dict[str, Any]] = None, etag: Optional[str] = None,
+                 cache_control: Optional[str] = None, delay: float = 0.0):
+        self.body = json.dumps(payload if payload is not None else DEFAULT_PAYLOAD).encode()
+        self.etag = etag
+        self.cache_control = cache_control
+        self.delay = delay
+        self.requests = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Start listening; returns the bound (host, port)"""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def url(self) -> str:
+        """URL of the JSON endpoint"""
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/json"
+
+    async def stop(self) -> None:
+        """Stop listening"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(self._response(head))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _response(self, head: bytes) -> bytes:
+        headers = {}
+        for line in head.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        extra = ""
+        if self.etag:
+            extra += f"ETag: {self.etag}\r\n"
+        if self.cache_control:
+            extra += f"Cache-Control: {self.cache_control}\r\n"
+
+        if self.etag and headers.get("if-none-match") == self.etag:
+            return f"HTTP/1.1 304 Not Modified\r\n{extra}Content-Length: 0\r\n\r\n".encode()
+        return (
+            f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n{extra}"
+            f"Content-Length: {len(self.body)}\r\n\r\n"
+        ).encode() + self.body
+
+
+async def main(port: int) -> None:
+    server = StubServer()
+    await server.start(port=port)
+    print(f"Stub API listening on {server.url}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    import sys
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8900))
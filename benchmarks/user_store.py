@@ -0,0 +1,84 @@
+"""Benchmark: SQLite user store write throughput and cold-start load time
+
+Compares committing every user write before the next with the write-behind queue
+used by PersistentUserService, then times loading the populated table back
+into a fresh service the way a restarted machine would.
+
+Usage:
+    python -m benchmarks.user_store --users 50000
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+from services.business import PersistentUserService
+from services.users import UserRepository
+
+
+def make_users(count: int) -> List[Tuple[str, str]]:
+    return [(f"User {i}", f"user{i}@example.com") for i in range(count)]
+
+
+async def write_through(path: str, users: List[Tuple[str, str]]) -> float:
+    """Writes/second when every write is committed before the next one"""
+    service = PersistentUserService(UserRepository(path), flush_interval=3600)
+    service.start()
+    start = time.perf_counter()
+    for name, email in users:
+        service.create_user(name, email)
+        await service.flush()
+    elapsed = time.perf_counter() - start
+    await service.stop()
+    return len(users) / elapsed
+
+
+async def write_behind(path: str, users: List[Tuple[str, str]], batch_size: int) -> float:
+    """Writes/second through the write-behind queue, including the final flush"""
+    service = PersistentUserService(UserRepository(path), flush_interval=0.05, batch_size=batch_size)
+    service.start()
+    start = time.perf_counter()
+    for index, (name, email) in enumerate(users):
+        service.create_user(name, email)
+        if index % 100 == 0:
+            # Yield to the flush loop, as request handlers would between events
+            await asyncio.sleep(0)
+    await service.stop()
+    return len(users) / (time.perf_counter() - start)
+
+
+def cold_start(path: str) -> Dict[str, float]:
+    """Seconds to load the table into a new service"""
+    service = PersistentUserService(UserRepository(path))
+    start = time.perf_counter()
+    service.load()
+    elapsed = time.perf_counter() - start
+    service.repository.close()
+    return {"users": service.count(), "seconds": round(elapsed, 3)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--per-write", type=int, default=2000, help="users written with a commit each")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "write_through_per_s": round(asyncio.run(write_through(os.path.join(tmp, "single.db"),
+                                                                   users[:args.per_write]))),
+            "write_behind_per_s": round(asyncio.run(write_behind(os.path.join(tmp, "batched.db"),
+                                                                 users, args.batch_size))),
+            "cold_start": cold_start(os.path.join(tmp, "batched.db")),
+        }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
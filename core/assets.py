@@ -0,0 +1,259 @@
+"""Build-time static asset stage: minify, fingerprint and precompress"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:  # brotli is optional; gzip variants are always built
+    brotli = None
+    HAS_BROTLI = False
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+# Sources the page links, in link order (shared styles before page styles)
+BUNDLES = ("css/custom.css", "css/app.css", "js/utils.js")
+IMMUTABLE = "public, max-age=31536000, immutable"
+MEDIA_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+}
+# Preferred first; identity is the fallback
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and insignificant whitespace.
+
+    Spaces before ':' are kept because `a :hover` and `a:hover` differ.
+    """
+    css = _CSS_COMMENT.sub("", source)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _in_template_after(line: str, in_template: bool) -> bool:
+    """Whether a `template literal` is still open at the end of `line`.
+
+    Skips quoted strings, escapes and trailing // comments; `${...}` nesting
+    and regex literals containing quotes or backticks are not tracked.
+    """
+    quote = None
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_template:
+            in_template = char != "`"
+        elif quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "`":
+            in_template = True
+        elif line.startswith("//", i):
+            break
+        i += 1
+    return in_template
+
+
+def minify_js(source: str) -> str:
+    """Line-level minification: strip indentation, blank lines and whole-line // comments.
+
+    Deliberately conservative (no tokenizer), so ASI is untouched. Lines inside
+    a multi-line template literal are kept verbatim, since their whitespace is
+    part of the string.
+    """
+    kept = []
+    in_template = False
+    for raw in source.splitlines():
+        still_open = _in_template_after(raw, in_template)
+        if in_template:
+            kept.append(raw)
+        else:
+            # A line that opens a template keeps the whitespace after the backtick
+            line = raw.lstrip() if still_open else raw.strip()
+            if line and not line.startswith("//"):
+                kept.append(line)
+        in_template = still_open
+    return "\n".join(kept) + "\n"
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def fingerprint(name: str, content: bytes) -> str:
+    """`css/app.css` -> `css/app.<hash>.css` using the first 12 hex digits of SHA-256"""
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{digest}{ext}"
+
+
+@dataclass
+class BuiltAsset:
+    """One fingerprinted asset and its precompressed variants"""
+    name: str
+    path: str
+    source_hash: str
+    size: int
+    encodings: Dict[str, int] = field(default_factory=dict)
+
+
+def _source_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _sources(source_dir: Path, out_dir: Path, names: Optional[Iterable[str]]) -> List[Tuple[str, Path]]:
+    if names is not None:
+        return [(name, source_dir / name) for name in names]
+    # The build directory may live inside the source tree; never re-bundle its output
+    out_dir = out_dir.resolve()
+    return sorted(
+        (path.relative_to(source_dir).as_posix(), path)
+        for path in source_dir.rglob("*")
+        if path.suffix in MINIFIERS and path.is_file() and out_dir not in path.resolve().parents
+    )
+
+
+def _write(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def build_assets(source_dir: str, out_dir: str,
+                 names: Optional[Iterable[str]] = BUNDLES) -> Dict[str, BuiltAsset]:
+    """Minify `names` (every .css/.js under `source_dir` if None) into `out_dir` with hashed names and .gz/.br variants.
+
+    Sources whose content matches the existing manifest are not rebuilt.
+    """
+    source_root, out_root = Path(source_dir), Path(out_dir)
+    previous = load_manifest(out_dir)
+    manifest: Dict[str, BuiltAsset] = {}
+
+    for name, path in _sources(source_root, out_root, names):
+        raw = path.read_bytes()
+        source_hash = _source_hash(raw)
+        cached = previous.get(name)
+        if (cached is not None and cached.source_hash == source_hash
+                and (out_root / cached.path).exists()
+                and ("br" in cached.encodings or not HAS_BROTLI)):
+            manifest[name] = cached
+            continue
+
+        content = MINIFIERS[path.suffix](raw.decode("utf-8")).encode("utf-8")
+        asset = BuiltAsset(name=name, path=fingerprint(name, content), source_hash=source_hash, size=len(content))
+        _write(out_root / asset.path, content)
+
+        # mtime=0 keeps the gzip bytes reproducible across builds
+        gzipped = gzip.compress(content, compresslevel=9, mtime=0)
+        _write(out_root / (asset.path + ".gz"), gzipped)
+        asset.encodings["gzip"] = len(gzipped)
+        if HAS_BROTLI:
+            compressed = brotli.compress(content, quality=11)
+            _write(out_root / (asset.path + ".br"), compressed)
+            asset.encodings["br"] = len(compressed)
+
+        manifest[name] = asset
+        logger.info(f"Built {asset.path}: {len(raw)} -> {asset.size} bytes, {asset.encodings}")
+
+    _write(out_root / MANIFEST, json.dumps(
+        {name: vars(asset) for name, asset in manifest.items()}, indent=2, sort_keys=True
+    ).encode("utf-8"))
+    return manifest
+
+
+def load_manifest(out_dir: str) -> Dict[str, BuiltAsset]:
+    """Read a previous build's manifest; empty if there is none"""
+    try:
+        with open(Path(out_dir) / MANIFEST, encoding="utf-8") as file:
+            return {name: BuiltAsset(**entry) for name, entry in json.load(file).items()}
+    except (OSError, ValueError, TypeError):
+        return {}
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Parse Accept-Encoding into {coding: q}"""
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
+
+
+class AssetStore:
+    """Resolves logical asset names to hashed URLs and picks the variant to serve"""
+
+    def __init__(self, out_dir: str, url_prefix: str = "/assets"):
+        self.out_dir = Path(out_dir)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.manifest: Dict[str, BuiltAsset] = {}
+        self._by_path: Dict[str, BuiltAsset] = {}
+
+    def load(self, manifest: Optional[Dict[str, BuiltAsset]] = None) -> "AssetStore":
+        self.manifest = manifest if manifest is not None else load_manifest(str(self.out_dir))
+        self._by_path = {asset.path: asset for asset in self.manifest.values()}
+        return self
+
+    def url(self, name: str) -> str:
+        """Fingerprinted URL for a logical name such as `css/app.css`"""
+        return f"{self.url_prefix}/{self.manifest[name].path}"
+
+    def head_html(self, names: Iterable[str]) -> str:
+        """Stylesheet links and deferred script tags for `names`, in order"""
+        tags = []
+        for name in names:
+            if name.endswith(".css"):
+                tags.append(f'<link rel="stylesheet" href="{self.url(name)}">')
+            else:
+                tags.append(f'<script src="{self.url(name)}" defer></script>')
+        return "\n".join(tags)
+
+    def resolve(self, path: str, accept_encoding: str = "") -> Optional[Tuple[Path, Optional[str], str]]:
+        """(file, content-encoding, media type) for a hashed path, or None if it is not a built asset"""
+        asset = self._by_path.get(path)
+        if asset is None:
+            return None
+        accepted = accepted_encodings(accept_encoding)
+        media_type = MEDIA_TYPES.get(os.path.splitext(path)[1], "application/octet-stream")
+        for coding, suffix in ENCODINGS:
+            if coding in asset.encodings and accepted.get(coding, 0.0) > 0:
+                return self.out_dir / (asset.path + suffix), coding, media_type
+        return self.out_dir / asset.path, None, media_type
+
+
+if __name__ == "__main__":
+    # python -m core.assets [source_dir] [out_dir]
+    logging.basicConfig(level=logging.INFO)
+    source = sys.argv[1] if len(sys.argv) > 1 else "static"
+    out = sys.argv[2] if len(sys.argv) > 2 else os.path.join(source, "dist")
+    print(f"Built {len(build_assets(source, out))} assets into {out}")
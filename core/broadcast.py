@@ -0,0 +1,114 @@
+"""Shared publisher that computes a snapshot once per tick and fans out changes"""
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+Snapshot = Dict[str, Any]
+Subscriber = Callable[[Snapshot], Any]
+ComputeFunc = Callable[[], Union[Mapping[str, Any], Awaitable[Mapping[str, Any]]]]
+
+
+def diff(previous: Mapping[str, Any], current: Mapping[str, Any]) -> Snapshot:
+    """Keys of `current` whose values are new or changed"""
+    return {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+
+
+class Broadcaster:
+    """Computes a snapshot with `compute` and pushes only changed keys to subscribers.
+
+    However many clients watch, `compute` runs once per tick. New subscribers
+    receive the full last snapshot; after that each tick delivers just the keys
+    whose values changed, and nothing at all when none did. The tick interval
+    grows with the subscriber count so that fan-out stays under
+    `fanout_per_second` pushes, between `min_interval` and `max_interval`.
+    With no subscribers the loop sleeps until one arrives.
+    """
+
+    def __init__(self, compute: ComputeFunc, min_interval: float = 1.0, max_interval: float = 10.0,
+                 fanout_per_second: float = 200.0,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.compute = compute
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.fanout_per_second = fanout_per_second
+        self._sleep = sleep
+        self._clock = clock
+        self._subscribers: Dict[int, Subscriber] = {}
+        self._next_id = 0
+        self._snapshot: Snapshot = {}
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.ticks = 0
+        self.pushes = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """Last published values (treat as read-only)"""
+        return self._snapshot
+
+    def interval(self) -> float:
+        """Seconds until the next tick for the current subscriber count"""
+        return min(self.max_interval, max(self.min_interval, len(self._subscribers) / self.fanout_per_second))
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Register `callback` for changed values; returns a function that unsubscribes"""
+        subscriber_id = self._next_id
+        self._next_id += 1
+        self._subscribers[subscriber_id] = callback
+        if self._snapshot:
+            callback(dict(self._snapshot))
+        if self._wake is not None:
+            self._wake.set()
+        return lambda: self._subscribers.pop(subscriber_id, None)
+
+    async def tick(self) -> Snapshot:
+        """Compute once, publish, and push the changed keys to every subscriber"""
+        current = self.compute()
+        if inspect.isawaitable(current):
+            current = await current
+        changed = diff(self._snapshot, current)
+        self._snapshot = dict(current)
+        self.ticks += 1
+        if changed:
+            for subscriber_id, callback in list(self._subscribers.items()):
+                try:
+                    callback(changed)
+                    self.pushes += 1
+                except Exception as e:
+                    logger.warning(f"Dropping broadcast subscriber after error: {e}")
+                    self._subscribers.pop(subscriber_id, None)
+        return changed
+
+    def start(self) -> None:
+        """Start the background tick loop"""
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Cancel the tick loop"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            if not self._subscribers:
+                self._wake.clear()
+                await self._wake.wait()
+            started = self._clock()
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Broadcast tick failed: {e}")
+            await self._sleep(max(0.0, self.interval() - (self._clock() - started)))
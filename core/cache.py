@@ -0,0 +1,232 @@
+"""Bounded in-memory cache with LRU eviction and monotonic-clock TTLs"""
+import asyncio
+import heapq
+import logging
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache behaviour since creation"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    coalesced: int = 0
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
+
+
+class TTLCache:
+    """LRU cache bounded by entry count and (optionally) approximate byte size.
+
+    Expiry uses a monotonic clock. Expired entries are dropped lazily on read
+    and eagerly by `sweep()`, which a background task can run periodically.
+    Concurrent async misses on the same key are coalesced by `get_or_set`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        default_ttl: float = 300.0,
+        sweep_interval: float = 60.0,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, int, Hashable]] = []
+        self._heap_counter = 0
+        self._bytes = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > self._clock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate number of bytes held by cached values"""
+        return self._bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value, or `default` on a miss or expired entry"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting least recently used entries if over bounds"""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+
+        if key in self._entries:
+            self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Never let a single oversized value flush the whole cache
+            return
+        self._entries[key] = _Entry(value, expires_at, size)
+        self._bytes += size
+
+        self._heap_counter += 1
+        heapq.heappush(self._expiry_heap, (expires_at, self._heap_counter, key))
+        if len(self._expiry_heap) > 2 * len(self._entries) + 64:
+            self._rebuild_heap()
+
+        self._enforce_bounds()
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove a key; returns True if it was present"""
+        if key in self._entries:
+            self._remove(key)
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    def sweep(self) -> int:
+        """Remove all expired entries and return how many were dropped"""
+        now = self._clock()
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Heap items are not updated on overwrite, so skip stale ones
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(key)
+                removed += 1
+        self.stats.expirations += removed
+        return removed
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value or compute it once for all concurrent callers"""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, factory, ttl))
+            task.add_done_callback(consume_exception)
+            self._inflight[key] = task
+        else:
+            self.stats.coalesced += 1
+
+        # Shield so one cancelled caller does not abort the shared computation
+        return await asyncio.shield(task)
+
+    async def _fill(self, key: Hashable, factory: Callable[[], Awaitable[Any]], ttl: Optional[float]) -> Any:
+        try:
+            value = await factory()
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def start_sweeper(self) -> None:
+        """Start the periodic expiry sweep on the running event loop"""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    async def stop_sweeper(self) -> None:
+        """Cancel the periodic expiry sweep"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                removed = self.sweep()
+                if removed:
+                    logger.debug(f"Cache sweep removed {removed} expired entries")
+            except Exception as e:
+                logger.error(f"Cache sweep failed: {e}")
+
+    def metrics(self) -> Dict[str, int]:
+        """Snapshot of counters and current occupancy"""
+        data = asdict(self.stats)
+        data["entries"] = len(self._entries)
+        data["bytes"] = self._bytes
+        data["inflight"] = len(self._inflight)
+        return data
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _enforce_bounds(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
+
+    def _rebuild_heap(self) -> None:
+        self._expiry_heap = [
+            (entry.expires_at, index, key)
+            for index, (key, entry) in enumerate(self._entries.items())
+        ]
+        heapq.heapify(self._expiry_heap)
+        self._heap_counter = len(self._expiry_heap)
+
+
+def consume_exception(task: asyncio.Future) -> None:
+    # Prevent "exception was never retrieved" warnings when every waiter was cancelled
+    if not task.cancelled():
+        task.exception()
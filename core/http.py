@@ -0,0 +1,186 @@
+"""Shared, app-lifetime HTTP connection pool"""
+import asyncio
+import importlib.util
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import httpx  # imported on first use; it is not needed to serve pages
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORTS = {b"http": 80, b"https": 443}
+
+
+@dataclass
+class HostStats:
+    """Per-host request counters"""
+    in_flight: int = 0
+    waiting: int = 0
+    requests: int = 0
+    errors: int = 0
+
+
+class HttpClientPool:
+    """Owns one `httpx.AsyncClient` shared by every caller in the process.
+
+    Reusing the client keeps TCP/TLS connections alive between requests.
+    On top of httpx's global pool limits, concurrent requests per host are
+    capped with a semaphore, and in-flight/waiting counts are tracked so the
+    pool can be sized against the deployment's concurrency limits.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        per_host_limit: Optional[int] = 10,
+        http2: bool = False,
+        timeout: float = 10.0,
+        transport: Optional["httpx.AsyncBaseTransport"] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.per_host_limit = per_host_limit
+        self.http2 = http2
+        self.timeout = timeout
+        self.transport = transport
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_stats: Dict[str, HostStats] = {}
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """The shared client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        return httpx.AsyncClient(limits=limits, http2=http2, timeout=self.timeout, transport=self.transport)
+
+    async def start(self):
+        """Nothing to open up front: the client (and httpx) load on the first request"""
+
+    async def close(self):
+        """Close the shared client and drop all pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a request through the shared client, honouring the per-host cap"""
+        host = urlsplit(url).netloc
+        stats = self._host_stats.setdefault(host, HostStats())
+        limit = self._host_limit(host)
+
+        stats.waiting += 1
+        try:
+            if limit is not None:
+                await limit.acquire()
+        finally:
+            stats.waiting -= 1
+
+        stats.in_flight += 1
+        stats.requests += 1
+        self._requests += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            return await self.client.request(method, url, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            self._in_flight -= 1
+            if limit is not None:
+                limit.release()
+
+    async def get(self, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a GET request through the shared client"""
+        return await self.request("GET", url, **kwargs)
+
+    def _host_limit(self, host: str) -> Optional[asyncio.Semaphore]:
+        if self.per_host_limit is None:
+            return None
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return limit
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool occupancy and saturation snapshot"""
+        open_by_host = self._open_connections_by_host()
+        return {
+            "max_connections": self.max_connections,
+            "open_connections": self._open_connections(),
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "saturation": self._in_flight / self.max_connections if self.max_connections else 0.0,
+            "waiting": sum(stats.waiting for stats in self._host_stats.values()),
+            "requests": self._requests,
+            "hosts": {
+                host: {**asdict(stats), "open_connections": open_by_host.get(host, 0)}
+                for host, stats in self._host_stats.items()
+            },
+        }
+
+    def _pool_connections(self) -> List[Any]:
+        # httpx does not expose pool state publicly; read it best-effort
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        return list(getattr(pool, "connections", None) or ())
+
+    def _open_connections(self) -> int:
+        return len(self._pool_connections())
+
+    def _open_connections_by_host(self) -> Dict[str, int]:
+        """Pooled connections keyed like the per-host stats (netloc, default port omitted)"""
+        counts: Dict[str, int] = {}
+        for connection in self._pool_connections():
+            origin = getattr(connection, "_origin", None)
+            if origin is None:
+                continue
+            host = origin.host.decode("ascii")
+            if origin.port != DEFAULT_PORTS.get(origin.scheme):
+                host = f"{host}:{origin.port}"
+            counts[host] = counts.get(host, 0) + 1
+        return counts
+
+
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_transient(error: BaseException) -> bool:
+    """True for failures worth retrying: transport errors, timeouts and 408/429/5xx responses"""
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+def endpoint(url: str) -> str:
+    """Scheme and host of a URL, used to key per-endpoint state"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,150 @@
+"""Shared cache for JSON GET responses with request coalescing and revalidation"""
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from core.cache import TTLCache, consume_exception
+
+if TYPE_CHECKING:
+    import httpx
+
+
+logger = logging.getLogger(__name__)
+
+Send = Callable[[Dict[str, str]], Awaitable["httpx.Response"]]
+
+
+@dataclass
+class ResponseCacheStats:
+    """Counters describing how requests were answered"""
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    coalesced: int = 0
+    uncacheable: int = 0
+
+
+class CachedResponse:
+    __slots__ = ("data", "etag", "fresh_until", "size")
+
+    def __init__(self, data: Any, etag: Optional[str], fresh_until: float, size: int):
+        self.data = data
+        self.etag = etag
+        self.fresh_until = fresh_until
+        self.size = size
+
+
+@dataclass
+class CachePolicy:
+    """What a response's headers allow a shared cache to do"""
+    store: bool
+    max_age: float
+
+
+def parse_cache_policy(headers: "httpx.Headers", default_ttl: float = 0.0) -> CachePolicy:
+    """Read Cache-Control (and Age) the way a shared cache should"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+
+    if "no-store" in directives or "private" in directives:
+        return CachePolicy(store=False, max_age=0.0)
+
+    max_age = default_ttl
+    if "no-cache" in directives:
+        max_age = 0.0
+    else:
+        for name in ("s-maxage", "max-age"):
+            try:
+                max_age = float(directives[name])
+                break
+            except (KeyError, TypeError, ValueError):
+                continue
+    try:
+        max_age -= float(headers.get("age", 0))
+    except ValueError:
+        pass
+    return CachePolicy(store=True, max_age=max(0.0, max_age))
+
+
+class ResponseCache:
+    """Size-bounded store of decoded JSON responses, keyed by URL.
+
+    Fresh entries are served without I/O. Stale entries that carry an ETag are
+    kept for `revalidate_window` seconds and refreshed with `If-None-Match`,
+    so an unchanged resource costs a 304 instead of a full body. Concurrent
+    callers for the same URL share one upstream request.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: Optional[int] = 5_000_000,
+                 default_ttl: float = 0.0, revalidate_window: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.default_ttl = default_ttl
+        self.revalidate_window = revalidate_window
+        self.stats = ResponseCacheStats()
+        self._clock = clock
+        self._store = TTLCache(max_entries=max_entries, max_bytes=max_bytes,
+                               sizeof=lambda entry: entry.size, clock=clock)
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def fetch(self, url: str, send: Send) -> Any:
+        """Return the JSON body for `url`, calling `send(headers)` only when needed"""
+        entry = self._store.get(url)
+        if entry is not None and entry.fresh_until > self._clock():
+            self.stats.hits += 1
+            return entry.data
+
+        future = self._inflight.get(url)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            # Shielded so one caller's cancellation doesn't fail the others
+            future = asyncio.ensure_future(self._refresh(url, entry, send))
+            self._inflight[url] = future
+            future.add_done_callback(lambda _: self._inflight.pop(url, None))
+            future.add_done_callback(consume_exception)
+        return await asyncio.shield(future)
+
+    async def _refresh(self, url: str, entry: Optional[CachedResponse], send: Send) -> Any:
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else {}
+        response = await send(headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.stats.revalidated += 1
+            data, size = entry.data, entry.size
+        else:
+            self.stats.misses += 1
+            response.raise_for_status()
+            data, size = response.json(), len(response.content)
+
+        policy = parse_cache_policy(response.headers, self.default_ttl)
+        etag = response.headers.get("etag") or (entry.etag if entry is not None else None)
+        keep_for = policy.max_age + (self.revalidate_window if etag else 0.0)
+        if policy.store and keep_for > 0:
+            self._store.set(url, CachedResponse(data, etag, self._clock() + policy.max_age, size), ttl=keep_for)
+        else:
+            self.stats.uncacheable += 1
+            self._store.delete(url)
+        return data
+
+    def hit_ratio(self) -> float:
+        """Share of fetches answered from stored bodies (fresh hits and 304 revalidations)"""
+        served = self.stats.hits + self.stats.revalidated
+        total = served + self.stats.misses
+        return served / total if total else 0.0
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Request outcomes plus store size"""
+        return {
+            **asdict(self.stats),
+            "entries": len(self._store),
+            "bytes": self._store.size_bytes,
+            "inflight": len(self._inflight),
+        }
@@ -0,0 +1,262 @@
+"""In-process metrics with Prometheus text exposition"""
+import bisect
+import functools
+import inspect
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+SampleFunction = Callable[[], Union[float, Dict[LabelValues, float]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, Any] = {}
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (name it with a `_total` suffix).
+
+    Incremented directly, or read from `function` at scrape time when the
+    count is already kept elsewhere (e.g. a cache's stats).
+    """
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 function: Optional[SampleFunction] = None):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._children[key] = self._children.get(key, 0.0) + amount
+
+    def samples(self) -> Dict[LabelValues, float]:
+        """Current values keyed by label values"""
+        if self.function is None:
+            return dict(self._children)
+        result = self.function()
+        return result if isinstance(result, dict) else {(): result}
+
+    def value(self, **labels: Any) -> float:
+        return self.samples().get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self.samples().items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, either set directly or read from `function` at scrape time.
+
+    `function` may return a single number, or a mapping of label values to
+    numbers for labelled gauges.
+    """
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 function: Optional[SampleFunction] = None):
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+
+    def set(self, value: float, **labels: Any) -> None:
+        self._children[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        self._children[key] = self._children.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Dict[LabelValues, float]:
+        """Current values keyed by label values"""
+        if self.function is None:
+            return dict(self._children)
+        result = self.function()
+        return result if isinstance(result, dict) else {(): result}
+
+    def value(self, **labels: Any) -> float:
+        return self.samples().get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self.samples().items()
+        ]
+
+
+class _HistogramChild:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Timer:
+    """Context manager and decorator that observes elapsed seconds"""
+
+    def __init__(self, histogram: "Histogram", labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self._start, **self.labels)
+
+    def __call__(self, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _Timer(self.histogram, self.labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Timer(self.histogram, self.labels):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram; an observation is one bisect and three adds"""
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _child(self, labels: Dict[str, Any]) -> _HistogramChild:
+        key = self._key(labels)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = _HistogramChild(len(self.buckets) + 1)
+        return child
+
+    def observe(self, value: float, **labels: Any) -> None:
+        child = self._child(labels)
+        child.counts[bisect.bisect_left(self.buckets, value)] += 1
+        child.sum += value
+        child.count += 1
+
+    def time(self, **labels: Any) -> _Timer:
+        """Time a block (`with`) or a sync/async function (decorator)"""
+        return _Timer(self, labels)
+
+    def count(self, **labels: Any) -> int:
+        child = self._children.get(self._key(labels))
+        return child.count if child else 0
+
+    def quantile(self, q: float, **labels: Any) -> Optional[float]:
+        """Estimate a quantile by linear interpolation within buckets (like histogram_quantile)"""
+        child = self._children.get(self._key(labels))
+        if child is None or child.count == 0:
+            return None
+        rank = q * child.count
+        seen = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(child.counts):
+            upper = self.buckets[index] if index < len(self.buckets) else lower
+            if bucket_count and seen + bucket_count >= rank:
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+            lower = upper
+        return lower
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for key, child in self._children.items():
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), child.counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class Registry:
+    """Named collection of metrics rendered together on scrape"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                function: Optional[SampleFunction] = None) -> Counter:
+        return self.register(Counter(name, documentation, labelnames, function))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              function: Optional[SampleFunction] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Process-wide default registry
+REGISTRY = Registry()
@@ -0,0 +1,32 @@
+"""Local resource probes used by health checks"""
+import os
+import shutil
+import sys
+from typing import Optional, Tuple
+
+
+MB = 1024 * 1024
+
+
+def rss_bytes() -> int:
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Non-Linux fallback: peak RSS, reported in KB on Linux and bytes on macOS
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def memory_check(max_rss_bytes: int) -> Tuple[bool, Optional[str]]:
+    """Healthy while process RSS stays under `max_rss_bytes`"""
+    rss = rss_bytes()
+    return rss < max_rss_bytes, f"rss={rss // MB}MB limit={max_rss_bytes // MB}MB"
+
+
+def disk_check(path: str, min_free_bytes: int) -> Tuple[bool, Optional[str]]:
+    """Healthy while the filesystem holding `path` has `min_free_bytes` free"""
+    usage = shutil.disk_usage(path)
+    return usage.free >= min_free_bytes, f"free={usage.free // MB}MB min={min_free_bytes // MB}MB"
@@ -0,0 +1,199 @@
+"""Retry policies and circuit breakers for calls to external services"""
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit '{name}' is open; retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class RetryPolicy:
+    """Retries an async call with decorrelated-jitter backoff.
+
+    Each delay is drawn from [base_delay, 3 * previous delay], capped at
+    `max_delay`, so concurrent callers spread out instead of retrying in
+    lockstep. Only exceptions accepted by `retryable` are retried, and no
+    attempt starts or runs past the overall `deadline`.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.1, max_delay: float = 2.0,
+                 deadline: Optional[float] = None,
+                 retryable: Callable[[BaseException], bool] = lambda e: True,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+                 clock: Callable[[], float] = time.monotonic,
+                 rng: Optional[random.Random] = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable = retryable
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between the base and three times the last delay"""
+        return min(self.max_delay, self._rng.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    async def call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """Run `func` until it succeeds, fails permanently or runs out of attempts/time"""
+        return await self.call_within(
+            lambda timeout: func() if timeout is None else asyncio.wait_for(func(), timeout)
+        )
+
+    async def call_within(self, func: Callable[[Optional[float]], Awaitable[T]]) -> T:
+        """Like `call`, but `func` gets each attempt's remaining time (None without a deadline) and enforces it.
+
+        Lets a circuit breaker apply the timeout inside its own accounting, so
+        an attempt cut off by the deadline is recorded as a failure.
+        """
+        stop_at = self._clock() + self.deadline if self.deadline is not None else None
+        delay = self.base_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await func(None if stop_at is None else max(0.0, stop_at - self._clock()))
+            except Exception as e:
+                if attempt == self.max_attempts or not self.retryable(e):
+                    raise
+                delay = self.next_delay(delay)
+                if stop_at is not None and self._clock() + delay >= stop_at:
+                    logger.warning(f"Retry deadline reached after {attempt} attempts: {e}")
+                    raise
+                logger.warning(f"Attempt {attempt} failed, retrying in {delay:.2f}s: {e}")
+                await self._sleep(delay)
+        raise AssertionError("unreachable")
+
+
+class CircuitBreaker:
+    """Fails fast after repeated failures, then probes for recovery.
+
+    Closed: calls pass through and consecutive failures are counted. After
+    `failure_threshold` failures the circuit opens and calls raise
+    CircuitOpenError for `recovery_timeout` seconds. Then it is half-open: one
+    trial call is let through, and its outcome closes or re-opens the circuit.
+    Only exceptions accepted by `is_failure` count against the endpoint.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 is_failure: Callable[[BaseException], bool] = lambda e: True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.successes = 0
+        self.total_failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def _admit(self) -> None:
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.rejected += 1
+        retry_after = max(0.0, self.recovery_timeout - (self._clock() - self._opened_at))
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self) -> None:
+        self.successes += 1
+        self._failures = 0
+        self._trial_in_flight = False
+        if self._state != self.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+        self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self.total_failures += 1
+        self._failures += 1
+        trial_failed = self._trial_in_flight
+        self._trial_in_flight = False
+        if trial_failed or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.times_opened += 1
+                logger.warning(f"Circuit '{self.name}' opened after {self._failures} failures")
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+
+    async def call(self, func: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        """Run `func` through the breaker; running past `timeout` counts as a failure if `is_failure` agrees"""
+        self._admit()
+        try:
+            result = await (func() if timeout is None else asyncio.wait_for(func(), timeout))
+        except BaseException as e:
+            if isinstance(e, Exception) and self.is_failure(e):
+                self.record_failure()
+            else:
+                # Cancellations and non-failures must not leave a trial slot taken
+                self._trial_in_flight = False
+            raise
+        self.record_success()
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Breaker state and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "failures": self.total_failures,
+            "successes": self.successes,
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
+
+
+class BreakerRegistry:
+    """One CircuitBreaker per endpoint, created on first use with shared settings"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 is_failure: Callable[[BaseException], bool] = lambda e: True,
+                 clock: Callable[[], float] = time.monotonic):
+        self._options: Dict[str, Any] = dict(failure_threshold=failure_threshold, recovery_timeout=recovery_timeout,
+                                             is_failure=is_failure, clock=clock)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name, **self._options)
+        return breaker
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of every breaker, keyed by endpoint"""
+        return {name: breaker.metrics() for name, breaker in self._breakers.items()}
+
+
+def retry_on(*exception_types: Type[BaseException]) -> Callable[[BaseException], bool]:
+    """Retryable-exception filter matching the given types"""
+    types: Tuple[Type[BaseException], ...] = exception_types
+    return lambda e: isinstance(e, types)
@@ -0,0 +1,127 @@
+"""Periodic health-check scheduler with an O(1) result snapshot"""
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+CheckOutcome = Union[bool, Tuple[bool, Optional[str]]]
+CheckFunc = Callable[[], Union[CheckOutcome, Awaitable[CheckOutcome]]]
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """Outcome of one run of a dependency check"""
+    name: str
+    healthy: bool
+    detail: Optional[str] = None
+    duration_ms: float = 0.0
+    checked_at: float = 0.0  # wall-clock epoch seconds
+
+
+@dataclass
+class _Check:
+    name: str
+    func: CheckFunc
+    interval: float
+    timeout: float
+    initial_delay: float = 0.0
+
+
+class CheckScheduler:
+    """Runs each registered check on its own interval, concurrently.
+
+    Async checks are bounded by their timeout. Results are published by swapping
+    in a new snapshot mapping, so readers get a consistent view without
+    locking and never wait on a check.
+    """
+
+    def __init__(self):
+        self._checks: Dict[str, _Check] = {}
+        self._snapshot: Mapping[str, CheckResult] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def register(self, name: str, func: CheckFunc, interval: float = 30.0, timeout: float = 5.0,
+                 initial_delay: float = 0.0) -> None:
+        """Add a check; `func` may be sync or async and return bool or (bool, detail).
+
+        `initial_delay` postpones the first background run, e.g. to keep a
+        check's imports and I/O off the cold-start path.
+        """
+        self._checks[name] = _Check(name, func, interval, timeout, initial_delay)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._checks)
+
+    def snapshot(self) -> Mapping[str, CheckResult]:
+        """Latest result per check (treat as read-only)"""
+        return self._snapshot
+
+    async def run_check(self, name: str) -> CheckResult:
+        """Run one check now and publish its result"""
+        check = self._checks[name]
+        start = time.perf_counter()
+        try:
+            outcome = check.func()
+            if inspect.isawaitable(outcome):
+                outcome = await asyncio.wait_for(outcome, check.timeout)
+            healthy, detail = outcome if isinstance(outcome, tuple) else (outcome, None)
+        except asyncio.TimeoutError:
+            healthy, detail = False, f"timed out after {check.timeout}s"
+        except Exception as e:
+            healthy, detail = False, str(e)
+
+        result = CheckResult(
+            name=name,
+            healthy=bool(healthy),
+            detail=detail,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            checked_at=time.time(),
+        )
+        self._snapshot = {**self._snapshot, name: result}
+        return result
+
+    async def run_all(self) -> Dict[str, CheckResult]:
+        """Run every check concurrently and publish the results"""
+        results = await asyncio.gather(*(self.run_check(name) for name in self._checks))
+        return {result.name: result for result in results}
+
+    def start(self) -> None:
+        """Start one background loop per registered check"""
+        loop = asyncio.get_running_loop()
+        for name in self._checks:
+            task = self._tasks.get(name)
+            if task is None or task.done():
+                self._tasks[name] = loop.create_task(self._run_forever(name))
+
+    async def stop(self) -> None:
+        """Cancel all background loops"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run_forever(self, name: str) -> None:
+        interval = self._checks[name].interval
+        await asyncio.sleep(self._checks[name].initial_delay)
+        while True:
+            result = await self.run_check(name)
+            if not result.healthy:
+                logger.warning(f"Health check '{name}' failed: {result.detail}")
+            await asyncio.sleep(interval)
+
+
+def to_dict(result: CheckResult) -> Dict[str, Any]:
+    """JSON-friendly view of a check result"""
+    return {
+        "healthy": result.healthy,
+        "detail": result.detail,
+        "duration_ms": round(result.duration_ms, 3),
+        "checked_at": result.checked_at,
+    }
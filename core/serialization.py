@@ -0,0 +1,95 @@
+"""Fast JSON encoding: optional orjson, chunked chart encoding and cheap previews"""
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Iterator
+
+import pydantic_core
+from pydantic import BaseModel
+from starlette.responses import JSONResponse
+
+from core.series import LabelColumn, SeriesLabels, as_list
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # orjson is optional; pydantic-core's Rust encoder is always installed
+    orjson = None
+    HAS_ORJSON = False
+
+
+# Series fields of a ChartData that are encoded a chunk at a time
+STREAMED_FIELDS = ("labels", "values")
+
+
+def _default(obj: Any) -> Any:
+    """Plain-JSON form of types the encoders do not know"""
+    if hasattr(obj, "tolist"):  # array('d') and NumPy arrays
+        return obj.tolist()
+    if isinstance(obj, (SeriesLabels, LabelColumn)):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON; NaN and infinities become null"""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    def dumps(obj: Any) -> bytes:
+        """Compact UTF-8 JSON; NaN and infinities become null"""
+        return pydantic_core.to_json(obj, fallback=_default, inf_nan_mode="null")
+
+
+def iter_chart_json(chart: BaseModel, chunk_size: int = 8192) -> Iterator[bytes]:
+    """Encode a ChartData as JSON in pieces.
+
+    `labels` and `values` are encoded `chunk_size` items at a time straight
+    from their arrays, so a large series is never held as one list of Python
+    floats or one big string. Joined, the pieces equal `dumps(chart)`.
+    """
+    separator = b"{"
+    for name in type(chart).model_fields:
+        yield separator + dumps(name) + b":"
+        separator = b","
+        value = getattr(chart, name)
+        if name not in STREAMED_FIELDS:
+            yield dumps(value)
+            continue
+        yield b"["
+        for start in range(0, len(value), chunk_size):
+            encoded = dumps(as_list(value[start:start + chunk_size]))
+            yield (b"," if start else b"") + encoded[1:-1]
+        yield b"]"
+    yield b"}"
+
+
+def preview(obj: Any, limit: int = 200) -> str:
+    """The first `limit` characters of `obj` as JSON, with "…" if there was more.
+
+    Uses the stdlib's incremental encoder and stops as soon as enough text
+    exists, so previewing a large payload costs about as much as a small one.
+    """
+    encoder = json.JSONEncoder(default=_default, ensure_ascii=False, separators=(", ", ": "))
+    parts, size = [], 0
+    for chunk in encoder.iterencode(obj):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(parts)[:limit] + "…"
+    return "".join(parts)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by `dumps`; return it directly to skip FastAPI's jsonable_encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
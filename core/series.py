@@ -0,0 +1,223 @@
+"""Array-backed series: numeric generation, compact labels and downsampling"""
+import random
+from array import array
+from typing import Any, Iterable, Iterator, List, Sequence, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # NumPy is optional; array('d') is used instead
+    np = None
+    HAS_NUMPY = False
+
+
+def is_float_array(values: Any) -> bool:
+    """True for contiguous float64 containers that need no per-element checks"""
+    if isinstance(values, array):
+        return values.typecode == 'd'
+    if HAS_NUMPY and isinstance(values, np.ndarray):
+        return values.ndim == 1 and values.dtype == np.float64
+    return False
+
+
+class SeriesLabels(Sequence[str]):
+    """Lazy `"{prefix} {i+1}"` labels that cost O(1) memory for any length"""
+
+    __slots__ = ("prefix", "_range")
+
+    def __init__(self, count_or_range: Union[int, range], prefix: str = "Point"):
+        self.prefix = prefix
+        self._range = count_or_range if isinstance(count_or_range, range) else range(count_or_range)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SeriesLabels(self._range[index], self.prefix)
+        return f"{self.prefix} {self._range[index] + 1}"
+
+    def __iter__(self) -> Iterator[str]:
+        prefix = self.prefix
+        return (f"{prefix} {i + 1}" for i in self._range)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SeriesLabels):
+            return self.prefix == other.prefix and self._range == other._range
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SeriesLabels({self._range!r}, prefix={self.prefix!r})"
+
+
+class LabelColumn(Sequence[str]):
+    """Columnar string labels: one text buffer plus an int64 array of end offsets.
+
+    Costs about one byte per character plus eight per label, instead of a
+    list slot and a str object per label. Append-only via `extend`; batches
+    are joined into the buffer on first read.
+    """
+
+    __slots__ = ("_text", "_chunks", "_ends")
+
+    def __init__(self, labels: Iterable[str] = ()):
+        self._text = ""
+        self._chunks: List[str] = []
+        self._ends = array('q')
+        self.extend(labels)
+
+    def extend(self, labels: Iterable[str]) -> None:
+        ends = self._ends
+        offset = ends[-1] if ends else 0
+        parts = []
+        for label in labels:
+            parts.append(label)
+            offset += len(label)
+            ends.append(offset)
+        if parts:
+            self._chunks.append("".join(parts))
+
+    def _buffer(self) -> str:
+        if self._chunks:
+            self._text += "".join(self._chunks)
+            self._chunks = []
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LabelColumn(self[i] for i in range(*index.indices(len(self))))
+        ends = self._ends
+        end = ends[index]  # raises IndexError and resolves negative indices
+        if index < 0:
+            index += len(ends)
+        return self._buffer()[ends[index - 1] if index else 0:end]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self._buffer()
+        start = 0
+        for end in self._ends:
+            yield text[start:end]
+            start = end
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LabelColumn):
+            return self._ends == other._ends and self._buffer() == other._buffer()
+        if isinstance(other, (list, tuple, SeriesLabels)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LabelColumn({len(self)} labels)"
+
+
+def as_list(values: Sequence[Any]) -> List[Any]:
+    """Plain list of a series; array('d') and NumPy arrays convert to Python floats in C"""
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
+
+def uniform_series(count: int, low: float, high: float, seed: Any = None) -> Any:
+    """Generate `count` uniform floats in [low, high) as a float64 array"""
+    if HAS_NUMPY:
+        return np.random.default_rng(seed).uniform(low, high, count)
+
+    rng = random.Random(seed) if seed is not None else random
+    rand = rng.random
+    span = high - low
+    return array('d', [low + span * rand() for _ in range(count)])
+
+
+def take(values: Sequence[Any], indices: Sequence[int]) -> Any:
+    """Select `indices` from `values`, preserving array storage where possible"""
+    if HAS_NUMPY and isinstance(values, np.ndarray):
+        return values[np.asarray(indices, dtype=np.intp)]
+    if isinstance(values, array):
+        return array(values.typecode, [values[i] for i in indices])
+    if isinstance(values, (SeriesLabels, LabelColumn)):
+        return LabelColumn(values[i] for i in indices)
+    return [values[i] for i in indices]
+
+
+def lttb_indices(values: Sequence[float], threshold: int) -> List[int]:
+    """Largest-Triangle-Three-Buckets downsampling over evenly spaced x.
+
+    Returns the indices of the points to keep, always including the first
+    and last point. If the series is already small enough every index is kept.
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    vectorized = HAS_NUMPY and isinstance(values, np.ndarray)
+    every = (n - 2) / (threshold - 2)
+    indices = [0]
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = (avg_start + avg_end - 1) / 2
+        next_bucket = values[avg_start:avg_end]
+        avg_y = sum(next_bucket) / len(next_bucket)
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        ay = values[a]
+
+        if vectorized:
+            xs = np.arange(range_start, range_end)
+            areas = np.abs((a - avg_x) * (values[range_start:range_end] - ay) - (a - xs) * (avg_y - ay))
+            best = range_start + int(areas.argmax())
+        else:
+            best = range_start
+            max_area = -1.0
+            for j in range(range_start, range_end):
+                area = abs((a - avg_x) * (values[j] - ay) - (a - j) * (avg_y - ay))
+                if area > max_area:
+                    max_area = area
+                    best = j
+
+        indices.append(best)
+        a = best
+
+    indices.append(n - 1)
+    return indices
+
+
+def minmax_indices(values: Sequence[float], max_points: int) -> List[int]:
+    """Keep the minimum and maximum of each bucket, in index order"""
+    n = len(values)
+    buckets = max_points // 2
+    if max_points >= n or buckets < 1:
+        return list(range(n))
+
+    size = n / buckets
+    indices: List[int] = []
+    for b in range(buckets):
+        start = int(b * size)
+        end = min(int((b + 1) * size), n)
+        if start >= end:
+            continue
+        bucket = values[start:end]
+        if HAS_NUMPY and isinstance(bucket, np.ndarray):
+            lo = start + int(bucket.argmin())
+            hi = start + int(bucket.argmax())
+        else:
+            lo = start + min(range(end - start), key=bucket.__getitem__)
+            hi = start + max(range(end - start), key=bucket.__getitem__)
+        indices.extend(sorted({lo, hi}))
+    return indices
+
+
+def downsample_indices(values: Sequence[float], max_points: int, method: str = "lttb") -> List[int]:
+    """Indices of at most `max_points` representative points"""
+    if method == "lttb":
+        return lttb_indices(values, max_points)
+    if method == "minmax":
+        return minmax_indices(values, max_points)
+    raise ValueError(f"Unknown downsampling method: {method}")
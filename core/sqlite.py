@@ -0,0 +1,46 @@
+"""Per-thread SQLite connections that can all be closed at shutdown"""
+import sqlite3
+import threading
+from typing import List
+
+
+class ThreadConnections:
+    """One autocommit connection per thread to a database file.
+
+    sqlite3 connections must not be used from several threads, so each thread
+    (including `asyncio.to_thread` workers) gets its own, opened on first use.
+    Every connection is tracked so `close_all` releases them from any thread.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._opened: List[sqlite3.Connection] = []
+
+    def get(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Each connection is still used by one thread only; the flag lets close_all
+            # close it from the thread that shuts down
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._opened.append(conn)
+        return conn
+
+    @property
+    def open_count(self) -> int:
+        with self._lock:
+            return len(self._opened)
+
+    def close_all(self) -> None:
+        """Close every thread's connection; later use reconnects"""
+        with self._lock:
+            opened, self._opened = self._opened, []
+            self._local = threading.local()
+        for conn in opened:
+            conn.close()
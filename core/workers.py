@@ -0,0 +1,255 @@
+"""Multi-process serving: worker supervisor and sticky-session proxy"""
+import asyncio
+import itertools
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from http.cookies import SimpleCookie
+from typing import Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+WORKER_ENV = "NICEGUI_WORKER_INDEX"
+COOKIE_NAME = "nicegui_worker"
+MAX_HEAD_BYTES = 64 * 1024
+
+
+def worker_index() -> Optional[int]:
+    """Index of this worker process, or None when not running under the supervisor"""
+    value = os.getenv(WORKER_ENV)
+    return int(value) if value is not None else None
+
+
+class StickyProxy:
+    """Minimal HTTP/1.1 + WebSocket proxy that pins each browser to one worker.
+
+    NiceGUI keeps every client's element tree in the process that rendered
+    the page, so the socket.io connection must reach that same process. New
+    visitors are assigned the least-loaded worker and get a cookie naming it;
+    later requests (including the websocket upgrade) carry the cookie back.
+
+    The backend is chosen from a connection's first request head, so plain
+    requests are forced to `Connection: close` in both directions: a front
+    proxy that pools keep-alive connections (such as Fly's edge) then cannot
+    send another visitor's request down a connection pinned to this worker.
+    Upgraded connections carry a single websocket and are left alone.
+    """
+
+    def __init__(self, backends: List[Tuple[str, int]], cookie_name: str = COOKIE_NAME):
+        self.backends = backends
+        self.cookie_name = cookie_name
+        self.active: List[int] = [0] * len(backends)
+        self._round_robin = itertools.cycle(range(len(backends)))
+
+    def choose(self, head: bytes) -> Tuple[int, bool]:
+        """Pick a backend for a request head; returns (index, needs_cookie)"""
+        pinned = self._pinned_worker(head)
+        if pinned is not None:
+            return pinned, False
+        lowest = min(self.active)
+        for _ in range(len(self.backends)):
+            index = next(self._round_robin)
+            if self.active[index] == lowest:
+                return index, True
+        return next(self._round_robin), True
+
+    def _pinned_worker(self, head: bytes) -> Optional[int]:
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() != b"cookie":
+                continue
+            cookie = SimpleCookie()
+            try:
+                cookie.load(value.decode("latin-1"))
+            except Exception:
+                return None
+            morsel = cookie.get(self.cookie_name)
+            if morsel is not None and morsel.value.isdigit() and int(morsel.value) < len(self.backends):
+                return int(morsel.value)
+        return None
+
+    def _set_cookie(self, response_head: bytes, index: int) -> bytes:
+        return _add_header(response_head, b"Set-Cookie",
+                           f"{self.cookie_name}={index}; Path=/; HttpOnly; SameSite=Lax".encode())
+
+    async def handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection"""
+        backend_writer = None
+        index = None
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+            index, needs_cookie = self.choose(head)
+            upgrade = _is_upgrade(head)
+            if not upgrade:
+                head = _set_header(head, b"Connection", b"close")
+            self.active[index] += 1
+            host, port = self.backends[index]
+            backend_reader, backend_writer = await asyncio.open_connection(host, port)
+            backend_writer.write(head)
+            await backend_writer.drain()
+
+            upstream = asyncio.ensure_future(_pipe(client_reader, backend_writer))
+            response_head = await backend_reader.readuntil(b"\r\n\r\n")
+            if not upgrade:
+                response_head = _set_header(response_head, b"Connection", b"close")
+            if needs_cookie:
+                response_head = self._set_cookie(response_head, index)
+            client_writer.write(response_head)
+            await client_writer.drain()
+            await _pipe(backend_reader, client_writer)
+            upstream.cancel()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Proxy error: {e}")
+        finally:
+            if index is not None:
+                self.active[index] -= 1
+            for writer in (backend_writer, client_writer):
+                if writer is not None:
+                    writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        """Accept connections until cancelled"""
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEAD_BYTES)
+        logger.info(f"Sticky proxy on {host}:{port} -> {len(self.backends)} workers")
+        async with server:
+            await server.serve_forever()
+
+
+def _header_lines(head: bytes) -> List[bytes]:
+    return head[:-4].split(b"\r\n")
+
+
+def _is_upgrade(head: bytes) -> bool:
+    return any(line.partition(b":")[0].strip().lower() == b"upgrade" for line in _header_lines(head)[1:])
+
+
+def _add_header(head: bytes, name: bytes, value: bytes) -> bytes:
+    """Insert a header right after the request/status line"""
+    first_end = head.index(b"\r\n") + 2
+    return head[:first_end] + name + b": " + value + b"\r\n" + head[first_end:]
+
+
+def _set_header(head: bytes, name: bytes, value: bytes) -> bytes:
+    """Replace every `name` header (case-insensitively) with a single `name: value`"""
+    lines = _header_lines(head)
+    kept = [lines[0]] + [line for line in lines[1:] if line.partition(b":")[0].strip().lower() != name.lower()]
+    return _add_header(b"\r\n".join(kept) + b"\r\n\r\n", name, value)
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except OSError:
+        pass
+    finally:
+        if writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except (OSError, RuntimeError):
+                pass
+
+
+class WorkerSupervisor:
+    """Starts N app processes on internal ports and restarts any that exit"""
+
+    def __init__(self, command: List[str], workers: int, port_base: int,
+                 env: Optional[Dict[str, str]] = None):
+        self.command = command
+        self.workers = workers
+        self.port_base = port_base
+        self.env = env or {}
+        self.processes: List[Optional[subprocess.Popen]] = [None] * workers
+
+    @property
+    def backends(self) -> List[Tuple[str, int]]:
+        return [("127.0.0.1", self.port_base + i) for i in range(self.workers)]
+
+    def spawn(self, index: int) -> None:
+        """Start (or restart) one worker process"""
+        env = {**os.environ, **self.env,
+               WORKER_ENV: str(index), "HOST": "127.0.0.1", "PORT": str(self.port_base + index)}
+        self.processes[index] = subprocess.Popen(self.command, env=env)
+        logger.info(f"Worker {index} started on port {self.port_base + index}")
+
+    def start(self) -> None:
+        """Start every worker"""
+        for index in range(self.workers):
+            self.spawn(index)
+
+    async def monitor(self, interval: float = 1.0) -> None:
+        """Restart workers that exited unexpectedly"""
+        while True:
+            await asyncio.sleep(interval)
+            for index, process in enumerate(self.processes):
+                if process is not None and process.poll() is not None:
+                    logger.warning(f"Worker {index} exited with {process.returncode}; restarting")
+                    self.spawn(index)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Terminate every worker"""
+        for process in self.processes:
+            if process is not None and process.poll() is None:
+                process.send_signal(signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        for process in self.processes:
+            if process is None:
+                continue
+            try:
+                process.wait(max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+async def wait_for_ports(backends: List[Tuple[str, int]], timeout: float = 30.0) -> None:
+    """Wait until every backend accepts TCP connections"""
+    deadline = time.monotonic() + timeout
+    for host, port in backends:
+        while True:
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+                writer.close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    logger.warning(f"Worker on port {port} not ready after {timeout}s")
+                    break
+                await asyncio.sleep(0.2)
+
+
+def run_workers(host: str, port: int, workers: int, port_base: int,
+                env: Optional[Dict[str, str]] = None) -> None:
+    """Run `workers` copies of this app behind a sticky proxy (blocks)"""
+    supervisor = WorkerSupervisor([sys.executable, *sys.argv], workers, port_base, env)
+    proxy = StickyProxy(supervisor.backends)
+
+    async def main():
+        # Stop cleanly on SIGTERM so the finally block below reaps the workers
+        serving = asyncio.current_task()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+        monitor = asyncio.ensure_future(supervisor.monitor())
+        try:
+            await wait_for_ports(supervisor.backends)
+            await proxy.serve(host, port)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            monitor.cancel()
+
+    supervisor.start()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        supervisor.stop()
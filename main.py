@@ -1,24 +1,59 @@
 import os
-from dotenv import load_dotenv
-from nicegui import ui
+
+from core.startup import ImportTimer, StartupProfile, install_first_request_hook
+
+# STARTUP_PROFILE=1 logs import, phase and first-response timings; it must start before the heavy imports
+profile = StartupProfile(imports=ImportTimer().install()) if os.getenv("STARTUP_PROFILE") else None
+
+import logging  # noqa: E402
+import multiprocessing  # noqa: E402
+from dotenv import load_dotenv  # noqa: E402
+from nicegui import app as nicegui_app, ui  # noqa: E402
 
 # Import the page definitions from app.main
 # This ensures that the @ui.page decorators in app/main.py are executed
 # and the routes are registered with NiceGUI before ui.run() is called.
-import app.main  # noqa: F401
+import app.main  # noqa: F401,E402
+from app.config import settings  # noqa: E402
+from core.workers import run_workers, worker_index  # noqa: E402
+
+if profile is not None:
+    profile.mark("imports done")
+    # Registered last, so it runs after every service's startup handler
+    nicegui_app.on_startup(lambda: profile.mark("startup handlers done"))
+    install_first_request_hook(nicegui_app, profile)
 
 # Load environment variables from .env file (if present)
 load_dotenv()
 
+
+def serve_workers(host: str, port: int):
+    """Run settings.workers processes behind the sticky-session proxy"""
+    env = {}
+    if settings.state_backend == "memory":
+        # In-memory session state would diverge between workers
+        logging.getLogger(__name__).warning("Multiple workers need shared state; using the sqlite state backend")
+        env["STATE_BACKEND"] = "sqlite"
+    if settings.user_backend == "memory":
+        logging.getLogger(__name__).warning("Multiple workers need shared users; using the sqlite user backend")
+        env["USER_BACKEND"] = "sqlite"
+    run_workers(host, port, settings.workers, settings.worker_port_base, env)
+
+
 if __name__ in {"__main__", "__mp_main__"}:
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
 
-    ui.run(
-        host=host,
-        port=port,
-        title="NiceGUI Showcase - Interactive Demo",
-        favicon="🚀",
-        uvicorn_logging_level='info',
-        reload=False
-    )
\ No newline at end of file
+    if (settings.workers > 1 and worker_index() is None
+            and multiprocessing.current_process().name == "MainProcess"):
+        serve_workers(host, port)
+    else:
+        ui.run(
+            host=host,
+            port=port,
+            title="NiceGUI Showcase - Interactive Demo",
+            favicon="🚀",
+            uvicorn_logging_level='info',
+            storage_secret=settings.storage_secret,
+            reload=False
+        )
\ No newline at end of file
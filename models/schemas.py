@@ -1,9 +1,34 @@
 """Pydantic models for data validation"""
-from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List, Dict, Any
+from pydantic import (
+    BaseModel, EmailStr, Field, PlainSerializer, PlainValidator, ValidationInfo, field_validator,
+)
+from typing import Optional, List, Dict, Any, Sequence, Union
+from typing_extensions import Annotated
 from datetime import datetime
 from enum import Enum
 
+from core.series import LabelColumn, SeriesLabels, is_float_array
+
+
+def _accept_float_array(v: Any) -> Any:
+    # Trusted float64 buffers are stored as-is, without per-element validation
+    if is_float_array(v):
+        return v
+    raise ValueError('Expected a float64 array')
+
+
+def _accept_label_series(v: Any) -> Any:
+    if isinstance(v, (SeriesLabels, LabelColumn)):
+        return v
+    raise ValueError('Expected SeriesLabels or LabelColumn')
+
+
+# Zero-copy members tried before the element-wise List fallbacks
+FloatArray = Annotated[Any, PlainValidator(_accept_float_array),
+                       PlainSerializer(lambda v: v.tolist(), when_used='json')]
+LazyLabels = Annotated[Any, PlainValidator(_accept_label_series),
+                       PlainSerializer(list, when_used='json')]
+
 
 class UserRole(str, Enum):
     """User role enumeration"""
@@ -20,8 +45,9 @@ class UserProfile(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
     is_active: bool = True
     
-    @validator('name')
-    def validate_name(cls, v):
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v: str) -> str:
         if not v.strip():
             raise ValueError('Name cannot be empty')
         return v.strip()
@@ -36,17 +62,35 @@ class ApiResponse(BaseModel):
 
 
 class ChartData(BaseModel):
-    """Chart data model"""
-    labels: List[str]
-    values: List[float]
+    """Chart data model
+    
+    `values` may be a list of floats or a float64 `array('d')`/NumPy array,
+    which is kept without copying. `labels` may be a lazy `SeriesLabels` or
+    a columnar `LabelColumn`.
+    """
+    labels: Union[LazyLabels, List[str]] = Field(..., union_mode='left_to_right')
+    values: Union[FloatArray, List[float]] = Field(..., union_mode='left_to_right')
     chart_type: str = "line"
     title: Optional[str] = None
     
-    @validator('values')
-    def validate_values(cls, v):
-        if not v:
+    @field_validator('values')
+    @classmethod
+    def validate_values(cls, v: Any) -> Any:
+        if len(v) == 0:
             raise ValueError('Values cannot be empty')
         return v
+    
+    @classmethod
+    def trusted(cls, labels: Sequence[str], values: Sequence[float],
+                chart_type: str = "line", title: Optional[str] = None) -> "ChartData":
+        """Build from data this app generated itself, skipping field validation.
+        
+        Only the empty-values check is kept; callers guarantee `values` are
+        floats (or a float64 array) and `labels` are strings.
+        """
+        if len(values) == 0:
+            raise ValueError('Values cannot be empty')
+        return cls.model_construct(labels=labels, values=values, chart_type=chart_type, title=title)
 
 
 class FormData(BaseModel):
@@ -55,9 +99,11 @@ class FormData(BaseModel):
     password: str = Field(..., min_length=6)
     confirm_password: Optional[str] = None
     
-    @validator('confirm_password')
-    def passwords_match(cls, v, values):
-        if 'password' in values and v != values['password']:
+    @field_validator('confirm_password')
+    @classmethod
+    def passwords_match(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        # Skipped when password itself failed validation
+        if 'password' in info.data and v != info.data['password']:
             raise ValueError('Passwords do not match')
         return v
 
@@ -68,8 +114,9 @@ class FileUpload(BaseModel):
     content_type: str
     size: int = Field(..., gt=0, le=10_000_000)  # Max 10MB
     
-    @validator('filename')
-    def validate_filename(cls, v):
+    @field_validator('filename')
+    @classmethod
+    def validate_filename(cls, v: str) -> str:
         if not v or '/' in v or '\\' in v:
             raise ValueError('Invalid filename')
         return v
@@ -82,8 +129,9 @@ class AppSettings(BaseModel):
     language: str = "en"
     timezone: str = "UTC"
     
-    @validator('theme')
-    def validate_theme(cls, v):
+    @field_validator('theme')
+    @classmethod
+    def validate_theme(cls, v: str) -> str:
         allowed_themes = ["blue", "green", "purple", "orange", "red"]
         if v not in allowed_themes:
             raise ValueError(f'Theme must be one of {allowed_themes}')
@@ -1,13 +1,32 @@
 """Business logic services"""
 import asyncio
-import httpx
+import base64
+import bisect
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import random
+from collections import defaultdict
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+from datetime import datetime
 
-from models.schemas import ApiResponse, ChartData, UserProfile, HealthCheck
-from core.utils import async_retry, safe_get
+from pydantic import TypeAdapter
+
+from app.config import settings
+from models.schemas import ApiResponse, ChartData, UserProfile, UserRole, HealthCheck
+from core.cache import TTLCache
+from core.probes import MB, disk_check, memory_check, rss_bytes
+from core.scheduler import CheckScheduler, to_dict as check_result_dict
+from core.http import HttpClientPool, endpoint, is_transient
+from core.http_cache import ResponseCache
+from core.metrics import REGISTRY
+from core.resilience import BreakerRegistry, RetryPolicy
+from core.series import SeriesLabels, downsample_indices, take, uniform_series
+from core.utils import safe_get
+from services.state import StateStore, create_state_backend
+from services.users import UserRecord, UserRepository
+
+if TYPE_CHECKING:
+    import httpx  # loaded on first use to keep it off the cold-start path
 
 logger = logging.getLogger(__name__)
 
@@ -15,67 +34,116 @@ logger = logging.getLogger(__name__)
 class DataService:
     """Service for handling data operations"""
     
-    def __init__(self):
-        self.cache: Dict[str, Any] = {}
-        self.cache_ttl: Dict[str, datetime] = {}
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self.cache = cache if cache is not None else TTLCache()
+    
+    def start(self):
+        """Start background cache maintenance"""
+        self.cache.start_sweeper()
+    
+    async def stop(self):
+        """Stop background cache maintenance"""
+        await self.cache.stop_sweeper()
     
     async def get_sample_data(self, count: int = 10) -> ChartData:
         """Generate sample chart data"""
-        labels = [f"Point {i+1}" for i in range(count)]
-        values = [random.uniform(10, 100) for _ in range(count)]
-        
+        # Array-backed values and lazy labels skip per-element validation
         return ChartData(
-            labels=labels,
-            values=values,
+            labels=SeriesLabels(count),
+            values=uniform_series(count, 10, 100),
             chart_type="line",
             title="Sample Data Chart"
         )
     
+    def downsample(self, data: ChartData, max_points: int,
+                   method: str = "lttb") -> Tuple[List[int], ChartData]:
+        """Reduce chart data to at most max_points, returning kept indices too"""
+        indices = downsample_indices(data.values, max_points, method)
+        if len(indices) == len(data.values):
+            return indices, data
+        
+        # Label lists are validated per element; these came from validated data
+        reduced = ChartData.trusted(
+            labels=take(data.labels, indices),
+            values=take(data.values, indices),
+            chart_type=data.chart_type,
+            title=data.title
+        )
+        return indices, reduced
+    
     async def get_cached_data(self, key: str, ttl_seconds: int = 300) -> Optional[Any]:
         """Get data from cache with TTL"""
-        if key in self.cache:
-            if key in self.cache_ttl:
-                if datetime.now() < self.cache_ttl[key]:
-                    return self.cache[key]
-                else:
-                    # Cache expired
-                    del self.cache[key]
-                    del self.cache_ttl[key]
-        return None
+        return self.cache.get(key)
     
     def set_cached_data(self, key: str, data: Any, ttl_seconds: int = 300):
         """Set data in cache with TTL"""
-        self.cache[key] = data
-        self.cache_ttl[key] = datetime.now() + timedelta(seconds=ttl_seconds)
+        self.cache.set(key, data, ttl=ttl_seconds)
+    
+    async def get_or_compute(self, key: str, factory: Callable[[], Awaitable[Any]],
+                             ttl_seconds: int = 300) -> Any:
+        """Get data from cache, computing it once for concurrent misses"""
+        return await self.cache.get_or_set(key, factory, ttl=ttl_seconds)
 
 
 class ApiService:
     """Service for external API interactions"""
     
-    def __init__(self):
+    def __init__(self, pool: Optional[HttpClientPool] = None, retry: Optional[RetryPolicy] = None,
+                 breakers: Optional[BreakerRegistry] = None, responses: Optional[ResponseCache] = None):
+        self.pool = pool
         self.client = None
         self.base_timeout = 10.0
+        self._owns_client = False
+        # Breakers and cached responses are shared across instances so they outlive each call
+        self.retry = retry or api_retry_policy
+        self.breakers = breakers or api_breakers
+        self.responses = responses or api_response_cache
     
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(timeout=self.base_timeout)
+        if self.pool is not None:
+            self.client = self.pool.client
+        else:
+            import httpx
+            self.client = httpx.AsyncClient(timeout=self.base_timeout)
+            self._owns_client = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.client:
+        if self.client and self._owns_client:
             await self.client.aclose()
     
+    async def _get(self, url: str, headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        if not self.client:
+            raise RuntimeError("Client not initialized")
+        if self.pool is not None:
+            return await self.pool.get(url, headers=headers)
+        return await self.client.get(url, headers=headers)
+    
+    async def _send(self, url: str, headers: Optional[Dict[str, str]] = None) -> "httpx.Response":
+        # Retries wrap the breaker, so an open circuit fails fast without retrying. The
+        # deadline is enforced inside the breaker, so a hanging upstream counts as a failure
+        breaker = self.breakers.get(endpoint(url))
+        
+        async def attempt():
+            response = await self._get(url, headers)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        
+        return await self.retry.call_within(lambda timeout: breaker.call(attempt, timeout))
+    
+    async def _get_json(self, url: str) -> Any:
+        response = await self._send(url)
+        return response.json()
+    
     async def test_connection(self) -> ApiResponse:
         """Test external API connection"""
+        with api_call_seconds.time(operation="test_connection"):
+            return await self._test_connection()
+    
+    async def _test_connection(self) -> ApiResponse:
         try:
-            async def make_request():
-                if not self.client:
-                    raise RuntimeError("Client not initialized")
-                
-                response = await self.client.get("https://httpbin.org/json")
-                response.raise_for_status()
-                return response.json()
-            
-            data = await async_retry(make_request, max_retries=3, delay=1.0)
+            data = await self._get_json(settings.external_api_url)
             
             return ApiResponse(
                 success=True,
@@ -92,17 +160,18 @@ class ApiService:
     
     async def fetch_external_data(self, url: str) -> ApiResponse:
         """Fetch data from external URL"""
+        with api_call_seconds.time(operation="fetch"):
+            return await self._fetch_external_data(url)
+    
+    async def _fetch_external_data(self, url: str) -> ApiResponse:
         try:
-            if not self.client:
-                raise RuntimeError("Client not initialized")
-            
-            response = await self.client.get(url)
-            response.raise_for_status()
+            # Concurrent callers share one request; cached bodies are revalidated by ETag
+            data = await self.responses.fetch(url, partial(self._send, url))
             
             return ApiResponse(
                 success=True,
                 message="Data fetched successfully",
-                data=response.json()
+                data=data
             )
         
         except Exception as e:
@@ -114,40 +183,333 @@ class ApiService:
 
 
 class UserService:
-    """Service for user management"""
+    """Service for user management
+    
+    Users are keyed by email, with secondary indexes by role, by active flag
+    and by (created_at, email) order for range queries and cursor pagination.
+    They are held as slotted `UserRecord`s; every public method validates
+    input as `UserProfile` and returns `UserProfile`s built on the way out.
+    """
     
     def __init__(self):
-        self.users: Dict[str, UserProfile] = {}
+        self.users: Dict[str, UserRecord] = {}
+        self._by_role: Dict[UserRole, Set[str]] = defaultdict(set)
+        self._by_active: Dict[bool, Set[str]] = {True: set(), False: set()}
+        self._by_created: List[Tuple[datetime, str]] = []
+    
+    def _index(self, user: UserRecord):
+        email = user.email
+        self.users[email] = user
+        self._by_role[user.role].add(email)
+        self._by_active[user.is_active].add(email)
+        key = (user.created_at, email)
+        # Users are usually created in time order, so appending is the fast path
+        if not self._by_created or self._by_created[-1] < key:
+            self._by_created.append(key)
+        else:
+            bisect.insort(self._by_created, key)
+    
+    def _unindex(self, user: UserRecord):
+        email = user.email
+        del self.users[email]
+        self._by_role[user.role].discard(email)
+        self._by_active[user.is_active].discard(email)
+        key = (user.created_at, email)
+        position = bisect.bisect_left(self._by_created, key)
+        if position < len(self._by_created) and self._by_created[position] == key:
+            del self._by_created[position]
+    
+    def _check_email_free(self, email: str, previous: UserRecord):
+        # Re-keying onto an address that belongs to someone else would replace them
+        if email != previous.email and email in self.users:
+            raise ValueError(f"Email {email} already belongs to another user")
+    
+    def _store(self, user: UserRecord, previous: Optional[UserRecord] = None):
+        # `previous` is the record being replaced; an email change re-keys it
+        if previous is not None:
+            self._check_email_free(user.email, previous)
+            self._unindex(previous)
+        existing = self.users.get(user.email)
+        if existing is not None:
+            self._unindex(existing)
+        self._index(user)
+    
+    def _rebuild(self, users: Iterable[UserRecord]):
+        # Bulk load: fill the indexes and sort the creation order once
+        self.users = {user.email: user for user in users}
+        self._by_role = defaultdict(set)
+        self._by_active = {True: set(), False: set()}
+        for email, user in self.users.items():
+            self._by_role[user.role].add(email)
+            self._by_active[user.is_active].add(email)
+        self._by_created = sorted((user.created_at, email) for email, user in self.users.items())
+    
+    def start(self):
+        """Nothing to start for the in-memory store"""
+    
+    async def stop(self):
+        """Nothing to flush for the in-memory store"""
     
     def create_user(self, name: str, email: str) -> UserProfile:
         """Create a new user profile"""
         user = UserProfile(name=name, email=email)
-        self.users[email] = user
+        self._store(UserRecord.from_profile(user))
         return user
     
+    def bulk_create(self, records: Iterable[Dict[str, Any]]) -> List[UserProfile]:
+        """Validate a batch of user records in one pass, then store them all"""
+        users = _user_list_adapter.validate_python(list(records))
+        for user in users:
+            self._store(UserRecord.from_profile(user))
+        return users
+    
     def get_user(self, email: str) -> Optional[UserProfile]:
         """Get user by email"""
-        return self.users.get(email)
+        user = self.users.get(email)
+        return user.to_profile() if user is not None else None
+    
+    def _apply_update(self, user: UserRecord, changes: Dict[str, Any]) -> UserProfile:
+        # Validate only the changed fields on a fresh profile of the record
+        updated = user.to_profile()
+        for field, value in changes.items():
+            if field in UserProfile.model_fields:
+                UserProfile.__pydantic_validator__.validate_assignment(updated, field, value)
+        return updated
     
-    def update_user(self, email: str, **kwargs) -> Optional[UserProfile]:
+    def update_user(self, email: str, /, **kwargs) -> Optional[UserProfile]:
         """Update user profile"""
-        if email in self.users:
-            user_data = self.users[email].dict()
-            user_data.update(kwargs)
-            self.users[email] = UserProfile(**user_data)
-            return self.users[email]
-        return None
+        user = self.users.get(email)
+        if user is None:
+            return None
+        updated = self._apply_update(user, kwargs)
+        self._store(UserRecord.from_profile(updated), previous=user)
+        return updated
+    
+    def bulk_update(self, updates: Dict[str, Dict[str, Any]]) -> List[UserProfile]:
+        """Apply partial updates keyed by email; nothing is stored if any fails validation"""
+        pending = [
+            (self.users[email], self._apply_update(self.users[email], changes))
+            for email, changes in updates.items()
+            if email in self.users
+        ]
+        targets: Set[str] = set()
+        for previous, updated in pending:
+            self._check_email_free(updated.email, previous)
+            if updated.email in targets:
+                raise ValueError(f"Email {updated.email} is the target of more than one update")
+            targets.add(updated.email)
+        for previous, updated in pending:
+            self._store(UserRecord.from_profile(updated), previous=previous)
+        return [updated for _, updated in pending]
     
     def list_users(self) -> List[UserProfile]:
         """List all users"""
-        return list(self.users.values())
+        return [user.to_profile() for user in self.users.values()]
+    
+    def count(self, role: Optional[UserRole] = None, is_active: Optional[bool] = None) -> int:
+        """Count users matching the filters using the indexes"""
+        if role is None and is_active is None:
+            return len(self.users)
+        if is_active is None:
+            return len(self._by_role.get(role, ()))
+        if role is None:
+            return len(self._by_active[is_active])
+        return len(self._by_role.get(role, set()) & self._by_active[is_active])
+    
+    def iter_users(self, role: Optional[UserRole] = None, is_active: Optional[bool] = None,
+                   created_after: Optional[datetime] = None,
+                   created_before: Optional[datetime] = None,
+                   after_key: Optional[Tuple[datetime, str]] = None) -> Iterator[UserProfile]:
+        """Stream users in creation order, filtered through the indexes"""
+        order = self._by_created
+        if after_key is not None:
+            start = bisect.bisect_right(order, after_key)
+        elif created_after is not None:
+            start = bisect.bisect_left(order, (created_after, ""))
+        else:
+            start = 0
+        
+        role_members = self._by_role.get(role, set()) if role is not None else None
+        active_members = self._by_active[is_active] if is_active is not None else None
+        
+        for index in range(start, len(order)):
+            created_at, email = order[index]
+            if created_after is not None and created_at < created_after:
+                continue
+            if created_before is not None and created_at >= created_before:
+                break
+            if role_members is not None and email not in role_members:
+                continue
+            if active_members is not None and email not in active_members:
+                continue
+            yield self.users[email].to_profile()
+    
+    def list_page(self, limit: int = 50, cursor: Optional[str] = None,
+                  **filters: Any) -> Tuple[List[UserProfile], Optional[str]]:
+        """Return one page of users and the cursor for the next page (None at the end)"""
+        after_key = _decode_cursor(cursor) if cursor else None
+        page = list(islice(self.iter_users(after_key=after_key, **filters), limit + 1))
+        if len(page) <= limit:
+            return page, None
+        page = page[:limit]
+        return page, _encode_cursor(page[-1])
+
+
+class PersistentUserService(UserService):
+    """UserService persisted to SQLite with write-behind batching
+    
+    The in-memory indexes act as the read cache and answer every query. Writes
+    update them immediately, are coalesced per email in a pending queue and
+    flushed to the repository in one transaction per batch. The same loop pulls
+    rows committed by other workers, so every process converges.
+    """
+    
+    def __init__(self, repository: UserRepository, flush_interval: float = 1.0, batch_size: int = 500):
+        super().__init__()
+        self.repository = repository
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending: Dict[str, Optional[UserRecord]] = {}  # None marks a delete
+        self._seq = 0
+        self._own_seqs: Set[int] = set()  # batches this process wrote that sync has not passed yet
+        self._flush_lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
+    
+    @property
+    def pending(self) -> int:
+        """Number of writes not yet flushed"""
+        return len(self._pending)
+    
+    def load(self):
+        """Replace the in-memory users with the stored ones"""
+        users, self._seq = self.repository.load_all()
+        self._own_seqs.clear()
+        self._rebuild(users)
+        self._pending.clear()
+        logger.info(f"Loaded {len(users)} users from {self.repository.path}")
+    
+    def _store(self, user: UserRecord, previous: Optional[UserRecord] = None):
+        super()._store(user, previous)
+        if previous is not None and previous.email != user.email:
+            self._pending[previous.email] = None
+        self._pending[user.email] = user
+        if len(self._pending) >= self.batch_size:
+            self._wake.set()
+    
+    async def flush(self) -> int:
+        """Write all pending changes in one transaction; returns how many"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            upserts = [user for user in batch.values() if user is not None]
+            deletes = [email for email, user in batch.items() if user is None]
+            try:
+                seq = await asyncio.to_thread(self.repository.write_batch, upserts, deletes)
+            except Exception:
+                # Requeue; anything written since is newer and wins
+                self._pending = {**batch, **self._pending}
+                raise
+            # Already applied here; sync() only needs other processes' batches
+            self._own_seqs.add(seq)
+            return len(batch)
+    
+    async def sync(self) -> int:
+        """Apply rows committed by other processes; returns how many changed"""
+        users, deleted, self._seq = await asyncio.to_thread(
+            self.repository.changed_since, self._seq, list(self._own_seqs)
+        )
+        self._own_seqs = {seq for seq in self._own_seqs if seq > self._seq}
+        applied = 0
+        for user in users:
+            # Local unflushed writes are newer than anything in the table
+            if user.email not in self._pending:
+                UserService._store(self, user, self.users.get(user.email))
+                applied += 1
+        for email in deleted:
+            if email not in self._pending and email in self.users:
+                self._unindex(self.users[email])
+                applied += 1
+        return applied
+    
+    def start(self):
+        """Load stored users and start the flush loop"""
+        self.load()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+    
+    async def stop(self):
+        """Stop the flush loop, write what is left and close the store"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
+        self.repository.close()
+    
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+                await self.sync()
+            except Exception as e:
+                logger.error(f"User store flush failed: {e}")
+
+
+def create_user_service(kind: str, path: Optional[str] = None, flush_interval: float = 1.0,
+                        batch_size: int = 500) -> UserService:
+    """Build the configured user service ("memory" or "sqlite")"""
+    if kind == "memory":
+        return UserService()
+    if kind == "sqlite":
+        if not path:
+            raise ValueError("The sqlite user backend needs a database path")
+        return PersistentUserService(UserRepository(path), flush_interval, batch_size)
+    raise ValueError(f"Unknown user backend: {kind}")
+
+
+_user_list_adapter = TypeAdapter(List[UserProfile])
+
+
+def _encode_cursor(user: UserProfile) -> str:
+    raw = f"{user.created_at.isoformat()}|{user.email}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, email = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), email
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
 class HealthService:
     """Service for health monitoring"""
     
-    def __init__(self):
+    def __init__(self, check_interval: float = 30.0, check_timeout: float = 5.0,
+                 resource_interval: float = 10.0, max_rss_mb: int = 450,
+                 min_disk_free_mb: int = 100, disk_path: str = ".",
+                 check_initial_delay: float = 0.0):
         self.start_time = datetime.now()
+        self.scheduler = CheckScheduler()
+        # Delayed so loading httpx and the first outbound call don't compete with the first page
+        self.scheduler.register("external_api", self._check_external_api,
+                                interval=check_interval, timeout=check_timeout,
+                                initial_delay=check_initial_delay)
+        self.scheduler.register("memory", partial(memory_check, max_rss_mb * MB),
+                                interval=resource_interval)
+        self.scheduler.register("disk", partial(disk_check, disk_path, min_disk_free_mb * MB),
+                                interval=resource_interval)
     
     def get_health_status(self) -> HealthCheck:
         """Get current health status"""
@@ -158,26 +520,146 @@ class HealthService:
             uptime=uptime
         )
     
+    async def _check_external_api(self) -> Tuple[bool, str]:
+        async with ApiService(http_pool) as api_service:
+            result = await api_service.test_connection()
+            return result.success, result.message
+    
     async def check_dependencies(self) -> Dict[str, bool]:
-        """Check health of external dependencies"""
-        checks = {}
-        
-        # Check external API
-        try:
-            async with ApiService() as api_service:
-                result = await api_service.test_connection()
-                checks["external_api"] = result.success
-        except Exception:
-            checks["external_api"] = False
-        
-        # Add more dependency checks as needed
-        checks["memory"] = True  # Placeholder
-        checks["disk"] = True   # Placeholder
-        
-        return checks
+        """Run every dependency check now, concurrently, and cache the results"""
+        results = await self.scheduler.run_all()
+        return {name: result.healthy for name, result in results.items()}
+    
+    def get_readiness(self) -> Dict[str, Any]:
+        """Cached dependency status from the scheduler; never performs I/O"""
+        snapshot = self.scheduler.snapshot()
+        complete = len(snapshot) == len(self.scheduler.names)
+        checked_at = max((result.checked_at for result in snapshot.values()), default=None)
+        return {
+            "ready": complete and all(result.healthy for result in snapshot.values()),
+            "checks": {name: result.healthy for name, result in snapshot.items()},
+            # Registered checks that have not reported yet (e.g. during their initial delay)
+            "pending": [name for name in self.scheduler.names if name not in snapshot],
+            "details": {name: check_result_dict(result) for name, result in snapshot.items()},
+            "checked_at": datetime.fromtimestamp(checked_at).isoformat() if checked_at else None,
+            "circuits": api_breakers.metrics(),
+        }
+    
+    def start(self):
+        """Start running dependency checks in the background"""
+        self.scheduler.start()
+    
+    async def stop(self):
+        """Stop the background checks"""
+        await self.scheduler.stop()
 
 
 # Global service instances
-data_service = DataService()
-user_service = UserService()
-health_service = HealthService()
\ No newline at end of file
+api_retry_policy = RetryPolicy(
+    max_attempts=settings.api_retry_attempts,
+    base_delay=settings.api_retry_base_delay,
+    max_delay=settings.api_retry_max_delay,
+    deadline=settings.api_retry_deadline,
+    retryable=is_transient,
+)
+api_response_cache = ResponseCache(
+    max_entries=settings.api_cache_max_entries,
+    max_bytes=settings.api_cache_max_bytes,
+    default_ttl=settings.api_cache_default_ttl,
+    revalidate_window=settings.api_cache_revalidate_window,
+)
+api_breakers = BreakerRegistry(
+    failure_threshold=settings.api_breaker_failure_threshold,
+    recovery_timeout=settings.api_breaker_recovery_timeout,
+    is_failure=is_transient,
+)
+http_pool = HttpClientPool(
+    max_connections=settings.http_max_connections,
+    max_keepalive_connections=settings.http_max_keepalive_connections,
+    keepalive_expiry=settings.http_keepalive_expiry,
+    per_host_limit=settings.http_per_host_limit,
+    http2=settings.http2,
+    timeout=settings.http_timeout,
+)
+data_service = DataService(TTLCache(
+    max_entries=settings.cache_max_entries,
+    max_bytes=settings.cache_max_bytes,
+    default_ttl=settings.cache_default_ttl,
+    sweep_interval=settings.cache_sweep_interval,
+))
+user_service = create_user_service(
+    settings.user_backend,
+    settings.user_db_path,
+    flush_interval=settings.user_flush_interval,
+    batch_size=settings.user_flush_batch_size,
+)
+state_store = StateStore(
+    create_state_backend(settings.state_backend, settings.state_db_path),
+    idle_timeout=settings.state_idle_timeout,
+)
+health_service = HealthService(
+    check_interval=settings.health_check_interval,
+    check_timeout=settings.health_check_timeout,
+    check_initial_delay=settings.health_check_initial_delay,
+    resource_interval=settings.health_resource_interval,
+    max_rss_mb=settings.health_max_rss_mb,
+    min_disk_free_mb=settings.health_min_disk_free_mb,
+)
+
+
+# Metrics served on /metrics
+api_call_seconds = REGISTRY.histogram(
+    "api_call_seconds", "ApiService call latency in seconds", ["operation"]
+)
+REGISTRY.gauge(
+    "api_cache_hit_ratio", "Share of ApiService fetches answered from cached bodies",
+    function=api_response_cache.hit_ratio,
+)
+REGISTRY.gauge(
+    "api_circuit_open", "1 while an endpoint's circuit breaker is rejecting calls", ["endpoint"],
+    function=lambda: {(name,): float(state["state"] == "open") for name, state in api_breakers.metrics().items()},
+)
+
+
+def http_pool_host_samples(field: str):
+    """Per-host value of one HttpClientPool host stat, for a gauge labelled by host"""
+    return lambda: {(host,): float(stats[field]) for host, stats in http_pool.metrics()["hosts"].items()}
+
+
+REGISTRY.gauge(
+    "http_pool_in_flight", "Requests currently sent through the shared HTTP pool, per host", ["host"],
+    function=http_pool_host_samples("in_flight"),
+)
+REGISTRY.gauge(
+    "http_pool_waiting", "Requests queued on a host's concurrency limit", ["host"],
+    function=http_pool_host_samples("waiting"),
+)
+REGISTRY.gauge(
+    "http_pool_open_connections", "Connections the shared HTTP pool holds open, per host", ["host"],
+    function=http_pool_host_samples("open_connections"),
+)
+REGISTRY.gauge(
+    "http_pool_saturation", "In-flight requests as a share of the pool's max_connections",
+    function=lambda: http_pool.metrics()["saturation"],
+)
+REGISTRY.gauge(
+    "data_cache_entries", "Entries in the DataService cache",
+    function=lambda: len(data_service.cache),
+)
+REGISTRY.counter(
+    "data_cache_hits_total", "DataService cache lookups answered from the cache",
+    function=lambda: data_service.cache.stats.hits,
+)
+REGISTRY.counter(
+    "data_cache_misses_total", "DataService cache lookups that had to compute the value",
+    function=lambda: data_service.cache.stats.misses,
+)
+REGISTRY.counter(
+    "data_cache_evictions_total", "DataService cache entries evicted to stay within its bounds",
+    function=lambda: data_service.cache.stats.evictions,
+)
+REGISTRY.gauge(
+    "process_uptime_seconds", "Seconds since the app started",
+    function=lambda: health_service.get_health_status().uptime,
+)
+REGISTRY.gauge("process_resident_memory_bytes", "Resident set size of this process", function=rss_bytes)
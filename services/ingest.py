@@ -0,0 +1,194 @@
+"""Background ingestion of uploaded CSV/JSON datasets into ChartData"""
+import asyncio
+import csv
+import math
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Awaitable, BinaryIO, Callable, List, Optional, Sequence, Tuple
+
+from core.series import LabelColumn, SeriesLabels, downsample_indices, take
+from models.schemas import ChartData
+from services.uploads import CHUNK_SIZE, UploadRejected, iter_json_rows, open_text
+
+
+Runner = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class IngestProgress:
+    """Rows parsed and bytes consumed so far"""
+    rows: int
+    bytes_read: int
+    total_bytes: int
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.bytes_read / self.total_bytes) if self.total_bytes else 1.0
+
+
+@dataclass
+class IngestResult:
+    """A parsed dataset and its downsampled view for charting"""
+    data: ChartData
+    chart: ChartData
+    rows: int
+    skipped: int
+
+
+class RowReader:
+    """Pulls rows from an upload in batches, each row normalized to a list"""
+
+    def __init__(self, source: BinaryIO, kind: str, chunk_size: int = CHUNK_SIZE):
+        self.bytes_read = 0
+        self.header: Optional[List[str]] = None
+        self.columns: Optional[Tuple[Optional[int], int]] = None
+        text = open_text(source, self._count, chunk_size)
+        if kind == "csv":
+            records = csv.reader(text)
+            self.header = next(records, None)
+            self._rows = records
+        elif kind == "json":
+            self._rows = (self._normalize(item) for item in iter_json_rows(text, chunk_size))
+        else:
+            raise UploadRejected(f"Cannot chart {kind.upper()} files")
+
+    def _count(self, chunk: bytes) -> None:
+        self.bytes_read += len(chunk)
+
+    def _normalize(self, item: Any) -> List[Any]:
+        if isinstance(item, dict):
+            if len(item) == 1 and self.header is None:
+                # A member of a top-level object: {label: value}
+                return list(next(iter(item.items())))
+            if self.header is None:
+                self.header = list(item)
+            return [item.get(key) for key in self.header]
+        if isinstance(item, (list, tuple)):
+            return list(item)
+        return [item]
+
+    def next_batch(self, size: int) -> List[List[Any]]:
+        """Up to `size` more rows; empty at the end"""
+        return list(islice(self._rows, size))
+
+    def next_values(self, size: int) -> Tuple[int, Optional[List[str]], array, int]:
+        """Read and convert up to `size` more rows: (rows, labels, values, skipped); 0 rows at the end.
+
+        Columns are chosen from the first row read.
+        """
+        batch = self.next_batch(size)
+        if not batch:
+            return 0, None, array('d'), 0
+        if self.columns is None:
+            self.columns = choose_columns(batch[0])
+        return (len(batch), *convert_rows(batch, *self.columns))
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return math.isfinite(value)
+    if isinstance(value, str):
+        try:
+            return math.isfinite(float(value))
+        except ValueError:
+            return False
+    return False
+
+
+def choose_columns(sample: Sequence[Any]) -> Tuple[Optional[int], int]:
+    """(label index or None, value index) for rows shaped like `sample`"""
+    value_index = next((i for i, value in enumerate(sample) if _is_number(value)), None)
+    if value_index is None:
+        raise UploadRejected("No numeric column found")
+    label_index = next((i for i, value in enumerate(sample)
+                        if i != value_index and value not in (None, "") and not _is_number(value)), None)
+    return label_index, value_index
+
+
+def convert_rows(rows: List[List[Any]], label_index: Optional[int],
+                 value_index: int) -> Tuple[Optional[List[str]], array, int]:
+    """Extract labels and float values from a batch; rows without a finite value are skipped"""
+    labels: Optional[List[str]] = [] if label_index is not None else None
+    values = array('d')
+    skipped = 0
+    for row in rows:
+        try:
+            value = float(row[value_index])
+        except (IndexError, TypeError, ValueError):
+            skipped += 1
+            continue
+        if not math.isfinite(value):
+            skipped += 1
+            continue
+        values.append(value)
+        if labels is not None:
+            labels.append(str(row[label_index]) if label_index < len(row) else "")
+    return labels, values, skipped
+
+
+class DatasetIngestor:
+    """Parses uploads into ChartData without blocking the event loop.
+
+    Rows are read, split and converted to floats in batches on `io_bound`;
+    shipping each batch to a worker process cost more than converting it
+    (python -m benchmarks.ingest). Only downsampling the finished series runs
+    on `cpu_bound` (NiceGUI's process pool in the app). Both default to a thread.
+    """
+
+    def __init__(self, io_bound: Optional[Runner] = None, cpu_bound: Optional[Runner] = None,
+                 batch_rows: int = 20000, max_points: int = 500, method: str = "lttb"):
+        self.io_bound = io_bound or asyncio.to_thread
+        self.cpu_bound = cpu_bound or asyncio.to_thread
+        self.batch_rows = batch_rows
+        self.max_points = max_points
+        self.method = method
+
+    async def ingest(self, source: BinaryIO, kind: str,
+                     on_progress: Optional[Callable[[IngestProgress], Any]] = None,
+                     title: Optional[str] = None) -> IngestResult:
+        """Parse a validated upload (see inspect_upload) into chart data"""
+        total_bytes = source.seek(0, 2)
+        source.seek(0)
+        try:
+            reader = await self.io_bound(RowReader, source, kind)
+            labels: Optional[LabelColumn] = None
+            values = array('d')
+            rows = skipped = 0
+            while True:
+                batch_rows, batch_labels, batch_values, batch_skipped = await self.io_bound(
+                    reader.next_values, self.batch_rows
+                )
+                if not batch_rows:
+                    break
+                values.extend(batch_values)
+                if batch_labels is not None:
+                    if labels is None:
+                        labels = LabelColumn()
+                    labels.extend(batch_labels)
+                rows += batch_rows
+                skipped += batch_skipped
+                if on_progress is not None:
+                    on_progress(IngestProgress(rows, reader.bytes_read, total_bytes))
+        except UploadRejected:
+            raise
+        except (csv.Error, ValueError) as e:
+            raise UploadRejected(f"Could not parse {kind.upper()}: {e}") from e
+        finally:
+            source.seek(0)
+
+        if not values:
+            raise UploadRejected("No numeric rows found")
+        # Rows were parsed to floats above; no need to validate them again
+        data = ChartData.trusted(
+            labels=labels if labels is not None else SeriesLabels(len(values), "Row"),
+            values=values,
+            title=title,
+        )
+        indices = await self.cpu_bound(downsample_indices, values, self.max_points, self.method)
+        chart = data
+        if len(indices) < len(values):
+            chart = ChartData.trusted(labels=take(data.labels, indices), values=take(values, indices), title=title)
+        return IngestResult(data, chart, rows, skipped)
@@ -0,0 +1,133 @@
+"""Per-client toast rate limiting, duplicate coalescing and bounded history"""
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from core.metrics import REGISTRY
+
+
+notifications_total = REGISTRY.counter(
+    "notifications_total", "Notification requests by outcome", ["status"]
+)
+
+Show = Callable[[str, str, str], None]
+
+SHOWN = "shown"
+COALESCED = "coalesced"
+RATE_LIMITED = "rate_limited"
+SUPPRESSED = "suppressed"
+
+
+@dataclass
+class Notification:
+    """One notification request and what happened to it"""
+    client_id: str
+    message: str
+    type: str
+    status: str
+    count: int = 1
+    at: float = 0.0  # wall-clock epoch seconds
+
+
+class _ClientState:
+    __slots__ = ("tokens", "refilled_at", "last_key", "last_shown_at", "pending", "flush")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.refilled_at = now
+        self.last_key: Optional[Tuple[str, str]] = None
+        self.last_shown_at = 0.0
+        self.pending = 0
+        self.flush: Optional[asyncio.TimerHandle] = None
+
+
+class NotificationService:
+    """Decides which toasts reach each client and records every request.
+
+    - Clients that are still rendering their first page (no socket yet) get
+      no toasts at all.
+    - Repeats of the last shown message within `coalesce_window` seconds are
+      held back and shown once at the end of the window as "message (+N more)".
+    - Each client has a token bucket of `burst` toasts refilled at `rate` per
+      second; toasts beyond it are dropped.
+
+    Every request, shown or not, is appended to `history` (a bounded deque).
+    """
+
+    def __init__(self, show: Show, history: Optional[Deque[Notification]] = None,
+                 rate: float = 1.0, burst: int = 3, coalesce_window: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.show = show
+        self.history: Deque[Notification] = history if history is not None else deque(maxlen=100)
+        self.rate = rate
+        self.burst = burst
+        self.coalesce_window = coalesce_window
+        self._clock = clock
+        self._clients: Dict[str, _ClientState] = {}
+
+    def notify(self, client_id: str, message: str, type: str = "info", ready: bool = True) -> str:
+        """Show `message` to one client if policy allows; returns the outcome"""
+        if not ready:
+            return self._record(client_id, message, type, SUPPRESSED)
+
+        now = self._clock()
+        state = self._clients.get(client_id)
+        if state is None:
+            state = self._clients[client_id] = _ClientState(self.burst, now)
+
+        key = (message, type)
+        if key == state.last_key and now - state.last_shown_at < self.coalesce_window:
+            state.pending += 1
+            if state.flush is None:
+                delay = state.last_shown_at + self.coalesce_window - now
+                state.flush = asyncio.get_running_loop().call_later(delay, self._flush, client_id)
+            return self._record(client_id, message, type, COALESCED)
+
+        if not self._take_token(state, now):
+            return self._record(client_id, message, type, RATE_LIMITED)
+        self._cancel_pending(state)
+        state.last_key, state.last_shown_at = key, now
+        self.show(client_id, message, type)
+        return self._record(client_id, message, type, SHOWN)
+
+    def forget(self, client_id: str) -> None:
+        """Drop a disconnected client's limiter state"""
+        state = self._clients.pop(client_id, None)
+        if state is not None:
+            self._cancel_pending(state)
+
+    def _take_token(self, state: _ClientState, now: float) -> bool:
+        state.tokens = min(self.burst, state.tokens + (now - state.refilled_at) * self.rate)
+        state.refilled_at = now
+        if state.tokens < 1:
+            return False
+        state.tokens -= 1
+        return True
+
+    def _cancel_pending(self, state: _ClientState) -> None:
+        # A different message supersedes held-back repeats of the previous one
+        if state.flush is not None:
+            state.flush.cancel()
+            state.flush = None
+        state.pending = 0
+
+    def _flush(self, client_id: str) -> None:
+        state = self._clients.get(client_id)
+        if state is None or not state.pending or state.last_key is None:
+            return
+        message, type = state.last_key
+        count, state.pending, state.flush = state.pending, 0, None
+        now = self._clock()
+        if not self._take_token(state, now):
+            self._record(client_id, message, type, RATE_LIMITED, count)
+            return
+        state.last_shown_at = now
+        self.show(client_id, f"{message} (+{count} more)", type)
+        self._record(client_id, message, type, SHOWN, count)
+
+    def _record(self, client_id: str, message: str, type: str, status: str, count: int = 1) -> str:
+        notifications_total.inc(status=status)
+        self.history.append(Notification(client_id, message, type, status, count, time.time()))
+        return status
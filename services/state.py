@@ -0,0 +1,256 @@
+"""Per-session UI state with pluggable storage backends"""
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from core.sqlite import ThreadConnections
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_FIELDS = ("counter", "user_name", "selected_theme")
+INTEGER_FIELDS = ("counter",)
+
+
+class SessionState:
+    """State of one visitor's session"""
+    __slots__ = ("counter", "user_name", "selected_theme", "last_seen")
+
+    def __init__(self, counter: int = 0, user_name: str = "", selected_theme: str = "blue",
+                 last_seen: float = 0.0):
+        self.counter = counter
+        self.user_name = user_name
+        self.selected_theme = selected_theme
+        self.last_seen = last_seen
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict of the state fields"""
+        return {field: getattr(self, field) for field in STATE_FIELDS}
+
+
+def _check_field(field: str, integer: bool = False) -> None:
+    if field not in STATE_FIELDS:
+        raise ValueError(f"Unknown state field: {field}")
+    if integer and field not in INTEGER_FIELDS:
+        raise ValueError(f"State field is not numeric: {field}")
+
+
+class StateBackend(ABC):
+    """Storage for session state keyed by session id"""
+
+    # Calls may wait on I/O or locks held by other processes
+    blocking = False
+
+    @abstractmethod
+    def load(self, session_id: str) -> SessionState:
+        """Return the session's state, creating defaults if it is new"""
+
+    @abstractmethod
+    def update(self, session_id: str, **fields: Any) -> SessionState:
+        """Overwrite the given fields"""
+
+    @abstractmethod
+    def increment(self, session_id: str, field: str, delta: int) -> int:
+        """Atomically add `delta` to a numeric field and return the new value"""
+
+    @abstractmethod
+    def evict_idle(self, max_idle: float) -> int:
+        """Drop sessions idle for longer than `max_idle` seconds"""
+
+    def close(self) -> None:
+        """Release backend resources"""
+
+
+class MemoryStateBackend(StateBackend):
+    """In-process backend; only valid while the app runs as a single process"""
+
+    def __init__(self, clock=time.monotonic):
+        self._sessions: Dict[str, SessionState] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _get(self, session_id: str) -> SessionState:
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = self._sessions[session_id] = SessionState()
+        state.last_seen = self._clock()
+        return state
+
+    def load(self, session_id: str) -> SessionState:
+        with self._lock:
+            return self._get(session_id)
+
+    def update(self, session_id: str, **fields: Any) -> SessionState:
+        for field in fields:
+            _check_field(field)
+        with self._lock:
+            state = self._get(session_id)
+            for field, value in fields.items():
+                setattr(state, field, value)
+            return state
+
+    def increment(self, session_id: str, field: str, delta: int) -> int:
+        _check_field(field, integer=True)
+        with self._lock:
+            state = self._get(session_id)
+            value = getattr(state, field) + delta
+            setattr(state, field, value)
+            return value
+
+    def evict_idle(self, max_idle: float) -> int:
+        cutoff = self._clock() - max_idle
+        with self._lock:
+            idle = [sid for sid, state in self._sessions.items() if state.last_seen < cutoff]
+            for sid in idle:
+                del self._sessions[sid]
+        return len(idle)
+
+
+class SQLiteStateBackend(StateBackend):
+    """Out-of-process backend shared by every worker through one SQLite file.
+
+    Updates are single SQL statements, so concurrent increments from several
+    processes never lose writes. WAL mode lets readers proceed during writes.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        self.path = path
+        self._connections = ThreadConnections(path, busy_timeout)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_state ("
+            " session_id TEXT PRIMARY KEY,"
+            " counter INTEGER NOT NULL DEFAULT 0,"
+            " user_name TEXT NOT NULL DEFAULT '',"
+            " selected_theme TEXT NOT NULL DEFAULT 'blue',"
+            " last_seen REAL NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def _upsert(self, session_id: str, values: Dict[str, Any], increment: bool = False) -> SessionState:
+        # One statement per call: insert defaults or update the existing row
+        columns = "".join(f", {field}" for field in values)
+        placeholders = ", ?" * len(values)
+        if increment:
+            assignments = "".join(f", {field} = {field} + excluded.{field}" for field in values)
+        else:
+            assignments = "".join(f", {field} = excluded.{field}" for field in values)
+        row = self._conn().execute(
+            f"INSERT INTO session_state (session_id, last_seen{columns}) VALUES (?, ?{placeholders}) "
+            f"ON CONFLICT(session_id) DO UPDATE SET last_seen = excluded.last_seen{assignments} "
+            "RETURNING counter, user_name, selected_theme, last_seen",
+            (session_id, time.time(), *values.values()),
+        ).fetchone()
+        return SessionState(*row)
+
+    def load(self, session_id: str) -> SessionState:
+        return self._upsert(session_id, {})
+
+    def update(self, session_id: str, **fields: Any) -> SessionState:
+        for field in fields:
+            _check_field(field)
+        return self._upsert(session_id, fields)
+
+    def increment(self, session_id: str, field: str, delta: int) -> int:
+        _check_field(field, integer=True)
+        return getattr(self._upsert(session_id, {field: delta}, increment=True), field)
+
+    def evict_idle(self, max_idle: float) -> int:
+        cursor = self._conn().execute(
+            "DELETE FROM session_state WHERE last_seen < ?", (time.time() - max_idle,)
+        )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._connections.close_all()
+
+
+class StateStore:
+    """Session state facade with periodic idle eviction.
+
+    Blocking backends run on one worker thread, off the event loop; a single
+    thread keeps each session's writes in the order they were made.
+    """
+
+    def __init__(self, backend: StateBackend, idle_timeout: float = 3600.0,
+                 eviction_interval: float = 300.0):
+        self.backend = backend
+        self.idle_timeout = idle_timeout
+        self.eviction_interval = eviction_interval
+        self._evictor: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self.backend.blocking:
+            return func(*args, **kwargs)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    async def get(self, session_id: str) -> SessionState:
+        """Get a session's state"""
+        return await self._run(self.backend.load, session_id)
+
+    async def set(self, session_id: str, **fields: Any) -> SessionState:
+        """Set fields of a session's state"""
+        return await self._run(self.backend.update, session_id, **fields)
+
+    async def increment(self, session_id: str, field: str, delta: int = 1) -> int:
+        """Atomically add to a numeric field"""
+        return await self._run(self.backend.increment, session_id, field, delta)
+
+    def start(self) -> None:
+        """Start periodic eviction of idle sessions"""
+        if self._evictor is None or self._evictor.done():
+            self._evictor = asyncio.get_running_loop().create_task(self._evict_loop())
+
+    async def stop(self) -> None:
+        """Stop eviction and close the backend"""
+        if self._evictor is not None:
+            self._evictor.cancel()
+            try:
+                await self._evictor
+            except asyncio.CancelledError:
+                pass
+            self._evictor = None
+        if self._executor is not None:
+            # Queued writes finish before the connections close
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+        self.backend.close()
+
+    async def _evict_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.eviction_interval)
+            try:
+                evicted = await self._run(self.backend.evict_idle, self.idle_timeout)
+                if evicted:
+                    logger.info(f"Evicted {evicted} idle sessions")
+            except Exception as e:
+                logger.error(f"Session eviction failed: {e}")
+
+
+def create_state_backend(kind: str, path: Optional[str] = None) -> StateBackend:
+    """Build the configured backend ("memory" or "sqlite")"""
+    if kind == "memory":
+        return MemoryStateBackend()
+    if kind == "sqlite":
+        if not path:
+            raise ValueError("The sqlite state backend needs a database path")
+        return SQLiteStateBackend(path)
+    raise ValueError(f"Unknown state backend: {kind}")
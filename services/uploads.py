@@ -0,0 +1,312 @@
+"""Streaming validation and preview of uploaded files"""
+import csv
+import io
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Sequence
+
+from annotated_types import Le
+from pydantic import ValidationError
+
+from models.schemas import FileUpload
+
+
+CHUNK_SIZE = 64 * 1024
+# Longest single JSON row (array item or object member value) an upload may contain
+MAX_JSON_VALUE_CHARS = 1_000_000
+_NON_WHITESPACE = re.compile(r"\S")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class UploadRejected(ValueError):
+    """An upload failed validation or could not be parsed"""
+
+
+def schema_max_bytes() -> int:
+    """Upper size bound declared on FileUpload.size"""
+    for constraint in FileUpload.model_fields["size"].metadata:
+        if isinstance(constraint, Le):
+            return constraint.le
+    raise RuntimeError("FileUpload.size has no upper bound")
+
+
+@dataclass
+class UploadSummary:
+    """What was learned about an upload while streaming through it"""
+    upload: FileUpload
+    kind: str
+    rows: int = 0
+    columns: List[str] = field(default_factory=list)
+    preview: List[Any] = field(default_factory=list)
+
+
+class UploadValidator:
+    """Checks an upload against FileUpload as its bytes arrive"""
+
+    def __init__(self, filename: str, content_type: str, max_bytes: Optional[int] = None,
+                 allowed_extensions: Sequence[str] = (".txt", ".json", ".csv")):
+        try:
+            # Everything but the size can be validated before reading any data
+            FileUpload(filename=filename, content_type=content_type, size=1)
+        except ValidationError as e:
+            raise UploadRejected(e.errors()[0]["msg"]) from e
+        self.extension = os.path.splitext(filename)[1].lower()
+        if self.extension not in allowed_extensions:
+            raise UploadRejected(f"File type {self.extension or '(none)'} is not allowed")
+        self.filename = filename
+        self.content_type = content_type
+        self.max_bytes = min(max_bytes or schema_max_bytes(), schema_max_bytes())
+        self.size = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Account for the next chunk; raises as soon as a limit is crossed"""
+        if self.size == 0 and b"\x00" in chunk[:1024]:
+            raise UploadRejected("Binary content is not allowed")
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadRejected(f"File is larger than {self.max_bytes} bytes")
+
+    def finish(self) -> FileUpload:
+        """Validate the complete upload"""
+        if self.size == 0:
+            raise UploadRejected("File is empty")
+        try:
+            return FileUpload(filename=self.filename, content_type=self.content_type, size=self.size)
+        except ValidationError as e:
+            raise UploadRejected(e.errors()[0]["msg"]) from e
+
+
+class MeteredReader(io.RawIOBase):
+    """Raw stream that hands every chunk read to a callback (validation, progress)"""
+
+    def __init__(self, source: BinaryIO, on_chunk: Callable[[bytes], None]):
+        self.source = source
+        self.on_chunk = on_chunk
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.source.read(len(buffer))
+        self.on_chunk(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def open_text(source: BinaryIO, on_chunk: Callable[[bytes], None],
+              chunk_size: int = CHUNK_SIZE) -> io.TextIOWrapper:
+    """UTF-8 text view of a binary upload, read `chunk_size` bytes at a time"""
+    reader = io.BufferedReader(MeteredReader(source, on_chunk), chunk_size)
+    return io.TextIOWrapper(reader, encoding="utf-8", errors="replace", newline="")
+
+
+class _ValueScanner:
+    """Finds where a JSON container or string ends, one chunk at a time.
+
+    Only string and nesting state is kept, so every character is looked at once
+    no matter how many chunks the value spans.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        """Scan the next piece of the value; True once it is complete"""
+        i = 0
+        if self.escaped:
+            i, self.escaped = 1, False
+        while True:
+            if self.in_string:
+                match = _STRING_SPECIAL.search(text, i)
+                if match is None:
+                    return False
+                i = match.end()
+                if match.group() == "\\":
+                    if i == len(text):
+                        self.escaped = True
+                        return False
+                    i += 1
+                    continue
+                self.in_string = False
+                if self.depth == 0:
+                    return True
+            else:
+                match = _STRUCTURAL.search(text, i)
+                if match is None:
+                    return False
+                i = match.end()
+                char = match.group()
+                if char == '"':
+                    self.in_string = True
+                elif char in "[{":
+                    self.depth += 1
+                else:
+                    self.depth -= 1
+                    if self.depth <= 0:
+                        return True
+
+
+class _JsonTokens:
+    """Incremental reader of JSON values from a text stream.
+
+    Holds at most one value plus one chunk of text in memory; values longer
+    than `max_value_chars` are rejected.
+    """
+
+    def __init__(self, stream: io.TextIOBase, chunk_size: int = CHUNK_SIZE,
+                 max_value_chars: int = MAX_JSON_VALUE_CHARS):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_value_chars = max_value_chars
+        self.decoder = json.JSONDecoder()
+        self.text = ""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _too_long(self) -> ValueError:
+        return ValueError(f"A JSON value is longer than {self.max_value_chars} characters")
+
+    def _gather(self) -> None:
+        """Read until the container or string at `pos` is complete, then join its chunks once"""
+        parts = [self.text[self.pos:]]
+        size = len(parts[0])
+        scanner = _ValueScanner()
+        complete = scanner.feed(parts[0])
+        while not complete:
+            chunk = self.stream.read(self.chunk_size)
+            if not chunk:
+                break  # truncated; decoding reports where
+            size += len(chunk)
+            if size > self.max_value_chars + self.chunk_size:
+                raise self._too_long()
+            parts.append(chunk)
+            complete = scanner.feed(chunk)
+        self.text = "".join(parts)
+        self.pos = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or '' at the end"""
+        while True:
+            match = _NON_WHITESPACE.search(self.text, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.text[self.pos]
+            self.pos = len(self.text)
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        # Containers and strings spanning chunks are gathered whole and decoded once;
+        # only scalars (numbers, literals) are retried chunk by chunk
+        nested = self.peek() in ("[", "{", '"')
+        gathered = False
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if nested and not gathered:
+                    self._gather()
+                    gathered = True
+                    continue
+                if gathered or not self._fill():
+                    raise
+                if len(self.text) > self.max_value_chars + self.chunk_size:
+                    raise self._too_long() from None
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if not nested and end == len(self.text) and self._fill():
+                continue
+            if end - self.pos > self.max_value_chars:
+                raise self._too_long()
+            self.pos = end
+            return value
+
+
+def iter_json_rows(stream: io.TextIOBase, chunk_size: int = CHUNK_SIZE,
+                   max_value_chars: int = MAX_JSON_VALUE_CHARS) -> Iterator[Any]:
+    """Yield array items, or {key: value} per object member, without loading the document"""
+    tokens = _JsonTokens(stream, chunk_size, max_value_chars)
+    opening = tokens.peek()
+    if opening and opening in "[{":
+        closing = "]" if opening == "[" else "}"
+        tokens.pos += 1
+        if tokens.peek() == closing:
+            tokens.pos += 1
+        else:
+            while True:
+                if opening == "[":
+                    yield tokens.value()
+                else:
+                    key = tokens.value()
+                    if not isinstance(key, str):
+                        raise ValueError("Object keys must be strings")
+                    tokens.expect(":")
+                    yield {key: tokens.value()}
+                separator = tokens.peek()
+                tokens.pos += 1
+                if separator == closing:
+                    break
+                if separator != ",":
+                    raise ValueError(f"Expected ',' or '{closing}'")
+    elif opening:
+        yield tokens.value()
+    if tokens.peek():
+        raise ValueError("Extra data after the JSON document")
+
+
+def inspect_upload(source: BinaryIO, filename: str, content_type: str,
+                   max_bytes: Optional[int] = None,
+                   allowed_extensions: Sequence[str] = (".txt", ".json", ".csv"),
+                   preview_rows: int = 5, chunk_size: int = CHUNK_SIZE) -> UploadSummary:
+    """Validate and summarize an upload in one streaming pass.
+
+    `source` is read in `chunk_size` pieces and rewound afterwards so later
+    stages can read it again. Blocking; run it off the event loop.
+    """
+    validator = UploadValidator(filename, content_type, max_bytes, allowed_extensions)
+    text = open_text(source, validator.feed, chunk_size)
+    kind = validator.extension.lstrip(".")
+    rows, columns, preview = 0, [], []
+    try:
+        if kind == "csv":
+            records = csv.reader(text)
+            columns = next(records, [])
+            for record in records:
+                if rows < preview_rows:
+                    preview.append(record)
+                rows += 1
+        elif kind == "json":
+            for item in iter_json_rows(text, chunk_size):
+                if rows < preview_rows:
+                    preview.append(item)
+                rows += 1
+        else:
+            for line in text:
+                if rows < preview_rows:
+                    preview.append(line.rstrip("\r\n"))
+                rows += 1
+    except UploadRejected:
+        raise
+    except (csv.Error, ValueError) as e:
+        raise UploadRejected(f"Could not parse {kind.upper()}: {e}") from e
+    finally:
+        text.detach()
+        source.seek(0)
+    return UploadSummary(validator.finish(), kind, rows, columns, preview)
@@ -0,0 +1,149 @@
+"""Compact user records and their SQLite storage"""
+import sqlite3
+from datetime import datetime
+from typing import Collection, Iterable, List, Optional, Tuple, Union
+
+from core.sqlite import ThreadConnections
+from models.schemas import UserProfile, UserRole
+
+
+COLUMNS = ("email", "name", "role", "created_at", "is_active")
+
+
+class UserRecord:
+    """An already-validated user as held in memory.
+
+    Slots instead of a pydantic model's `__dict__` and fields-set cut the
+    per-user overhead by an order of magnitude; `role` and `is_active` point
+    at shared singletons. Services convert to `UserProfile` only when handing
+    users out (see `to_profile`).
+    """
+
+    __slots__ = COLUMNS
+
+    def __init__(self, email: str, name: str, role: UserRole, created_at: datetime, is_active: bool = True):
+        self.email = email
+        self.name = name
+        self.role = role
+        self.created_at = created_at
+        self.is_active = is_active
+
+    @classmethod
+    def from_profile(cls, user: UserProfile) -> "UserRecord":
+        return cls(user.email, user.name, user.role, user.created_at, user.is_active)
+
+    def to_profile(self) -> UserProfile:
+        """The API model for this record, built without revalidation"""
+        return UserProfile.model_construct(
+            email=self.email,
+            name=self.name,
+            role=self.role,
+            created_at=self.created_at,
+            is_active=self.is_active,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, UserRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in COLUMNS)
+
+    def __repr__(self) -> str:
+        return f"UserRecord(email={self.email!r}, name={self.name!r}, role={self.role.value!r})"
+
+
+def to_row(user: Union[UserRecord, UserProfile]) -> Tuple:
+    """Column values of a record or profile, in COLUMNS order"""
+    return (user.email, user.name, user.role.value, user.created_at.isoformat(), int(user.is_active))
+
+
+def from_row(row: Tuple) -> UserRecord:
+    """Rebuild a record from a stored row without revalidating it"""
+    email, name, role, created_at, is_active = row[:5]
+    return UserRecord(email, name, UserRole(role), datetime.fromisoformat(created_at), bool(is_active))
+
+
+class UserRepository:
+    """User table in one SQLite file, shared by every worker.
+
+    Each write batch runs in a single IMMEDIATE transaction and stamps its rows
+    with the next `seq`, so readers can pull exactly the rows committed since
+    the last sequence number they saw.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 5.0):
+        self.path = path
+        self._connections = ThreadConnections(path, busy_timeout)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            " email TEXT PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " role TEXT NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " is_active INTEGER NOT NULL,"
+            " deleted INTEGER NOT NULL DEFAULT 0,"
+            " seq INTEGER NOT NULL DEFAULT 0)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS users_seq ON users (seq)")
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._connections.get()
+
+    def load_all(self) -> Tuple[List[UserRecord], int]:
+        """Every stored record and the current sequence number"""
+        users, _, seq = self.changed_since(-1)
+        return users, seq
+
+    def changed_since(self, seq: int, skip: Collection[int] = ()) -> Tuple[List[UserRecord], List[str], int]:
+        """Records written and emails deleted after `seq`, plus the newest seq seen.
+
+        Batches whose seq is in `skip` (the caller's own writes) are left out
+        but still count as seen.
+        """
+        skip = [batch for batch in skip if batch > seq]
+        excluded = f" AND seq NOT IN ({', '.join('?' * len(skip))})" if skip else ""
+        rows = self._conn().execute(
+            f"SELECT {', '.join(COLUMNS)}, deleted, seq FROM users WHERE seq > ?{excluded} ORDER BY seq",
+            (seq, *skip),
+        ).fetchall()
+        latest = max([rows[-1][-1] if rows else max(seq, 0), *skip])
+        users = [from_row(row) for row in rows if not row[5]]
+        deleted = [row[0] for row in rows if row[5]]
+        return users, deleted, latest
+
+    def get(self, email: str) -> Optional[UserProfile]:
+        """Read one profile straight from the table"""
+        row = self._conn().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM users WHERE email = ? AND NOT deleted", (email,)
+        ).fetchone()
+        return from_row(row).to_profile() if row else None
+
+    def write_batch(self, upserts: Iterable[Union[UserRecord, UserProfile]], deletes: Iterable[str] = ()) -> int:
+        """Apply a batch in one transaction; returns the batch's sequence number"""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            seq = conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM users").fetchone()[0]
+            # Deletes leave a tombstone so other workers see them in changed_since()
+            conn.executemany(
+                "UPDATE users SET deleted = 1, seq = ? WHERE email = ?", ((seq, email) for email in deletes)
+            )
+            conn.executemany(
+                f"INSERT INTO users ({', '.join(COLUMNS)}, seq) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(email) DO UPDATE SET name = excluded.name, role = excluded.role, "
+                "created_at = excluded.created_at, is_active = excluded.is_active, deleted = 0, seq = excluded.seq",
+                ((*to_row(user), seq) for user in upserts),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return seq
+
+    def count(self) -> int:
+        """Number of stored profiles"""
+        return self._conn().execute("SELECT COUNT(*) FROM users WHERE NOT deleted").fetchone()[0]
+
+    def close(self) -> None:
+        self._connections.close_all()
@@ -5,9 +5,26 @@ from unittest.mock import AsyncMock, MagicMock
 import tempfile
 import os
 
+from core.cache import TTLCache
 from services.business import DataService, UserService, HealthService, ApiService
 
 
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at zero"""
+    return FakeClock()
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
@@ -79,8 +96,7 @@ def mock_api_service():
 def mock_data_service():
     """Mock data service for testing"""
     service = MagicMock(spec=DataService)
-    service.cache = {}
-    service.cache_ttl = {}
+    service.cache = TTLCache()
     return service
 
 
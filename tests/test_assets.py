@@ -0,0 +1,80 @@
+"""Tests for the static asset build stage"""
+import gzip
+import os
+
+from core.assets import BUNDLES, AssetStore, accepted_encodings, build_assets, minify_css, minify_js
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content)
+
+
+class TestAssetBuild:
+    """Test cases for minification, fingerprinting and precompression"""
+
+    def test_minify_css(self):
+        """Comments and whitespace go; descendant pseudo-class spacing stays"""
+        source = "/* note */\n.a :hover ,\n.b > .c {\n    color : red;\n    margin: 0 auto;\n}\n"
+        assert minify_css(source) == ".a :hover,.b>.c{color :red;margin:0 auto}"
+
+    def test_minify_js_keeps_code_lines(self):
+        """Only indentation, blank lines and whole-line comments are removed"""
+        source = "// header\nconst a = 'http://x';\n\n    function f() {\n        return a; // tail\n    }\n"
+        assert minify_js(source) == "const a = 'http://x';\nfunction f() {\nreturn a; // tail\n}\n"
+
+    def test_minify_js_keeps_template_literals(self):
+        """Whitespace, blank lines and // inside multi-line template literals are string content"""
+        source = "const t = `a  \n    b\n\n  // c\n`;\n    const q = 'x`y';\n    // gone\n"
+        assert minify_js(source) == "const t = `a  \n    b\n\n  // c\n`;\nconst q = 'x`y';\n"
+
+    def test_build_fingerprints_and_precompresses(self, temp_dir):
+        """Hashed names change with content; gzip variants decode to the minified file"""
+        source, out = os.path.join(temp_dir, "static"), os.path.join(temp_dir, "static", "dist")
+        write(os.path.join(source, "css", "app.css"), ".a {\n    color: red;\n}\n")
+        write(os.path.join(source, "js", "utils.js"), "// util\nconst x = 1;\n")
+
+        manifest = build_assets(source, out, names=None)
+        assert list(manifest) == ["css/app.css", "js/utils.js"]
+        asset = manifest["css/app.css"]
+        assert asset.path.startswith("css/app.") and asset.path.endswith(".css")
+        with open(os.path.join(out, asset.path), "rb") as file:
+            content = file.read()
+        with open(os.path.join(out, asset.path + ".gz"), "rb") as file:
+            assert gzip.decompress(file.read()) == content == b".a{color:red}"
+
+        with open(os.path.join(out, manifest["js/utils.js"].path), "rb") as file:
+            assert file.read() == b"const x = 1;\n"
+
+        # Rebuilding picks up the manifest and skips the build output itself
+        assert build_assets(source, out, names=None) == manifest
+        write(os.path.join(source, "css", "app.css"), ".a { color: blue; }")
+        assert build_assets(source, out, names=None)["css/app.css"].path != asset.path
+
+    def test_default_bundles_are_linked_in_order(self, temp_dir):
+        """The shipped CSS and JS build by default and link as stylesheets, then deferred scripts"""
+        out = os.path.join(temp_dir, "dist")
+        store = AssetStore(out).load(build_assets("static", out))
+        assert set(store.manifest) == set(BUNDLES)
+
+        tags = store.head_html(BUNDLES).splitlines()
+        assert tags == [
+            f'<link rel="stylesheet" href="{store.url("css/custom.css")}">',
+            f'<link rel="stylesheet" href="{store.url("css/app.css")}">',
+            f'<script src="{store.url("js/utils.js")}" defer></script>',
+        ]
+
+    def test_store_negotiates_encoding(self, temp_dir):
+        """The precompressed variant is served only to clients that accept it"""
+        source, out = os.path.join(temp_dir, "src"), os.path.join(temp_dir, "out")
+        write(os.path.join(source, "app.css"), ".a { color: red; }")
+        store = AssetStore(out).load(build_assets(source, out, ["app.css"]))
+        path = store.url("app.css")[len("/assets/"):]
+
+        file, encoding, media_type = store.resolve(path, "gzip, deflate")
+        assert (encoding, str(file).endswith(".gz"), media_type) == ("gzip", True, "text/css; charset=utf-8")
+        assert store.resolve(path, "gzip;q=0")[1] is None
+        assert store.resolve(path)[1] is None
+        assert store.resolve("app.css") is None
+        assert accepted_encodings("br;q=0.5, gzip") == {"br": 0.5, "gzip": 1.0}
@@ -0,0 +1,100 @@
+"""Tests for the shared broadcast ticker"""
+import pytest
+import asyncio
+
+from core.broadcast import Broadcaster, diff
+
+
+class Source:
+    """Snapshot source that counts how often it is computed"""
+
+    def __init__(self, **values):
+        self.values = values
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return dict(self.values)
+
+
+def test_diff_keeps_new_and_changed_keys():
+    """Unchanged keys are left out of the delta"""
+    assert diff({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4}) == {"b": 3, "c": 4}
+    assert diff({"a": 1}, {"a": 1}) == {}
+
+
+class TestBroadcaster:
+    """Test cases for Broadcaster"""
+
+    @pytest.mark.asyncio
+    async def test_one_compute_per_tick_for_all_subscribers(self):
+        """Every subscriber gets the same delta from a single compute"""
+        source = Source(users="1", uptime="5s")
+        broadcaster = Broadcaster(source)
+        received = [[] for _ in range(50)]
+        for inbox in received:
+            broadcaster.subscribe(inbox.append)
+
+        await broadcaster.tick()
+        source.values["uptime"] = "6s"
+        await broadcaster.tick()
+        await broadcaster.tick()
+
+        assert source.calls == 3
+        assert all(inbox == [{"users": "1", "uptime": "5s"}, {"uptime": "6s"}] for inbox in received)
+
+    @pytest.mark.asyncio
+    async def test_late_subscribers_get_the_full_snapshot(self):
+        """A new subscriber starts from the last published values"""
+        broadcaster = Broadcaster(Source(users="3"))
+        await broadcaster.tick()
+        inbox = []
+        broadcaster.subscribe(inbox.append)
+        assert inbox == [{"users": "3"}]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_and_failing_subscribers(self):
+        """Unsubscribed and raising callbacks stop receiving updates"""
+        source = Source(value=0)
+        broadcaster = Broadcaster(source)
+        inbox = []
+        unsubscribe = broadcaster.subscribe(inbox.append)
+
+        def broken(changed):
+            raise RuntimeError("client gone")
+        broadcaster.subscribe(broken)
+
+        await broadcaster.tick()
+        assert len(broadcaster) == 1
+        unsubscribe()
+        source.values["value"] = 1
+        await broadcaster.tick()
+        assert inbox == [{"value": 0}]
+        assert len(broadcaster) == 0
+
+    def test_interval_adapts_to_subscriber_count(self):
+        """Fan-out is held under the budget between the interval bounds"""
+        broadcaster = Broadcaster(Source(), min_interval=1.0, max_interval=10.0, fanout_per_second=100)
+        assert broadcaster.interval() == 1.0
+        for _ in range(500):
+            broadcaster.subscribe(lambda changed: None)
+        assert broadcaster.interval() == 5.0
+        for _ in range(5000):
+            broadcaster.subscribe(lambda changed: None)
+        assert broadcaster.interval() == 10.0
+
+    @pytest.mark.asyncio
+    async def test_loop_idles_without_subscribers(self):
+        """Nothing is computed until someone subscribes"""
+        source = Source(value=1)
+        broadcaster = Broadcaster(source, min_interval=0.01)
+        broadcaster.start()
+        await asyncio.sleep(0.05)
+        assert source.calls == 0
+
+        inbox = []
+        broadcaster.subscribe(inbox.append)
+        await asyncio.sleep(0.05)
+        await broadcaster.stop()
+        assert source.calls >= 1
+        assert inbox == [{"value": 1}]
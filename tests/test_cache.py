@@ -0,0 +1,98 @@
+"""Tests for the TTL/LRU cache engine"""
+import pytest
+import asyncio
+
+from core.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test cases for TTLCache"""
+
+    def test_ttl_expiry(self, clock):
+        """Entries expire according to the injected monotonic clock"""
+        cache = TTLCache(default_ttl=10, clock=clock)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        clock.now = 10.5
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats.expirations == 1
+
+    def test_lru_eviction(self, clock):
+        """Least recently used entry is evicted when over max_entries"""
+        cache = TTLCache(max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_byte_bound(self, clock):
+        """Byte budget evicts old entries and rejects oversized values"""
+        cache = TTLCache(max_bytes=10, sizeof=len, clock=clock)
+        cache.set("a", "xxxx")
+        cache.set("b", "yyyy")
+        cache.set("c", "zzzz")
+
+        assert "a" not in cache
+        assert cache.size_bytes == 8
+
+        cache.set("huge", "x" * 50)
+        assert "huge" not in cache
+        assert len(cache) == 2
+
+    def test_sweep_removes_only_expired(self, clock):
+        """Sweep drops expired entries and ignores overwritten ones"""
+        cache = TTLCache(clock=clock)
+        cache.set("short", 1, ttl=5)
+        cache.set("long", 2, ttl=50)
+        cache.set("renewed", 3, ttl=5)
+        cache.set("renewed", 4, ttl=50)
+
+        clock.now = 6
+        assert cache.sweep() == 1
+        assert "short" not in cache
+        assert cache.get("renewed") == 4
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_coalesces_misses(self):
+        """Concurrent misses on one key run the factory only once"""
+        cache = TTLCache()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_set("k", factory) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert cache.stats.coalesced == 4
+        assert await cache.get_or_set("k", factory) == "value"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_get_or_set_propagates_errors(self):
+        """A failing factory is not cached and raises for every waiter"""
+        cache = TTLCache()
+
+        async def factory():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_set("k", factory), cache.get_or_set("k", factory),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert "k" not in cache
+        assert cache.metrics()["inflight"] == 0
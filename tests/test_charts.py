@@ -0,0 +1,52 @@
+"""Tests for the live Plotly chart"""
+import json
+import pytest
+from array import array
+from types import SimpleNamespace
+
+from app.frontend import charts
+from app.frontend.charts import LiveChart
+
+
+class FakePlot:
+    """Stands in for ui.plotly outside a page, recording the JavaScript it would run"""
+
+    def __init__(self, figure):
+        self.figure = figure
+        self.id = 7
+        self.scripts = []
+        self.client = SimpleNamespace(run_javascript=self.scripts.append)
+
+
+@pytest.fixture
+def plotly(monkeypatch):
+    monkeypatch.setattr(charts.ui, 'plotly', FakePlot)
+
+
+class TestLiveChart:
+    """Test cases for LiveChart"""
+
+    def test_figures_do_not_share_layout_or_config(self, plotly):
+        """Changing one client's figure leaves the template and other figures alone"""
+        first, second = LiveChart([1], [2]), LiveChart([1], [2], title='Other')
+        first.plot.figure['layout']['xaxis']['title']['text'] = 'Changed'
+        first.plot.figure['config']['responsive'] = False
+
+        assert second.plot.figure['layout']['xaxis']['title']['text'] == 'Time'
+        assert second.plot.figure['layout']['title'] == {'text': 'Other'}
+        assert LiveChart([1], [2]).plot.figure['layout']['title'] == {'text': 'Live Data Chart'}
+        assert charts.chart_config()['responsive'] is True
+
+    def test_set_data_updates_figure_and_restyles(self, plotly):
+        """New arrays replace the server-side trace and go to the browser as one restyle"""
+        chart = LiveChart([1, 2], [3.0, 4.0])
+        chart.set_data(array('d', [5.0, 6.0, 7.0]), array('d', [0.5, float('nan'), 1.5]))
+
+        trace = chart.plot.figure['data'][0]
+        assert (trace['x'], trace['y'][0], trace['y'][2]) == ([5.0, 6.0, 7.0], 0.5, 1.5)
+        assert trace['mode'] == 'lines+markers'
+
+        (script,) = chart.plot.scripts
+        prefix, suffix = 'Plotly.restyle("c7", ', ', [0])'
+        assert script.startswith(prefix) and script.endswith(suffix)
+        assert json.loads(script[len(prefix):-len(suffix)]) == {'x': [[5.0, 6.0, 7.0]], 'y': [[0.5, None, 1.5]]}
@@ -0,0 +1,88 @@
+"""Tests for browser-side batching of UI events"""
+import pytest
+from types import SimpleNamespace
+
+from app.frontend import events
+from app.frontend.events import DeltaBatcher, ui_event_batches, ui_events_coalesced
+
+
+class FakeButton:
+    """Records the listeners a batcher binds"""
+
+    def __init__(self):
+        self.listeners = []
+
+    def on(self, type, js_handler=None):
+        self.listeners.append((type, js_handler))
+        return self
+
+
+@pytest.fixture
+def batcher(monkeypatch):
+    """A DeltaBatcher bound to ±1 buttons, outside any page"""
+    registered = []
+    monkeypatch.setattr(events.ui, 'on', lambda event, handler: registered.append((event, handler)))
+    deltas = []
+    batcher = DeltaBatcher('testDelta', deltas.append, window=0.25)
+    batcher.bind(FakeButton(), 1)
+    batcher.bind(FakeButton(), -1)
+    batcher.deltas = deltas
+    assert registered == [('testDelta', batcher._deliver)]
+    return batcher
+
+
+def deliver(batcher, **args):
+    return batcher._deliver(SimpleNamespace(args=args))
+
+
+class TestDeltaBatcher:
+    """Test cases for DeltaBatcher"""
+
+    def test_batches_reach_the_handler_and_metrics(self, batcher):
+        """Each batch is one handler call; the metrics count batches and folded clicks"""
+        batches = ui_event_batches.value(event='testDelta')
+        coalesced = ui_events_coalesced.value(event='testDelta')
+        deliver(batcher, delta=3, count=5)
+        deliver(batcher, delta=-1, count=1)
+
+        assert batcher.deltas == [3, -1]
+        assert ui_event_batches.value(event='testDelta') == batches + 2
+        assert ui_events_coalesced.value(event='testDelta') == coalesced + 6
+
+    def test_untrusted_batches_are_clamped(self, batcher):
+        """Counts are at least 1 and deltas cannot exceed count × the largest bound step"""
+        coalesced = ui_events_coalesced.value(event='testDelta')
+        deliver(batcher, delta=1000, count=2)
+        deliver(batcher, delta=-50, count=-7)
+        deliver(batcher, delta=4)
+
+        assert batcher.deltas == [2, -1, 1]
+        assert ui_events_coalesced.value(event='testDelta') == coalesced + 4
+
+    def test_malformed_batches_are_dropped(self, batcher):
+        """Missing or non-numeric fields never reach the handler"""
+        batches = ui_event_batches.value(event='testDelta')
+        deliver(batcher, count=1)
+        deliver(batcher, delta='many', count=1)
+        deliver(batcher, delta=1, count=float('inf'))
+
+        assert batcher.deltas == []
+        assert ui_event_batches.value(event='testDelta') == batches
+
+    def test_rendered_js_handlers(self, batcher):
+        """Bound buttons accumulate into the named batch; discard buttons clear it"""
+        plus, reset = FakeButton(), FakeButton()
+        batcher.bind(plus, 2)
+        batcher.discard_on(reset)
+
+        (type, accumulate), = plus.listeners
+        assert type == 'click'
+        assert 'batches["testDelta"]' in accumulate
+        assert 'batch.delta += 2;' in accumulate
+        assert 'emitEvent("testDelta", {delta: batch.delta, count: batch.count});' in accumulate
+        assert '}, 250);' in accumulate
+
+        (type, discard), = reset.listeners
+        assert type == 'click'
+        assert '(window.__deltaBatches || {})["testDelta"]' in discard
+        assert 'clearTimeout(batch.timer);' in discard
@@ -0,0 +1,96 @@
+"""Tests for the shared HTTP connection pool"""
+import pytest
+import asyncio
+import httpx
+
+from benchmarks.stub_server import StubServer
+from core.http import HostStats, HttpClientPool
+from core.metrics import REGISTRY
+from services.business import ApiService, http_pool
+
+
+class TestHttpClientPool:
+    """Test cases for HttpClientPool"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self):
+        """Every caller gets the same underlying client until close"""
+        pool = HttpClientPool(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        await pool.start()
+        client = pool.client
+
+        async with ApiService(pool) as api_service:
+            assert api_service.client is client
+        assert not client.is_closed
+
+        await pool.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_and_metrics(self):
+        """Concurrent requests to one host are capped and counted"""
+        active = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"ok": True})
+
+        pool = HttpClientPool(per_host_limit=2, transport=httpx.MockTransport(handler))
+        responses = await asyncio.gather(*(pool.get("http://stub.local/json") for _ in range(6)))
+        await pool.close()
+
+        assert all(response.status_code == 200 for response in responses)
+        assert peak == 2
+        metrics = pool.metrics()
+        assert metrics["requests"] == 6
+        assert metrics["in_flight"] == 0
+        assert metrics["hosts"]["stub.local"]["requests"] == 6
+
+    @pytest.mark.asyncio
+    async def test_open_connections_per_host(self):
+        """Pooled keep-alive connections are counted under the host's stats key"""
+        server = StubServer(payload={"value": 1})
+        await server.start()
+        pool = HttpClientPool()
+        try:
+            await asyncio.gather(*(pool.get(server.url) for _ in range(3)))
+            host = httpx.URL(server.url).netloc.decode()
+            stats = pool.metrics()["hosts"][host]
+        finally:
+            await pool.close()
+            await server.stop()
+
+        assert stats["requests"] == 3
+        assert 1 <= stats["open_connections"] <= 3
+
+    def test_pool_saturation_is_exported(self, monkeypatch):
+        """The shared pool's per-host in-flight, waiting and open connections are scraped"""
+        monkeypatch.setattr(http_pool, "_host_stats", {"stub.local": HostStats(in_flight=2, waiting=3)})
+        monkeypatch.setattr(http_pool, "_in_flight", 2)
+        monkeypatch.setattr(http_pool, "max_connections", 4)
+        lines = REGISTRY.render().splitlines()
+
+        assert 'http_pool_in_flight{host="stub.local"} 2' in lines
+        assert 'http_pool_waiting{host="stub.local"} 3' in lines
+        assert 'http_pool_open_connections{host="stub.local"} 0' in lines
+        assert "http_pool_saturation 0.5" in lines
+
+    @pytest.mark.asyncio
+    async def test_api_service_uses_pool(self):
+        """ApiService routes requests through the pool"""
+        pool = HttpClientPool(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"slideshow": {}})
+        ))
+
+        async with ApiService(pool) as api_service:
+            result = await api_service.fetch_external_data("http://stub.local/json")
+        await pool.close()
+
+        assert result.success is True
+        assert result.data == {"slideshow": {}}
+        assert pool.metrics()["requests"] == 1
@@ -0,0 +1,135 @@
+"""Tests for response caching and request coalescing"""
+import pytest
+import asyncio
+import gc
+
+import httpx
+import pytest_asyncio
+
+from benchmarks.stub_server import StubServer
+from core.http import HttpClientPool
+from core.http_cache import ResponseCache, parse_cache_policy
+from services.business import ApiService
+
+
+@pytest_asyncio.fixture
+async def stub():
+    server = StubServer(payload={"value": 1})
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture
+async def pool():
+    pool = HttpClientPool()
+    yield pool
+    await pool.close()
+
+
+async def fetch(pool, cache, url):
+    async with ApiService(pool, responses=cache) as api_service:
+        return await api_service.fetch_external_data(url)
+
+
+def test_parse_cache_policy():
+    """Shared-cache rules: s-maxage wins, Age is subtracted, private is not stored"""
+    policy = parse_cache_policy(httpx.Headers({"cache-control": "public, max-age=60, s-maxage=30", "age": "10"}))
+    assert (policy.store, policy.max_age) == (True, 20.0)
+    assert parse_cache_policy(httpx.Headers({"cache-control": "no-cache"}), default_ttl=5).max_age == 0.0
+    assert parse_cache_policy(httpx.Headers({"cache-control": "private, max-age=60"})).store is False
+    assert parse_cache_policy(httpx.Headers({}), default_ttl=5).max_age == 5.0
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache through ApiService"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self, stub, pool):
+        """Many callers for one URL share a single upstream request"""
+        stub.delay = 0.05
+        cache = ResponseCache()
+        results = await asyncio.gather(*(fetch(pool, cache, stub.url) for _ in range(10)))
+
+        assert all(result.data == {"value": 1} for result in results)
+        assert stub.requests == 1
+        assert cache.metrics()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_failure_after_all_waiters_cancel_is_not_logged(self):
+        """An upstream error nobody awaits any more is retrieved, not reported as never retrieved"""
+        async def send(headers):
+            await asyncio.sleep(0.01)
+            raise httpx.ConnectError("upstream down")
+
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+        try:
+            waiter = asyncio.ensure_future(ResponseCache().fetch("http://upstream/data", send))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.sleep(0.05)
+            del waiter
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert unhandled == []
+
+    @pytest.mark.asyncio
+    async def test_fresh_responses_are_served_from_cache(self, stub, pool, clock):
+        """max-age keeps the body fresh until it expires"""
+        stub.cache_control = "max-age=60"
+        cache = ResponseCache(clock=clock)
+
+        await fetch(pool, cache, stub.url)
+        await fetch(pool, cache, stub.url)
+        assert stub.requests == 1
+
+        clock.now += 61
+        await fetch(pool, cache, stub.url)
+        assert stub.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_revalidate_with_etag(self, stub, pool):
+        """no-cache responses with an ETag are revalidated with If-None-Match"""
+        stub.cache_control = "no-cache"
+        stub.etag = '"v1"'
+        cache = ResponseCache()
+
+        first = await fetch(pool, cache, stub.url)
+        second = await fetch(pool, cache, stub.url)
+
+        assert first.data == second.data == {"value": 1}
+        assert stub.requests == 2
+        metrics = cache.metrics()
+        assert (metrics["misses"], metrics["revalidated"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_responses_are_not_stored(self, stub, pool):
+        """no-store bodies are fetched every time"""
+        stub.cache_control = "no-store"
+        cache = ResponseCache()
+        await fetch(pool, cache, stub.url)
+        await fetch(pool, cache, stub.url)
+
+        assert stub.requests == 2
+        assert cache.metrics()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_store_is_size_bounded(self, pool):
+        """Bodies beyond max_bytes evict older entries"""
+        servers = [StubServer(payload={"blob": "x" * 400}, cache_control="max-age=60") for _ in range(3)]
+        for server in servers:
+            await server.start()
+        cache = ResponseCache(max_bytes=1000)
+        try:
+            for server in servers:
+                await fetch(pool, cache, server.url)
+        finally:
+            for server in servers:
+                await server.stop()
+
+        metrics = cache.metrics()
+        assert metrics["entries"] == 2
+        assert metrics["bytes"] <= 1000
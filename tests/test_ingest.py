@@ -0,0 +1,93 @@
+"""Tests for dataset ingestion into ChartData"""
+import pytest
+import asyncio
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from core.series import SeriesLabels
+from services.ingest import DatasetIngestor, choose_columns, convert_rows
+from services.uploads import UploadRejected
+
+
+def csv_bytes(rows: int) -> bytes:
+    return b"label,value\n" + b"".join(b"p%d,%d.5\n" % (i, i % 50) for i in range(rows))
+
+
+class TestRowHelpers:
+    """Test cases for column detection and batch conversion"""
+
+    def test_choose_columns(self):
+        """The first numeric column holds values, the first text column labels"""
+        assert choose_columns(["2024-01-01", "3.5", "x"]) == (0, 1)
+        assert choose_columns([1, 2]) == (None, 0)
+        with pytest.raises(UploadRejected):
+            choose_columns(["a", "b"])
+
+    def test_convert_rows_skips_bad_values(self):
+        """Missing, non-numeric and non-finite values are skipped"""
+        labels, values, skipped = convert_rows(
+            [["a", "1"], ["b", "x"], ["c"], ["d", "nan"], ["e", 2]], 0, 1
+        )
+        assert labels == ["a", "e"]
+        assert list(values) == [1.0, 2.0]
+        assert skipped == 3
+
+
+class TestDatasetIngestor:
+    """Test cases for DatasetIngestor"""
+
+    @pytest.mark.asyncio
+    async def test_csv_is_parsed_in_batches_with_progress(self):
+        """Progress is reported per batch and the chart is downsampled"""
+        updates = []
+        ingestor = DatasetIngestor(batch_rows=1000, max_points=100)
+        result = await ingestor.ingest(io.BytesIO(csv_bytes(5000)), "csv", on_progress=updates.append)
+
+        assert result.rows == 5000
+        assert len(result.data.values) == 5000
+        assert len(result.chart.values) == 100
+        assert result.chart.labels[0] == "p0"
+        assert [u.rows for u in updates] == [1000, 2000, 3000, 4000, 5000]
+        assert updates[-1].fraction == 1.0
+
+    @pytest.mark.asyncio
+    async def test_json_shapes(self):
+        """Records, members of an object and bare numbers are all accepted"""
+        ingestor = DatasetIngestor()
+        records = json.dumps([{"name": "a", "score": 1}, {"name": "b", "score": 2}]).encode()
+        result = await ingestor.ingest(io.BytesIO(records), "json")
+        assert (result.data.labels, list(result.data.values)) == (["a", "b"], [1.0, 2.0])
+
+        members = json.dumps({"x": 3, "y": 4}).encode()
+        result = await ingestor.ingest(io.BytesIO(members), "json")
+        assert (result.data.labels, list(result.data.values)) == (["x", "y"], [3.0, 4.0])
+
+        numbers = json.dumps([5, 6, "oops"]).encode()
+        result = await ingestor.ingest(io.BytesIO(numbers), "json")
+        assert result.data.labels == SeriesLabels(2, "Row")
+        assert result.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_data_without_numbers(self):
+        """Uploads with nothing to chart raise UploadRejected"""
+        ingestor = DatasetIngestor()
+        with pytest.raises(UploadRejected):
+            await ingestor.ingest(io.BytesIO(b"a,b\nx,y\n"), "csv")
+        with pytest.raises(UploadRejected):
+            await ingestor.ingest(io.BytesIO(b"notes"), "txt")
+
+    @pytest.mark.asyncio
+    async def test_downsampling_runs_in_worker_processes(self):
+        """Downsampling is picklable for a process pool; batches are converted on the reading thread"""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            async def cpu_bound(func, *args):
+                return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+            ingestor = DatasetIngestor(cpu_bound=cpu_bound, batch_rows=500, max_points=50)
+            source = io.BytesIO(csv_bytes(2000))
+            result = await ingestor.ingest(source, "csv")
+
+        assert result.rows == 2000
+        assert len(result.chart.values) == 50
+        assert source.tell() == 0
@@ -2,8 +2,11 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 import asyncio
+from datetime import datetime, timedelta
 
-from models.schemas import UserProfile, ApiResponse, ChartData
+from pydantic import ValidationError
+
+from models.schemas import UserProfile, UserRole, ApiResponse, ChartData, FormData
 from services.business import DataService, ApiService, UserService, HealthService
 from core.utils import validate_email, sanitize_input, format_timestamp
 
@@ -84,6 +87,112 @@ class TestUserService:
         result = user_service.update_user("missing@example.com", name="New Name")
         assert result is None
 
+    def test_update_user_validates_changed_fields(self, user_service):
+        """Test partial updates are validated and keep the indexes in sync"""
+        user_service.create_user("Bob Smith", "bob@example.com")
+        
+        with pytest.raises(ValidationError):
+            user_service.update_user("bob@example.com", email="not-an-email")
+        
+        updated = user_service.update_user("bob@example.com", name="  Robert  ", role=UserRole.ADMIN)
+        assert updated.name == "Robert"
+        assert user_service.count(role=UserRole.ADMIN) == 1
+        assert user_service.count(role=UserRole.USER) == 0
+        
+        user_service.update_user("bob@example.com", email="robert@example.com")
+        assert user_service.get_user("bob@example.com") is None
+        assert user_service.get_user("robert@example.com").name == "Robert"
+        assert user_service.count() == 1
+    
+    def test_bulk_create_and_filters(self, user_service):
+        """Test batch creation and index-backed filtering"""
+        base = datetime(2024, 1, 1)
+        users = user_service.bulk_create([
+            {"name": f"User {i}", "email": f"user{i}@example.com",
+             "role": UserRole.ADMIN if i % 3 == 0 else UserRole.USER,
+             "is_active": i % 2 == 0, "created_at": base + timedelta(days=i)}
+            for i in range(10)
+        ])
+        
+        assert len(users) == 10
+        assert user_service.count(role=UserRole.ADMIN) == 4
+        assert user_service.count(is_active=False) == 5
+        assert user_service.count(role=UserRole.ADMIN, is_active=True) == 2
+        
+        in_range = list(user_service.iter_users(
+            created_after=base + timedelta(days=2), created_before=base + timedelta(days=5)
+        ))
+        assert [u.email for u in in_range] == ["user2@example.com", "user3@example.com", "user4@example.com"]
+    
+    def test_bulk_create_is_all_or_nothing(self, user_service):
+        """Test an invalid record rejects the whole batch"""
+        with pytest.raises(ValidationError):
+            user_service.bulk_create([
+                {"name": "Good", "email": "good@example.com"},
+                {"name": "Bad", "email": "bad"},
+            ])
+        assert user_service.count() == 0
+    
+    def test_bulk_update(self, user_service):
+        """Test batch updates validate everything before applying"""
+        user_service.create_user("Ann", "ann@example.com")
+        user_service.create_user("Ben", "ben@example.com")
+        
+        with pytest.raises(ValidationError):
+            user_service.bulk_update({
+                "ann@example.com": {"is_active": False},
+                "ben@example.com": {"name": ""},
+            })
+        assert user_service.count(is_active=False) == 0
+        
+        updated = user_service.bulk_update({
+            "ann@example.com": {"is_active": False},
+            "missing@example.com": {"is_active": False},
+        })
+        assert [u.email for u in updated] == ["ann@example.com"]
+        assert user_service.count(is_active=False) == 1
+    
+    def test_email_change_cannot_take_another_users_email(self, user_service):
+        """Test re-keying onto an existing email is rejected and keeps both users"""
+        user_service.create_user("Ann", "ann@example.com")
+        user_service.create_user("Ben", "ben@example.com")
+        
+        with pytest.raises(ValueError):
+            user_service.update_user("ann@example.com", email="ben@example.com")
+        with pytest.raises(ValueError):
+            user_service.bulk_update({"ann@example.com": {"email": "ben@example.com"}})
+        with pytest.raises(ValueError):
+            user_service.bulk_update({
+                "ann@example.com": {"email": "new@example.com"},
+                "ben@example.com": {"email": "new@example.com"},
+            })
+        
+        assert user_service.count() == 2
+        assert user_service.get_user("ann@example.com").name == "Ann"
+        assert user_service.get_user("ben@example.com").name == "Ben"
+    
+    def test_list_page_cursor(self, user_service):
+        """Test cursor pagination walks every matching user once"""
+        base = datetime(2024, 1, 1)
+        user_service.bulk_create([
+            {"name": f"User {i}", "email": f"user{i:02d}@example.com",
+             "is_active": i % 4 != 0, "created_at": base + timedelta(minutes=i)}
+            for i in range(25)
+        ])
+        
+        seen, cursor = [], None
+        while True:
+            page, cursor = user_service.list_page(limit=7, cursor=cursor, is_active=True)
+            seen.extend(u.email for u in page)
+            if cursor is None:
+                break
+        
+        expected = [f"user{i:02d}@example.com" for i in range(25) if i % 4 != 0]
+        assert seen == expected
+        
+        with pytest.raises(ValueError):
+            user_service.list_page(cursor="garbage")
+
 
 class TestHealthService:
     """Test cases for HealthService"""
@@ -121,6 +230,34 @@ class TestHealthService:
             assert "disk" in checks
             assert checks["memory"] is True
             assert checks["disk"] is True
+    
+    @pytest.mark.asyncio
+    async def test_readiness_uses_cached_checks(self, health_service):
+        """Readiness is served from the scheduler snapshot without new checks"""
+        assert health_service.get_readiness()["ready"] is False
+        
+        external_api = AsyncMock(return_value=True)
+        health_service.scheduler.register("external_api", external_api)
+        await health_service.check_dependencies()
+        readiness = health_service.get_readiness()
+        health_service.get_readiness()
+        
+        assert external_api.await_count == 1
+        assert readiness["ready"] is True
+        assert set(readiness["checks"]) == {"external_api", "memory", "disk"}
+        assert readiness["checked_at"] is not None
+    
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out(self, health_service):
+        """A hanging dependency is reported unhealthy after its timeout"""
+        async def hang():
+            await asyncio.sleep(10)
+        
+        health_service.scheduler.register("external_api", hang, timeout=0.01)
+        checks = await health_service.check_dependencies()
+        
+        assert checks["external_api"] is False
+        assert "timed out" in health_service.get_readiness()["details"]["external_api"]["detail"]
 
 
 class TestUtilityFunctions:
@@ -227,6 +364,30 @@ class TestPydanticModels:
         # Test empty values validation
         with pytest.raises(ValueError):
             ChartData(labels=["A"], values=[])
+    
+    def test_chart_data_trusted(self):
+        """Trusted construction skips validation but still rejects empty values"""
+        values = [1.0, 2.0]
+        chart = ChartData.trusted(labels=["A", "B"], values=values, title="T")
+        assert chart.values is values
+        assert chart.chart_type == "line"
+        assert chart.model_dump() == ChartData(labels=["A", "B"], values=values, title="T").model_dump()
+        
+        with pytest.raises(ValueError):
+            ChartData.trusted(labels=[], values=[])
+    
+    def test_form_data_passwords_match(self):
+        """Confirmation is checked only when given, and only against a valid password"""
+        assert FormData(email="a@example.com", password="secret1").confirm_password is None
+        assert FormData(email="a@example.com", password="secret1", confirm_password="secret1")
+        
+        with pytest.raises(ValidationError) as excinfo:
+            FormData(email="a@example.com", password="secret1", confirm_password="secret2")
+        assert excinfo.value.errors()[0]["loc"] == ("confirm_password",)
+        
+        with pytest.raises(ValidationError) as excinfo:
+            FormData(email="a@example.com", password="short", confirm_password="other")
+        assert [error["loc"] for error in excinfo.value.errors()] == [("password",)]
 
 
 # Pytest configuration
@@ -0,0 +1,105 @@
+"""Tests for the metrics registry and its text exposition"""
+import pytest
+
+from core.metrics import REGISTRY, Registry
+from services.business import data_service
+
+
+def scrape() -> dict:
+    """Unlabelled samples from the process registry, as /metrics serves them"""
+    return {
+        name: float(value)
+        for name, value in (line.rsplit(" ", 1) for line in REGISTRY.render().splitlines() if not line.startswith("#"))
+    }
+
+
+class TestMetrics:
+    """Test cases for counters, gauges and histograms"""
+
+    def test_render_exposition_format(self):
+        """Counters and labelled gauges render HELP/TYPE headers and samples"""
+        registry = Registry()
+        requests = registry.counter("requests_total", "Requests served", ["path"])
+        registry.gauge("queue_depth", "Queued jobs", ["queue"], function=lambda: {("a\"b",): 3})
+        requests.inc(path="/")
+        requests.inc(2, path="/")
+
+        assert registry.render().splitlines() == [
+            "# HELP requests_total Requests served",
+            "# TYPE requests_total counter",
+            'requests_total{path="/"} 3',
+            "# HELP queue_depth Queued jobs",
+            "# TYPE queue_depth gauge",
+            'queue_depth{queue="a\\"b"} 3',
+        ]
+
+    def test_function_backed_counter(self):
+        """Counters can read a count kept elsewhere at scrape time"""
+        registry = Registry()
+        hits = {"n": 2}
+        registry.counter("hits_total", "Hits", function=lambda: hits["n"])
+        hits["n"] = 5
+        assert registry.render().splitlines()[-1] == "hits_total 5"
+
+    def test_data_cache_counters_are_scraped(self):
+        """DataService cache hits, misses and evictions are exported"""
+        before = scrape()
+        cache = data_service.cache
+        cache.get("metrics-test")
+        cache.set("metrics-test", 1)
+        cache.get("metrics-test")
+        for i in range(cache.max_entries + 1):
+            cache.set(("metrics-test", i), i)
+        after = scrape()
+        cache.clear()
+
+        assert after["data_cache_hits_total"] - before["data_cache_hits_total"] == 1
+        assert after["data_cache_misses_total"] - before["data_cache_misses_total"] == 1
+        assert after["data_cache_evictions_total"] - before["data_cache_evictions_total"] >= 1
+
+    def test_histogram_buckets_and_quantile(self):
+        """Buckets are cumulative and quantiles interpolate within a bucket"""
+        registry = Registry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.05, 0.5, 0.5, 5.0):
+            latency.observe(value)
+
+        lines = latency.render()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 4' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 5' in lines
+        assert "latency_seconds_count 5" in lines
+        assert latency.quantile(0.5) == pytest.approx(0.325)
+        assert latency.quantile(0.99) == 1.0
+
+    def test_label_mismatch_and_duplicates_are_rejected(self):
+        """Wrong label sets and duplicate names raise ValueError"""
+        registry = Registry()
+        counter = registry.counter("calls_total", "Calls", ["operation"])
+        with pytest.raises(ValueError):
+            counter.inc(method="GET")
+        with pytest.raises(ValueError):
+            registry.gauge("calls_total", "Again")
+
+    @pytest.mark.asyncio
+    async def test_timer_decorates_sync_and_async_functions(self):
+        """time() records one observation per call and keeps the return value"""
+        histogram = Registry().histogram("work_seconds", "Work", ["kind"])
+
+        @histogram.time(kind="sync")
+        def work():
+            return 1
+
+        @histogram.time(kind="async")
+        async def async_work():
+            return 2
+
+        assert work() == 1
+        assert await async_work() == 2
+        with pytest.raises(RuntimeError):
+            with histogram.time(kind="sync"):
+                raise RuntimeError("boom")
+
+        assert histogram.count(kind="sync") == 2
+        assert histogram.count(kind="async") == 1
+        assert async_work.__name__ == "async_work"
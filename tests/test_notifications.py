@@ -0,0 +1,59 @@
+"""Tests for notification rate limiting and coalescing"""
+import pytest
+import asyncio
+from collections import deque
+
+from services.notifications import COALESCED, RATE_LIMITED, SHOWN, SUPPRESSED, NotificationService
+
+
+def make_service(**kwargs):
+    shown = []
+    service = NotificationService(lambda client_id, message, type: shown.append((client_id, message)), **kwargs)
+    return service, shown
+
+
+class TestNotificationService:
+    """Test cases for NotificationService"""
+
+    def test_suppressed_during_initial_render(self):
+        """Clients without a socket get no toast, but the request is recorded"""
+        service, shown = make_service()
+        assert service.notify("c1", "Chart updated!", ready=False) == SUPPRESSED
+        assert shown == []
+        assert service.history[-1].status == SUPPRESSED
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_per_client(self, clock):
+        """A client's burst is capped and refills over time; other clients are unaffected"""
+        service, shown = make_service(rate=1.0, burst=2, clock=clock)
+        outcomes = [service.notify("c1", f"message {i}") for i in range(3)]
+        assert outcomes == [SHOWN, SHOWN, RATE_LIMITED]
+        assert service.notify("c2", "message 0") == SHOWN
+
+        clock.now += 1.0
+        assert service.notify("c1", "message 3") == SHOWN
+        assert [client for client, _ in shown] == ["c1", "c1", "c2", "c1"]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_coalesce_into_one_counted_toast(self):
+        """Repeats within the window are shown once when it ends"""
+        service, shown = make_service(coalesce_window=0.05)
+        outcomes = [service.notify("c1", "Chart updated!") for _ in range(4)]
+        assert outcomes == [SHOWN, COALESCED, COALESCED, COALESCED]
+        assert shown == [("c1", "Chart updated!")]
+
+        await asyncio.sleep(0.1)
+        assert shown == [("c1", "Chart updated!"), ("c1", "Chart updated! (+3 more)")]
+        assert service.history[-1].count == 3
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_and_forget_cancels_pending(self):
+        """History keeps the newest entries; forgetting a client drops its held-back repeats"""
+        service, shown = make_service(history=deque(maxlen=3), coalesce_window=0.05)
+        for _ in range(5):
+            service.notify("c1", "Counter reset!")
+        service.forget("c1")
+        await asyncio.sleep(0.1)
+
+        assert len(service.history) == 3
+        assert shown == [("c1", "Counter reset!")]
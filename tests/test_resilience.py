@@ -0,0 +1,189 @@
+"""Tests for retry policies and circuit breakers"""
+import pytest
+import asyncio
+import random
+
+import httpx
+
+from core.http import HttpClientPool, is_transient
+from core.resilience import BreakerRegistry, CircuitBreaker, CircuitOpenError, RetryPolicy, retry_on
+from services.business import ApiService
+from tests.conftest import FakeClock
+
+
+class SleepingClock(FakeClock):
+    """FakeClock whose sleeps advance time"""
+
+    def __init__(self):
+        super().__init__()
+        self.sleeps = []
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Overrides the shared clock fixture with one that can sleep"""
+    return SleepingClock()
+
+
+def failing(times, error=ConnectionError("down"), result="ok"):
+    calls = []
+
+    async def func():
+        calls.append(1)
+        if len(calls) <= times:
+            raise error
+        return result
+    return func, calls
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy"""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success_with_jittered_delays(self, clock):
+        """Delays stay within [base, 3 * previous] and under the cap"""
+        policy = RetryPolicy(max_attempts=5, base_delay=0.1, max_delay=1.0,
+                             sleep=clock.sleep, clock=clock, rng=random.Random(1))
+        func, calls = failing(3)
+
+        assert await policy.call(func) == "ok"
+        assert len(calls) == 4
+        previous = 0.1
+        for delay in clock.sleeps:
+            assert 0.1 <= delay <= min(1.0, previous * 3)
+            previous = delay
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_fail_immediately(self, clock):
+        """The retryable filter decides which errors are retried"""
+        policy = RetryPolicy(max_attempts=5, retryable=retry_on(ConnectionError), sleep=clock.sleep, clock=clock)
+        func, calls = failing(3, error=ValueError("bad request"))
+
+        with pytest.raises(ValueError):
+            await policy.call(func)
+        assert len(calls) == 1
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retries(self, clock):
+        """No retry is scheduled past the overall deadline"""
+        policy = RetryPolicy(max_attempts=100, base_delay=1.0, max_delay=1.0, deadline=3.5,
+                             sleep=clock.sleep, clock=clock)
+        func, calls = failing(1000)
+
+        with pytest.raises(ConnectionError):
+            await policy.call(func)
+        assert len(calls) == 4
+        assert clock.now <= 3.5
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    @pytest.mark.asyncio
+    async def test_opens_fails_fast_and_recovers(self, clock):
+        """Threshold failures open the circuit; one trial call closes it again"""
+        breaker = CircuitBreaker("api", failure_threshold=2, recovery_timeout=10.0, clock=clock)
+        func, calls = failing(2)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await breaker.call(func)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(func)
+        assert len(calls) == 2
+
+        clock.now += 10.0
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert await breaker.call(func) == "ok"
+        assert breaker.metrics() == {
+            "state": "closed", "consecutive_failures": 0, "failures": 2,
+            "successes": 1, "rejected": 1, "times_opened": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_trial_reopens(self, clock):
+        """A failing half-open trial re-opens the circuit for another timeout"""
+        breaker = CircuitBreaker("api", failure_threshold=1, recovery_timeout=5.0, clock=clock)
+        func, _ = failing(10)
+
+        with pytest.raises(ConnectionError):
+            await breaker.call(func)
+        clock.now += 5.0
+        with pytest.raises(ConnectionError):
+            await breaker.call(func)
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @pytest.mark.asyncio
+    async def test_ignored_errors_do_not_count(self):
+        """Errors rejected by is_failure leave the circuit closed"""
+        breaker = CircuitBreaker("api", failure_threshold=1, is_failure=retry_on(ConnectionError))
+        func, _ = failing(5, error=ValueError("client error"))
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(func)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestApiServiceResilience:
+    """Test cases for ApiService retries and breakers"""
+
+    def test_is_transient(self):
+        """Server errors and transport failures are transient; client errors are not"""
+        request = httpx.Request("GET", "http://stub.local/")
+        assert is_transient(httpx.ConnectError("refused", request=request))
+        for status, expected in ((503, True), (429, True), (404, False)):
+            error = httpx.HTTPStatusError("", request=request, response=httpx.Response(status, request=request))
+            assert is_transient(error) is expected
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_upstream(self, clock):
+        """Once the endpoint's circuit opens, calls fail without network I/O"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503)
+
+        pool = HttpClientPool(transport=httpx.MockTransport(handler))
+        retry = RetryPolicy(max_attempts=2, retryable=is_transient, sleep=clock.sleep, clock=clock)
+        breakers = BreakerRegistry(failure_threshold=2, is_failure=is_transient, clock=clock)
+
+        async with ApiService(pool, retry=retry, breakers=breakers) as api_service:
+            first = await api_service.fetch_external_data("http://stub.local/json")
+            second = await api_service.fetch_external_data("http://stub.local/json")
+        await pool.close()
+
+        assert first.success is False and second.success is False
+        assert "is open" in second.message
+        assert len(requests) == 2
+        assert breakers.metrics()["http://stub.local"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_hanging_upstream_opens_circuit(self):
+        """Attempts cut off by the retry deadline count as breaker failures"""
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await asyncio.sleep(60)
+
+        pool = HttpClientPool(transport=httpx.MockTransport(handler))
+        retry = RetryPolicy(max_attempts=1, deadline=0.05, retryable=is_transient)
+        breakers = BreakerRegistry(failure_threshold=2, is_failure=is_transient)
+
+        async with ApiService(pool, retry=retry, breakers=breakers) as api_service:
+            results = [await api_service.fetch_external_data("http://stub.local/json") for _ in range(3)]
+        await pool.close()
+
+        assert not any(result.success for result in results)
+        assert "is open" in results[-1].message
+        assert len(requests) == 2
+        assert breakers.metrics()["http://stub.local"]["failures"] == 2
@@ -0,0 +1,124 @@
+"""Route-level tests for the monitoring and static asset endpoints"""
+import gzip
+import os
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import app.main as main
+from core.assets import IMMUTABLE, AssetStore, build_assets
+from core.metrics import CONTENT_TYPE
+from core.scheduler import CheckResult
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Client for the app's routes; ASGITransport sends no lifespan events, so no startup handlers run"""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://app") as client:
+        yield client
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    """Publish check results as if the scheduler had run them"""
+    def publish(**healthy):
+        monkeypatch.setattr(main.health_service.scheduler, "_snapshot", {
+            name: CheckResult(name, ok, checked_at=time.time()) for name, ok in healthy.items()
+        })
+    return publish
+
+
+class TestMonitoringRoutes:
+    """Test cases for /health, /ready and /metrics"""
+
+    @pytest.mark.asyncio
+    async def test_health_is_always_ok(self, client):
+        """Liveness reports status and uptime without consulting dependencies"""
+        response = await client.get("/health")
+        body = response.json()
+
+        assert response.status_code == 200
+        assert set(body) == {"status", "timestamp", "version", "uptime"}
+        assert body["status"] == "healthy"
+        assert body["uptime"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_ready_while_a_check_is_pending(self, client, checks):
+        """Checks that have not reported yet keep the app unready and are listed as pending"""
+        checks(memory=True, disk=True)
+        response = await client.get("/ready")
+        body = response.json()
+
+        assert response.status_code == 503
+        assert set(body) == {"ready", "checks", "pending", "details", "checked_at", "circuits"}
+        assert body["ready"] is False
+        assert body["checks"] == {"memory": True, "disk": True}
+        assert body["pending"] == ["external_api"]
+
+    @pytest.mark.asyncio
+    async def test_ready_when_every_check_passes(self, client, checks):
+        checks(external_api=True, memory=True, disk=True)
+        response = await client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
+        assert response.json()["pending"] == []
+        assert response.json()["details"]["disk"]["healthy"] is True
+
+    @pytest.mark.asyncio
+    async def test_ready_when_a_check_fails(self, client, checks):
+        checks(external_api=False, memory=True, disk=True)
+        response = await client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["external_api"] is False
+
+    @pytest.mark.asyncio
+    async def test_metrics_exposition(self, client):
+        """Prometheus text format with the registered metrics"""
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "# TYPE data_cache_hits_total counter" in response.text
+        assert "# TYPE api_call_seconds histogram" in response.text
+
+
+class TestAssetRoute:
+    """Test cases for /assets/{path}"""
+
+    @pytest.fixture
+    def store(self, monkeypatch, temp_dir):
+        out = os.path.join(temp_dir, "dist")
+        store = AssetStore(out).load(build_assets("static", out))
+        monkeypatch.setattr(main, "assets", store)
+        return store
+
+    @pytest.mark.asyncio
+    async def test_precompressed_variant_with_immutable_caching(self, client, store):
+        path = store.url("css/app.css")
+        response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        with open(os.path.join(store.out_dir, path[len("/assets/"):] + ".gz"), "rb") as file:
+            assert response.content == gzip.decompress(file.read())
+
+    @pytest.mark.asyncio
+    async def test_identity_for_clients_without_compression(self, client, store):
+        response = await client.get(store.url("js/utils.js"), headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["cache-control"] == IMMUTABLE
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_unhashed_paths_are_404(self, client, store):
+        assert (await client.get("/assets/css/app.css")).status_code == 404
+        assert (await client.get("/assets/css/missing.0123456789ab.css")).status_code == 404
@@ -0,0 +1,68 @@
+"""Tests for JSON encoding helpers"""
+import importlib
+import json
+import sys
+from array import array
+from datetime import datetime
+
+import pytest
+
+import core.serialization
+from core.serialization import FastJSONResponse, dumps, iter_chart_json, preview
+from core.series import LabelColumn, SeriesLabels
+from models.schemas import ApiResponse, ChartData, HealthCheck, UserRole
+
+
+@pytest.fixture
+def stdlib_fallback(monkeypatch):
+    """core.serialization reloaded as if orjson were not installed"""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    module = importlib.reload(core.serialization)
+    yield module
+    monkeypatch.undo()
+    importlib.reload(core.serialization)
+
+
+class TestDumps:
+    """Test cases for the JSON encoder"""
+
+    def test_models_match_pydantic(self):
+        """Models encode to the same JSON as model_dump_json"""
+        chart = ChartData(labels=SeriesLabels(3), values=array('d', [1.0, 2.5, 3.0]), title="T")
+        response = ApiResponse(success=True, message="ok", data={"at": datetime(2024, 1, 1)})
+        for model in (chart, response, HealthCheck(uptime=1.5)):
+            assert json.loads(dumps(model)) == json.loads(model.model_dump_json())
+
+    def test_fallback_encoder(self, stdlib_fallback):
+        """Without orjson the pydantic-core encoder gives the same output"""
+        assert not stdlib_fallback.HAS_ORJSON
+        value = {"role": UserRole.ADMIN, "values": array('d', [1.0, float("nan")])}
+        assert json.loads(stdlib_fallback.dumps(value)) == {"role": "admin", "values": [1.0, None]}
+
+    def test_fast_json_response(self):
+        """Responses render through dumps"""
+        response = FastJSONResponse({"ready": True}, status_code=503)
+        assert response.status_code == 503
+        assert json.loads(response.body) == {"ready": True}
+
+
+class TestChartStreaming:
+    """Test cases for chunked ChartData encoding"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+    def test_chunks_join_to_full_document(self, chunk_size):
+        """Joined pieces equal the one-shot encoding for any chunk size"""
+        chart = ChartData(labels=LabelColumn(["a", "b", "c"]), values=array('d', [1.0, 2.0, 3.0]))
+        assert b"".join(iter_chart_json(chart, chunk_size)) == dumps(chart)
+
+
+class TestPreview:
+    """Test cases for truncated previews"""
+
+    def test_short_values_are_whole(self):
+        assert preview({"a": 1}) == '{"a": 1}'
+
+    def test_long_values_are_truncated(self):
+        """Only the requested prefix is returned, marked as truncated"""
+        text = preview({"items": list(range(100_000))}, limit=20)
+        assert text == '{"items": [0, 1, 2, …'
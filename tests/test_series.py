@@ -0,0 +1,103 @@
+"""Tests for array-backed series generation and downsampling"""
+import pytest
+from array import array
+
+from core.series import (
+    LabelColumn, SeriesLabels, is_float_array, lttb_indices, minmax_indices, take, uniform_series,
+)
+from models.schemas import ChartData
+from services.business import DataService
+
+
+class TestSeries:
+    """Test cases for series helpers"""
+
+    def test_uniform_series(self):
+        """Generated values are a float64 array within bounds"""
+        values = uniform_series(1000, 10, 100, seed=1)
+        assert is_float_array(values)
+        assert len(values) == 1000
+        assert all(10 <= v < 100 for v in values)
+
+    def test_series_labels(self):
+        """Lazy labels behave like the equivalent list"""
+        labels = SeriesLabels(3)
+        assert len(labels) == 3
+        assert labels[0] == "Point 1"
+        assert labels[-1] == "Point 3"
+        assert list(labels[1:]) == ["Point 2", "Point 3"]
+        assert labels == ["Point 1", "Point 2", "Point 3"]
+
+    def test_label_column(self):
+        """Columnar labels behave like the equivalent list across batches"""
+        labels = LabelColumn(["a", "", "ccc"])
+        labels.extend(["dd"])
+        assert len(labels) == 4
+        assert labels[1] == ""
+        assert labels[-1] == "dd"
+        assert list(labels[1:3]) == ["", "ccc"]
+        assert labels == ["a", "", "ccc", "dd"]
+        with pytest.raises(IndexError):
+            labels[4]
+
+    def test_take_labels_stays_columnar(self):
+        """Selecting labels yields a LabelColumn rather than a list of strings"""
+        picked = take(SeriesLabels(10), [0, 9])
+        assert isinstance(picked, LabelColumn)
+        assert picked == ["Point 1", "Point 10"]
+        assert ChartData(labels=picked, values=[1.0, 2.0]).model_dump_json().startswith(
+            '{"labels":["Point 1","Point 10"]'
+        )
+
+    def test_lttb_indices(self):
+        """LTTB keeps endpoints, respects the cap and picks peaks"""
+        values = array('d', [0.0] * 1000)
+        values[500] = 100.0
+        indices = lttb_indices(values, 50)
+
+        assert len(indices) == 50
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert 500 in indices
+        assert indices == sorted(indices)
+
+    def test_lttb_small_series_untouched(self):
+        """Series under the threshold are returned whole"""
+        assert lttb_indices([1.0, 2.0, 3.0], 10) == [0, 1, 2]
+
+    def test_minmax_indices(self):
+        """Min/max buckets keep each bucket's extremes"""
+        values = [5.0, 1.0, 9.0, 5.0, 5.0, 0.0, 7.0, 5.0]
+        indices = minmax_indices(values, 4)
+        assert indices == [1, 2, 5, 6]
+
+
+class TestArrayChartData:
+    """Test cases for array-backed ChartData"""
+
+    def test_array_values_not_copied(self):
+        """float64 arrays are stored without per-element conversion"""
+        values = array('d', [1.0, 2.0, 3.0])
+        chart = ChartData(labels=SeriesLabels(3), values=values)
+
+        assert chart.values is values
+        assert chart.model_dump_json().startswith(
+            '{"labels":["Point 1","Point 2","Point 3"],"values":[1.0,2.0,3.0]'
+        )
+
+    def test_empty_array_rejected(self):
+        """Empty arrays fail the same validation as empty lists"""
+        with pytest.raises(ValueError):
+            ChartData(labels=[], values=array('d'))
+
+    @pytest.mark.asyncio
+    async def test_downsample_large_sample(self):
+        """Large samples are capped at the requested resolution"""
+        service = DataService()
+        data = await service.get_sample_data(count=50_000)
+        indices, reduced = service.downsample(data, max_points=200)
+
+        assert len(indices) == 200
+        assert len(reduced.values) == 200
+        assert reduced.labels[0] == "Point 1"
+        assert reduced.labels[-1] == "Point 50000"
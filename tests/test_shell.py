@@ -0,0 +1,29 @@
+"""Tests for static page-shell fragments"""
+from app.frontend.shell import card, grid, static_fragment, text
+
+
+class TestStaticFragments:
+    """Test cases for cached static markup"""
+
+    def test_markup_matches_nicegui_classes_and_escapes_text(self):
+        """Cards and grids carry NiceGUI's classes; text is escaped"""
+        markup = grid(2, [card(text('<b>&</b>', 'text-lg'), classes='feature-card')], classes='w-full')
+        assert markup == (
+            '<div class="nicegui-grid w-full" style="grid-template-columns: repeat(2, minmax(0, 1fr))">'
+            '<div class="q-card nicegui-card feature-card">'
+            '<div class="text-lg">&lt;b&gt;&amp;&lt;/b&gt;</div>'
+            '</div></div>'
+        )
+
+    def test_builder_runs_once(self):
+        """Every placement reuses the markup built on first use"""
+        calls = []
+
+        @static_fragment
+        def fragment():
+            calls.append(1)
+            return text('hello')
+
+        assert fragment.markup() is fragment.markup()
+        assert len(calls) == 1
+        assert fragment.__name__ == 'fragment'
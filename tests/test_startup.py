@@ -0,0 +1,79 @@
+"""Tests for cold-start profiling and the cold-start budget"""
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import pytest
+
+from app.config import settings
+from core.startup import ImportTimer, StartupProfile
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestStartupProfile:
+    """Test cases for ImportTimer and StartupProfile"""
+
+    def test_import_timer_charges_packages(self):
+        """Imports made while installed are attributed to their top-level package"""
+        sys.modules.pop("colorsys", None)
+        timer = ImportTimer().install()
+        try:
+            import colorsys  # noqa: F401
+        finally:
+            timer.uninstall()
+        assert "colorsys" in timer.totals
+        assert timer.top(1)[0][1] >= 0
+
+    def test_report_in_milliseconds(self):
+        """Phases and marks are reported once, in milliseconds"""
+        now = [0.0]
+        profile = StartupProfile(clock=lambda: now[0])
+        with profile.phase("assets"):
+            now[0] += 0.25
+        profile.mark("ready")
+        now[0] += 1.0
+        profile.mark("ready")
+        assert profile.report() == {"phases_ms": {"assets": 250.0}, "marks_ms": {"ready": 250.0}, "imports_ms": {}}
+
+
+class TestColdStart:
+    """Regression guard for user-facing cold-start latency"""
+
+    def test_first_page_within_budget(self):
+        """`python main.py` serves its first page within COLD_START_BUDGET seconds"""
+        port = free_port()
+        env = dict(os.environ, PORT=str(port), HOST="127.0.0.1", WORKERS="1")
+        start = time.perf_counter()
+        process = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while True:
+                elapsed = time.perf_counter() - start
+                if elapsed > settings.cold_start_budget * 3 or process.poll() is not None:
+                    pytest.fail(f"No page after {elapsed:.2f}s (exit code {process.poll()})")
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=5) as response:
+                        assert response.status == 200
+                    elapsed = time.perf_counter() - start
+                    break
+                except OSError:
+                    time.sleep(0.02)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+        assert elapsed <= settings.cold_start_budget, (
+            f"Cold start took {elapsed:.2f}s, budget is {settings.cold_start_budget}s; "
+            "run with STARTUP_PROFILE=1 for a breakdown"
+        )
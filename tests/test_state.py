@@ -0,0 +1,100 @@
+"""Tests for the per-session state store"""
+import asyncio
+import pytest
+import pytest_asyncio
+import os
+import threading
+
+from services.state import MemoryStateBackend, SQLiteStateBackend, StateStore, create_state_backend
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite"])
+async def store(request, temp_dir):
+    store = StateStore(create_state_backend(request.param, os.path.join(temp_dir, "state.db")))
+    yield store
+    await store.stop()
+
+
+class TestStateStore:
+    """Test cases shared by every backend"""
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_isolated(self, store):
+        """Each session id has its own state"""
+        await store.increment("a", "counter", 5)
+        await store.set("a", user_name="Alice", selected_theme="green")
+
+        a = await store.get("a")
+        b = await store.get("b")
+        assert (a.counter, a.user_name, a.selected_theme) == (5, "Alice", "green")
+        assert (b.counter, b.user_name, b.selected_theme) == (0, "", "blue")
+
+    @pytest.mark.asyncio
+    async def test_increment_returns_new_value(self, store):
+        """Increments accumulate and return the updated count"""
+        assert await store.increment("a", "counter") == 1
+        assert await store.increment("a", "counter", -3) == -2
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_rejected(self, store):
+        """Only known fields may be written"""
+        with pytest.raises(ValueError):
+            await store.set("a", is_admin=True)
+        with pytest.raises(ValueError):
+            await store.increment("a", "user_name")
+
+    @pytest.mark.asyncio
+    async def test_writes_keep_their_order(self, store):
+        """Writes issued together land in the order they were made"""
+        await asyncio.gather(*(store.set("a", user_name=f"name {i}") for i in range(20)))
+        assert (await store.get("a")).user_name == "name 19"
+
+
+class TestBackends:
+    """Backend-specific behaviour"""
+
+    def test_memory_idle_eviction(self, clock):
+        """Sessions idle past the timeout are dropped"""
+        backend = MemoryStateBackend(clock=clock)
+        backend.load("old")
+        clock.now = 100
+        backend.load("fresh")
+
+        assert backend.evict_idle(50) == 1
+        assert len(backend) == 1
+
+    def test_sqlite_no_lost_updates(self, temp_dir):
+        """Concurrent increments through separate connections all land"""
+        path = os.path.join(temp_dir, "state.db")
+        backends = [SQLiteStateBackend(path) for _ in range(4)]
+
+        def work(backend):
+            for _ in range(50):
+                backend.increment("shared", "counter", 1)
+
+        threads = [threading.Thread(target=work, args=(backend,)) for backend in backends]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert backends[0].load("shared").counter == 200
+        for backend in backends:
+            backend.close()
+
+    @pytest.mark.asyncio
+    async def test_sqlite_waits_off_the_event_loop(self, temp_dir):
+        """A write blocked on another process's lock leaves the loop running"""
+        path = os.path.join(temp_dir, "state.db")
+        store = StateStore(SQLiteStateBackend(path, busy_timeout=5.0))
+        holder = SQLiteStateBackend(path)
+        holder._conn().execute("BEGIN IMMEDIATE")
+
+        write = asyncio.ensure_future(store.increment("a", "counter"))
+        await asyncio.sleep(0.1)
+        assert not write.done()
+
+        holder._conn().execute("COMMIT")
+        assert await write == 1
+        holder.close()
+        await store.stop()
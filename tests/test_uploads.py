@@ -0,0 +1,108 @@
+"""Tests for the streaming upload pipeline"""
+import pytest
+import io
+import json
+
+from services.uploads import UploadRejected, UploadValidator, inspect_upload, iter_json_rows, schema_max_bytes
+
+
+class CountingStream(io.BytesIO):
+    """BytesIO that records how many bytes were read"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestUploadValidator:
+    """Test cases for UploadValidator"""
+
+    def test_rejects_bad_names_and_types_before_reading(self):
+        """Filename and extension are checked up front"""
+        with pytest.raises(UploadRejected):
+            UploadValidator("../etc/passwd.txt", "text/plain")
+        with pytest.raises(UploadRejected, match="not allowed"):
+            UploadValidator("image.png", "image/png")
+
+    def test_limit_is_capped_by_schema(self):
+        """A configured limit above FileUpload's bound is clamped"""
+        validator = UploadValidator("a.txt", "text/plain", max_bytes=schema_max_bytes() * 10)
+        assert validator.max_bytes == schema_max_bytes()
+
+    def test_rejects_binary_and_empty(self):
+        """NUL bytes in the first chunk and empty files are rejected"""
+        with pytest.raises(UploadRejected, match="Binary"):
+            inspect_upload(io.BytesIO(b"PK\x03\x04\x00\x00"), "a.csv", "text/csv")
+        with pytest.raises(UploadRejected, match="empty"):
+            inspect_upload(io.BytesIO(b""), "a.txt", "text/plain")
+
+
+class TestInspectUpload:
+    """Test cases for inspect_upload"""
+
+    def test_oversized_upload_stops_early(self):
+        """Reading stops at the first chunk past the limit"""
+        source = CountingStream(b"x" * 1_000_000)
+        with pytest.raises(UploadRejected, match="larger than"):
+            inspect_upload(source, "big.txt", "text/plain", max_bytes=10_000, chunk_size=4096)
+        assert source.bytes_read < 20_000
+
+    def test_csv_rows_columns_and_preview(self):
+        """CSV header becomes the columns; quoted newlines stay in one row"""
+        data = b'label,value\n"multi\nline",1\n' + b"".join(b"p%d,%d\n" % (i, i) for i in range(100))
+        summary = inspect_upload(io.BytesIO(data), "data.csv", "text/csv", preview_rows=2, chunk_size=16)
+
+        assert summary.kind == "csv"
+        assert summary.columns == ["label", "value"]
+        assert summary.rows == 101
+        assert summary.preview == [["multi\nline", "1"], ["p0", "0"]]
+        assert summary.upload.size == len(data)
+
+    def test_json_array_across_chunk_boundaries(self):
+        """Values split between chunks, including numbers, parse correctly"""
+        items = [{"label": f"p{i}", "value": i * 1234.5} for i in range(500)]
+        data = json.dumps(items).encode()
+        summary = inspect_upload(io.BytesIO(data), "data.json", "application/json", chunk_size=7)
+
+        assert summary.rows == 500
+        assert summary.preview == items[:5]
+
+    def test_source_is_rewound(self):
+        """Later stages can read the upload again"""
+        source = io.BytesIO(b"one\ntwo\n")
+        summary = inspect_upload(source, "notes.txt", "text/plain")
+        assert (summary.rows, summary.preview) == (2, ["one", "two"])
+        assert source.read() == b"one\ntwo\n"
+
+    @pytest.mark.parametrize("document", [b"[1, 2", b"[1 2]", b'{"a" 1}', b"[1] []"])
+    def test_malformed_json_is_rejected(self, document):
+        """Parse errors surface as UploadRejected"""
+        with pytest.raises(UploadRejected, match="Could not parse JSON"):
+            inspect_upload(io.BytesIO(document), "bad.json", "application/json", chunk_size=2)
+
+
+def test_iter_json_rows_values_spanning_many_chunks():
+    """Strings with escapes and nested values split across tiny chunks parse whole"""
+    items = [{"text": 'say "hi"\\ ' * 50, "nested": [[{"x": "]}"}]] * 20}, "plain \\"]
+    stream = io.StringIO(json.dumps(items))
+    assert list(iter_json_rows(stream, chunk_size=3)) == items
+
+
+def test_iter_json_rows_rejects_oversized_values():
+    """A single value longer than the limit is refused without being decoded"""
+    stream = io.StringIO(json.dumps([1, "x" * 500, 2]))
+    rows = iter_json_rows(stream, chunk_size=16, max_value_chars=100)
+    assert next(rows) == 1
+    with pytest.raises(ValueError, match="longer than 100 characters"):
+        next(rows)
+
+
+def test_iter_json_rows_object_members():
+    """Top-level objects yield one row per member"""
+    stream = io.StringIO('{"a": 1, "b": [1, 2], "c": {}}')
+    assert list(iter_json_rows(stream, chunk_size=3)) == [{"a": 1}, {"b": [1, 2]}, {"c": {}}]
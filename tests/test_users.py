@@ -0,0 +1,214 @@
+"""Tests for the SQLite-backed user service"""
+import pytest
+import asyncio
+import os
+from datetime import datetime
+
+from models.schemas import UserProfile, UserRole
+from services.business import PersistentUserService, UserService, create_user_service
+from services.users import UserRecord, UserRepository
+
+
+@pytest.fixture
+def db_path(temp_dir):
+    return os.path.join(temp_dir, "users.db")
+
+
+class TestUserRepository:
+    """Test cases for UserRepository"""
+
+    def test_write_batch_round_trip(self, db_path):
+        """Stored profiles come back with their types intact"""
+        repository = UserRepository(db_path)
+        user = UserService().create_user("Ann", "ann@example.com")
+        repository.write_batch([user])
+
+        loaded = repository.get("ann@example.com")
+        assert loaded == user
+        assert isinstance(loaded.role, UserRole)
+        assert isinstance(loaded.created_at, datetime)
+        repository.close()
+
+    def test_changed_since_reports_writes_and_deletes(self, db_path):
+        """Each batch gets a new sequence number; deletes leave tombstones"""
+        repository = UserRepository(db_path)
+        service = UserService()
+        ann = service.create_user("Ann", "ann@example.com")
+        ben = service.create_user("Ben", "ben@example.com")
+        first = repository.write_batch([ann, ben])
+        second = repository.write_batch([], deletes=["ann@example.com"])
+
+        assert second == first + 1
+        users, deleted, latest = repository.changed_since(first)
+        assert (users, deleted, latest) == ([], ["ann@example.com"], second)
+        assert repository.count() == 1
+        assert [u.email for u in repository.load_all()[0]] == ["ben@example.com"]
+        repository.close()
+
+    def test_changed_since_skips_own_batches(self, db_path):
+        """Skipped batches are left out but still advance the returned seq"""
+        repository = UserRepository(db_path)
+        service = UserService()
+        theirs = repository.write_batch([service.create_user("Ann", "ann@example.com")])
+        ours = repository.write_batch([service.create_user("Ben", "ben@example.com")])
+
+        users, _, latest = repository.changed_since(0, skip=[ours])
+        assert ([u.email for u in users], latest) == (["ann@example.com"], ours)
+        assert repository.changed_since(theirs, skip=[ours]) == ([], [], ours)
+        repository.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_worker_thread_connections(self, db_path):
+        """Connections opened in to_thread workers are closed too"""
+        repository = UserRepository(db_path)
+        await asyncio.gather(*(asyncio.to_thread(repository.count) for _ in range(4)))
+        assert repository._connections.open_count >= 2
+
+        repository.close()
+        assert repository._connections.open_count == 0
+        assert repository.count() == 0  # reconnects on demand
+        repository.close()
+
+
+class TestUserRecords:
+    """Test cases for the compact in-memory user representation"""
+
+    def test_service_stores_records_and_returns_profiles(self):
+        """Users are held as slotted records and handed out as profiles"""
+        service = UserService()
+        created = service.create_user("Ann", "ann@example.com")
+
+        record = service.users["ann@example.com"]
+        assert isinstance(record, UserRecord)
+        assert not hasattr(record, "__dict__")
+        assert isinstance(service.get_user("ann@example.com"), UserProfile)
+        assert service.get_user("ann@example.com") == created
+        assert service.list_page(limit=1)[0] == [created]
+
+    def test_profile_round_trip(self):
+        """Converting to a record and back keeps every field"""
+        user = UserService().create_user("Ann", "ann@example.com")
+        assert UserRecord.from_profile(user).to_profile() == user
+
+
+class TestPersistentUserService:
+    """Test cases for PersistentUserService"""
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched_and_survive_restart(self, db_path):
+        """Writes are queued until flushed, then reload on the next start"""
+        service = create_user_service("sqlite", db_path, flush_interval=60)
+        service.start()
+        service.create_user("Ann", "ann@example.com")
+        service.create_user("Ben", "ben@example.com")
+        service.update_user("ann@example.com", role=UserRole.ADMIN)
+
+        assert service.pending == 2
+        assert service.repository.count() == 0
+        await service.stop()
+
+        restarted = create_user_service("sqlite", db_path)
+        restarted.start()
+        assert restarted.get_user("ann@example.com").role == UserRole.ADMIN
+        assert restarted.count(role=UserRole.ADMIN) == 1
+        assert restarted.count() == 2
+        await restarted.stop()
+
+    @pytest.mark.asyncio
+    async def test_email_change_deletes_old_row(self, db_path):
+        """Re-keying a user removes the old email from the table"""
+        service = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        service.start()
+        service.create_user("Ann", "ann@example.com")
+        await service.flush()
+        service.update_user("ann@example.com", email="anne@example.com")
+        await service.stop()
+
+        repository = UserRepository(db_path)
+        assert repository.get("ann@example.com") is None
+        assert repository.get("anne@example.com").name == "Ann"
+        repository.close()
+
+    @pytest.mark.asyncio
+    async def test_rejected_email_change_writes_nothing(self, db_path):
+        """Re-keying onto another user's email neither overwrites nor tombstones a row"""
+        service = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        service.start()
+        service.create_user("Ann", "ann@example.com")
+        service.create_user("Ben", "ben@example.com")
+        await service.flush()
+
+        with pytest.raises(ValueError):
+            service.update_user("ann@example.com", email="ben@example.com")
+        assert service.pending == 0
+        await service.stop()
+
+        repository = UserRepository(db_path)
+        assert repository.get("ann@example.com").name == "Ann"
+        assert repository.get("ben@example.com").name == "Ben"
+        repository.close()
+
+    @pytest.mark.asyncio
+    async def test_sync_applies_other_workers_writes(self, db_path):
+        """Rows flushed by one process appear in another after sync"""
+        first = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        second = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        first.start()
+        second.start()
+
+        first.create_user("Ann", "ann@example.com")
+        await first.flush()
+        second.create_user("Ben", "ben@example.com")
+        second.update_user("ben@example.com", name="Benjamin")
+
+        assert await second.sync() == 1
+        assert second.get_user("ann@example.com").name == "Ann"
+        await second.flush()
+        await first.sync()
+        assert first.get_user("ben@example.com").name == "Benjamin"
+
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_sync_pulls_only_other_workers_batches(self, db_path):
+        """A worker's own flushes are not read back, even when another worker's batch lands in between"""
+        first = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        second = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        first.start()
+        second.start()
+
+        second.create_user("Ben", "ben@example.com")
+        await second.flush()
+        first.create_user("Ann", "ann@example.com")
+        await first.flush()
+
+        assert await first.sync() == 1
+        assert first.get_user("ben@example.com").name == "Ben"
+        first.update_user("ann@example.com", name="Annie")
+        await first.flush()
+        assert await first.sync() == 0
+        assert await second.sync() == 1
+        assert second.get_user("ann@example.com").name == "Annie"
+
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_requeues(self, db_path, monkeypatch):
+        """A failed write keeps the batch pending for the next flush"""
+        service = PersistentUserService(UserRepository(db_path), flush_interval=60)
+        service.start()
+        service.create_user("Ann", "ann@example.com")
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(service.repository, "write_batch", fail)
+        with pytest.raises(OSError):
+            await service.flush()
+        assert service.pending == 1
+
+        monkeypatch.undo()
+        assert await service.flush() == 1
+        await service.stop()
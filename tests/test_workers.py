@@ -0,0 +1,86 @@
+"""Tests for the sticky-session worker proxy"""
+import pytest
+import asyncio
+
+from core.workers import StickyProxy
+
+
+def request_head(cookie=None, extra=()):
+    lines = ["GET / HTTP/1.1", "Host: localhost", *extra]
+    if cookie:
+        lines.append(f"Cookie: {cookie}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+class TestStickyProxy:
+    """Test cases for StickyProxy"""
+
+    def test_cookie_pins_worker(self):
+        """Requests carrying the worker cookie go back to that worker"""
+        proxy = StickyProxy([("127.0.0.1", 1), ("127.0.0.1", 2)])
+        assert proxy.choose(request_head("a=b; nicegui_worker=1")) == (1, False)
+
+    def test_new_visitors_spread_and_get_cookie(self):
+        """Unpinned requests go to the least-loaded worker"""
+        proxy = StickyProxy([("127.0.0.1", 1), ("127.0.0.1", 2)])
+        proxy.active = [3, 0]
+        assert proxy.choose(request_head()) == (1, True)
+        assert proxy.choose(request_head("nicegui_worker=7")) == (1, True)
+
+    @pytest.mark.asyncio
+    async def test_proxies_and_sets_cookie(self):
+        """A response through the proxy carries the Set-Cookie header"""
+        async def backend(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(backend, "127.0.0.1", 0)
+        backend_port = server.sockets[0].getsockname()[1]
+        proxy = StickyProxy([("127.0.0.1", backend_port)])
+        front = await asyncio.start_server(proxy.handle, "127.0.0.1", 0)
+        front_port = front.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", front_port)
+        writer.write(request_head())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        front.close()
+        server.close()
+
+        assert response.startswith(b"HTTP/1.1 200 OK\r\nSet-Cookie: nicegui_worker=0;")
+        assert response.endswith(b"\r\n\r\nok")
+
+    @pytest.mark.asyncio
+    async def test_plain_requests_close_the_connection(self):
+        """Keep-alive is turned off both ways for plain requests, but not for upgrades"""
+        seen = []
+
+        async def backend(reader, writer):
+            seen.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\nConnection: keep-alive\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(backend, "127.0.0.1", 0)
+        proxy = StickyProxy([("127.0.0.1", server.sockets[0].getsockname()[1])])
+        front = await asyncio.start_server(proxy.handle, "127.0.0.1", 0)
+        front_port = front.sockets[0].getsockname()[1]
+
+        responses = []
+        for head in (request_head("nicegui_worker=0", ["Connection: keep-alive"]),
+                     request_head("nicegui_worker=0", ["Connection: Upgrade", "Upgrade: websocket"])):
+            reader, writer = await asyncio.open_connection("127.0.0.1", front_port)
+            writer.write(head)
+            await writer.drain()
+            responses.append(await reader.read())
+            writer.close()
+        front.close()
+        server.close()
+
+        assert b"Connection: close\r\n" in seen[0] and b"keep-alive" not in seen[0]
+        assert b"Connection: close\r\n" in responses[0] and b"keep-alive" not in responses[0]
+        assert b"Connection: Upgrade\r\n" in seen[1]
+        assert b"Connection: close" not in responses[1]